@@ -1,51 +1,92 @@
+import asyncio
 import cv2
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List
-from cvd.utils.concurrency.thread_pool import run_camera_io
+from cvd.utils.concurrency.thread_pool import run_camera_io, run_file_io
+from cvd.utils.config_service import get_config_service
 from cvd.utils.log_service import warning
 
+V4L2_SYSFS_ROOT = Path("/sys/class/video4linux")
+
+
+UVC_PROPERTY_MAP: Dict[str, int] = {
+    "brightness": cv2.CAP_PROP_BRIGHTNESS,
+    "hue": cv2.CAP_PROP_HUE,
+    "contrast": cv2.CAP_PROP_CONTRAST,
+    "saturation": cv2.CAP_PROP_SATURATION,
+    "sharpness": cv2.CAP_PROP_SHARPNESS,
+    "gamma": cv2.CAP_PROP_GAMMA,
+    "gain": cv2.CAP_PROP_GAIN,
+    "backlight_compensation": cv2.CAP_PROP_BACKLIGHT,
+    "exposure_auto": cv2.CAP_PROP_AUTO_EXPOSURE,
+    "exposure": cv2.CAP_PROP_EXPOSURE,
+    "white_balance_auto": cv2.CAP_PROP_AUTO_WB,
+    "white_balance": cv2.CAP_PROP_WB_TEMPERATURE,
+}
+_UVC_BOOL_PROPERTIES = {"exposure_auto", "white_balance_auto"}
+
+
+@dataclass
+class UvcState:
+    """Settings applied to, and queued for, one capture handle.
+
+    Kept by the controller owning ``capture`` and replaced together with it,
+    so values remembered for a released handle never suppress writes to a
+    new one.
+    """
+
+    capture: Any
+    applied: Dict[str, float] = field(default_factory=dict)
+    pending: Dict[str, float] = field(default_factory=dict)
+    flushing: Optional[asyncio.Future] = None
+
+
+def _set_uvc_properties(
+    capture: cv2.VideoCapture, values: Dict[str, float]
+) -> Dict[str, str]:
+    """Apply ``values`` in one camera I/O job; return failures by name."""
+    failed = {}
+    for name, value in values.items():
+        try:
+            capture.set(UVC_PROPERTY_MAP[name], value)
+        except Exception as exc:
+            failed[name] = str(exc)
+    return failed
+
 
 async def apply_uvc_settings(
     capture: cv2.VideoCapture,
     settings: Dict[str, Any],
     *,
     controller_id: Optional[str] = None,
+    state: Optional[UvcState] = None,
 ) -> None:
-    """Apply UVC settings asynchronously using run_camera_io."""
+    """Apply UVC settings asynchronously using run_camera_io.
+
+    With the capture's :class:`UvcState`, only properties whose value differs
+    from what was last applied are sent, all in a single camera I/O call, and
+    calls arriving while a batch is in flight are merged and applied with
+    their latest values once it completes, so dragging a slider cannot flood
+    the camera pool.  Without it every given property is sent.
+    """
     if not capture or not settings:
         return
-    prop_map = {
-        "brightness": cv2.CAP_PROP_BRIGHTNESS,
-        "hue": cv2.CAP_PROP_HUE,
-        "contrast": cv2.CAP_PROP_CONTRAST,
-        "saturation": cv2.CAP_PROP_SATURATION,
-        "sharpness": cv2.CAP_PROP_SHARPNESS,
-        "gamma": cv2.CAP_PROP_GAMMA,
-        "gain": cv2.CAP_PROP_GAIN,
-        "backlight_compensation": cv2.CAP_PROP_BACKLIGHT,
-        "exposure_auto": cv2.CAP_PROP_AUTO_EXPOSURE,
-        "exposure": cv2.CAP_PROP_EXPOSURE,
-        "white_balance_auto": cv2.CAP_PROP_AUTO_WB,
-        "white_balance": cv2.CAP_PROP_WB_TEMPERATURE,
-    }
+    if state is None:
+        state = UvcState(capture)
     for name, value in settings.items():
+        if name not in UVC_PROPERTY_MAP:
+            continue
         try:
-            if name == "white_balance_auto":
-                await run_camera_io(
-                    capture.set, cv2.CAP_PROP_AUTO_WB, 1 if value else 0
-                )
-            elif name == "white_balance":
-                await run_camera_io(
-                    capture.set, cv2.CAP_PROP_WB_TEMPERATURE, float(value)
-                )
-            elif name == "exposure_auto":
-                await run_camera_io(
-                    capture.set, cv2.CAP_PROP_AUTO_EXPOSURE, 1 if value else 0
-                )
+            if name in _UVC_BOOL_PROPERTIES:
+                state.pending[name] = 1 if value else 0
             else:
-                prop = prop_map.get(name)
-                if prop is not None:
-                    await run_camera_io(capture.set, prop, float(value))
-        except Exception as exc:
+                state.pending[name] = float(value)
+        except (TypeError, ValueError) as exc:
             warning(
                 "Failed to apply settings property",
                 controller_id=controller_id,
@@ -53,6 +94,41 @@ async def apply_uvc_settings(
                 error=str(exc),
             )
 
+    if state.flushing is not None:
+        # the running flush picks up our values before it finishes
+        await asyncio.shield(state.flushing)
+        return
+
+    state.flushing = asyncio.get_running_loop().create_future()
+    try:
+        while state.pending:
+            batch = {
+                name: value
+                for name, value in state.pending.items()
+                if state.applied.get(name) != value
+            }
+            state.pending.clear()
+            if not batch:
+                continue
+            try:
+                failed = await run_camera_io(_set_uvc_properties, capture, batch)
+            except Exception as exc:
+                failed = {name: str(exc) for name in batch}
+            for name, value in batch.items():
+                if name in failed:
+                    state.applied.pop(name, None)
+                    warning(
+                        "Failed to apply settings property",
+                        controller_id=controller_id,
+                        property=name,
+                        error=failed[name],
+                    )
+                else:
+                    state.applied[name] = value
+    finally:
+        state.flushing.set_result(None)
+        state.flushing = None
+
 
 def rotate_frame(frame, rotation: int):
     """Rotate frame by multiples of 90 degrees."""
@@ -95,6 +171,7 @@ async def probe_camera_modes(
     device_index: int = 0,
     *,
     capture_backend: Optional[int] = None,
+    fallback: bool = True,
 ) -> List[Tuple[int, int, int]]:
     """Probe camera for supported (width, height, fps) combinations.
 
@@ -106,6 +183,8 @@ async def probe_camera_modes(
     Stops iterating fps values for a resolution once a working combination
     has been found to reduce the probing time.
 
+    With ``fallback`` disabled an empty list is returned when nothing could be
+    probed instead of the default 640x480@30 mode, so failures are not cached.
     """
     resolutions = [
         (320, 240),
@@ -134,7 +213,8 @@ async def probe_camera_modes(
         capture_backend=capture_backend,
     )
     if cap is None:
-        modes.append((640, 480, 30))
+        if fallback:
+            modes.append((640, 480, 30))
         return modes
 
     for w, h in resolutions:
@@ -165,7 +245,151 @@ async def probe_camera_modes(
             if found_for_resolution:
                 break
 
-    if not modes:
+    if not modes and fallback:
         modes.append((640, 480, 30))
     modes.sort()
     return modes
+
+
+def _read_sysfs(path: Path) -> Optional[str]:
+    try:
+        return path.read_text().strip() or None
+    except OSError:
+        return None
+
+
+def camera_identity(device_index: int, capture_backend: Optional[int] = None) -> str:
+    """Return a stable identity string for a camera.
+
+    On Linux the V4L2 card name and bus path (plus USB vendor/product/serial
+    when available) are read from sysfs without opening the device, so the
+    identity follows the physical camera rather than its ``/dev/video`` index.
+    Elsewhere the backend and index are used.
+    """
+    node = V4L2_SYSFS_ROOT / f"video{device_index}"
+    name = _read_sysfs(node / "name")
+    if name:
+        parts = [name]
+        try:
+            device = (node / "device").resolve(strict=True)
+        except OSError:
+            device = None
+        if device is not None:
+            parts.append(device.name)
+            usb = device.parent
+            for attr in ("idVendor", "idProduct", "serial"):
+                value = _read_sysfs(usb / attr)
+                if value:
+                    parts.append(value)
+        return "v4l2:" + ":".join(parts)
+    backend = "any" if capture_backend is None else str(capture_backend)
+    return f"backend{backend}:index{device_index}"
+
+
+@dataclass(frozen=True)
+class CameraDeviceInfo:
+    """Capture device discovered from sysfs metadata."""
+
+    index: int
+    name: str
+    path: str
+    bus: Optional[str] = None
+
+
+def enumerate_cameras() -> List[CameraDeviceInfo]:
+    """List V4L2 capture devices from sysfs without opening them.
+
+    Only the primary node of each device (sysfs ``index`` 0) is returned;
+    UVC cameras also expose metadata nodes which cannot deliver frames.
+    Returns an empty list where sysfs is unavailable so callers can fall
+    back to their own defaults.
+    """
+    try:
+        nodes = list(V4L2_SYSFS_ROOT.iterdir())
+    except OSError:
+        return []
+    devices = []
+    for node in nodes:
+        match = re.fullmatch(r"video(\d+)", node.name)
+        if not match:
+            continue
+        if (_read_sysfs(node / "index") or "0") != "0":
+            continue
+        try:
+            bus = (node / "device").resolve(strict=True).name
+        except OSError:
+            bus = None
+        index = int(match.group(1))
+        devices.append(
+            CameraDeviceInfo(
+                index=index,
+                name=_read_sysfs(node / "name") or node.name,
+                path=f"/dev/video{index}",
+                bus=bus,
+            )
+        )
+    devices.sort(key=lambda d: d.index)
+    return devices
+
+
+def default_camera_mode_cache_path() -> Optional[Path]:
+    """Location of the probe cache below the configured storage cache dir."""
+    service = get_config_service()
+    if service is None:
+        return None
+    storage_paths = service.get("data_storage.storage_paths", dict, {}) or {}
+    cache_dir = storage_paths.get(
+        "cache", str(Path(storage_paths.get("base", "data")) / "cache")
+    )
+    return Path(cache_dir) / "camera_modes.json"
+
+
+def _read_mode_cache(path: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+async def load_cached_camera_modes(
+    identity: str, cache_path: Optional[Path] = None
+) -> Optional[List[Tuple[int, int, int]]]:
+    """Return probe results cached for ``identity`` or ``None``."""
+    path = cache_path or default_camera_mode_cache_path()
+    if path is None:
+        return None
+    entry = (await run_file_io(_read_mode_cache, path)).get(identity)
+    if not isinstance(entry, dict) or not entry.get("modes"):
+        return None
+    try:
+        return [tuple(int(v) for v in mode) for mode in entry["modes"]]
+    except (TypeError, ValueError):
+        return None
+
+
+async def store_camera_modes(
+    identity: str,
+    modes: List[Tuple[int, int, int]],
+    cache_path: Optional[Path] = None,
+) -> None:
+    """Persist probe results for ``identity`` keeping other devices intact."""
+    path = cache_path or default_camera_mode_cache_path()
+    if path is None or not modes:
+        return
+
+    def _write() -> None:
+        data = _read_mode_cache(path)
+        data[identity] = {
+            "modes": [list(mode) for mode in modes],
+            "probed_at": time.time(),
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, indent=2))
+        os.replace(tmp, path)
+
+    try:
+        await run_file_io(_write)
+    except Exception as exc:
+        warning("Failed to store camera modes", path=str(path), error=str(exc))
@@ -2,13 +2,15 @@
 Base classes for the controller system following the ProcessingStage pattern.
 """
 
-from typing import Dict, List, Any, Optional, TypeVar, Generic
+from typing import Callable, Dict, List, Any, Optional, TypeVar, Generic
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from enum import Enum
 import time
 
 from cvd.utils.log_service import info, error
+from cvd.controllers.memory_budget import BudgetedCache, get_memory_budget_manager
+from cvd.utils.latency_histogram import WindowedLatencyHistogram
 
 T = TypeVar("T")
 
@@ -76,22 +78,49 @@ class ControllerConfig:
     input_sensors: List[str] = field(default_factory=list)
     input_controllers: List[str] = field(default_factory=list)
     output_name: Optional[str] = None
+    # "inline" runs on the manager's event loop, "process" in a worker process
+    isolation: str = "inline"
 
 
 class ControllerStage(ABC):
     """Base class for controller stages following ProcessingStage pattern"""
 
+    # sliding window of the processing latency percentiles
+    LATENCY_WINDOW_S = 60.0
+
+    # Pure controllers derive their output only from their controller inputs,
+    # so the manager may reuse the last result while no input version changed.
+    # Can be overridden per instance with the ``pure`` parameter.
+    pure: bool = False
+
+    # Scheduling: higher priorities run first within a stage.  A deadline is
+    # a budget in ms from the start of a processing pass; runs that cannot
+    # start within it are skipped and runs exceeding it are cancelled.  Both
+    # can be overridden per instance with the ``priority`` and ``deadline_ms``
+    # parameters.
+    priority: int = 0
+    deadline_ms: Optional[float] = None
+
     def __init__(self, controller_id: str, config: ControllerConfig):
         self.controller_id = controller_id
         self.config = config
         self.enabled = config.enabled
+        self.pure = bool(config.parameters.get("pure", type(self).pure))
+        self.priority = int(config.parameters.get("priority", type(self).priority))
+        deadline_ms = config.parameters.get("deadline_ms", type(self).deadline_ms)
+        self.deadline_ms = float(deadline_ms) if deadline_ms is not None else None
         self.controller_type = ControllerType.CUSTOM
         self.status = ControllerStatus.STOPPED
         self._processing_time = 0.0
+        self._latency = WindowedLatencyHistogram(self.LATENCY_WINDOW_S)
         self._error_count = 0
         self._last_result: Optional[ControllerResult] = None
-        self._output_cache: Dict[str, Any] = {}
+        self._output_cache: BudgetedCache = BudgetedCache(
+            f"{controller_id}.output_cache"
+        )
         self._start_time: Optional[float] = None
+        self._output_listeners: List[Callable[[str], None]] = []
+        self._output_version = 0
 
     @abstractmethod
     async def process(self, input_data: ControllerInput) -> ControllerResult:
@@ -105,10 +134,12 @@ class ControllerStage(ABC):
         if not self.enabled or self.status != ControllerStatus.RUNNING:
             return ControllerResult.success_result(None)
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             result = await self.process(input_data)
-            self._processing_time = (time.time() - start_time) * 1000  # Convert to ms
+            end_ns = time.perf_counter_ns()
+            self._latency.record(end_ns - start_ns, end_ns)
+            self._processing_time = (end_ns - start_ns) / 1e6
             result.processing_time_ms = self._processing_time
 
             if not result.success:
@@ -123,12 +154,15 @@ class ControllerStage(ABC):
                 # Cache successful results
                 if result.data is not None:
                     self._output_cache[self.controller_id] = result.data
+                    self._output_version += 1
 
             self._last_result = result
             return result
 
         except Exception as e:
-            self._processing_time = (time.time() - start_time) * 1000
+            end_ns = time.perf_counter_ns()
+            self._latency.record(end_ns - start_ns, end_ns)
+            self._processing_time = (end_ns - start_ns) / 1e6
             self._error_count += 1
             self.status = ControllerStatus.ERROR
             error_msg = f"Exception in controller {self.controller_id}: {e}"
@@ -216,6 +250,47 @@ class ControllerStage(ABC):
         """Get the latest output from this controller"""
         return self._output_cache.get(self.controller_id)
 
+    @property
+    def output_version(self) -> int:
+        """Counter increased whenever this controller produces new output."""
+        return self._output_version
+
+    def add_output_listener(self, listener: Callable[[str], None]) -> None:
+        """Call ``listener(controller_id)`` whenever new output is published."""
+        if listener not in self._output_listeners:
+            self._output_listeners.append(listener)
+
+    def remove_output_listener(self, listener: Callable[[str], None]) -> None:
+        if listener in self._output_listeners:
+            self._output_listeners.remove(listener)
+
+    def publish_output(self, data: Any) -> None:
+        """Store output produced outside :meth:`process` and notify listeners.
+
+        Controllers producing data on their own schedule (e.g. a capture
+        loop) use this so that dependent controllers run as soon as the new
+        output exists.
+        """
+        self._output_cache[self.controller_id] = data
+        self._output_version += 1
+        for listener in list(self._output_listeners):
+            try:
+                listener(self.controller_id)
+            except Exception as e:
+                error(
+                    "Output listener failed",
+                    controller_id=self.controller_id,
+                    error=str(e),
+                )
+
+    def get_latency_stats(self) -> Dict[str, Any]:
+        """Processing latency percentiles over :attr:`LATENCY_WINDOW_S`."""
+        return self._latency.snapshot(time.perf_counter_ns())
+
+    def reset_latency_stats(self) -> None:
+        """Forget recorded processing latencies."""
+        self._latency.reset()
+
     def get_stats(self) -> Dict[str, Any]:
         """Get controller statistics"""
         return {
@@ -230,6 +305,10 @@ class ControllerStage(ABC):
             ),
             "last_success": self._last_result.success if self._last_result else None,
             "has_output": self.controller_id in self._output_cache,
+            "output_version": self._output_version,
+            "memory_bytes": sum(
+                get_memory_budget_manager().get_usage(f"{self.controller_id}.").values()
+            ),
             "start_time": self._start_time,
             "uptime_s": (time.time() - self._start_time) if self._start_time else None,
         }
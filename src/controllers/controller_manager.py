@@ -3,9 +3,10 @@ Controller manager for orchestrating multiple controllers with dependency manage
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Mapping, Tuple
 from collections import deque
 from dataclasses import dataclass
+from types import MappingProxyType
 import time
 import json
 from pathlib import Path
@@ -27,8 +28,12 @@ from src.utils.config_service import (
     get_config_service,
     ConfigurationError,
 )
+from src.utils.latency_histogram import WindowedLatencyHistogram
 
 from .controller_registry import CONTROLLER_CLASS_MAP
+from .frame_trace import get_frame_tracer
+from .memory_budget import get_memory_budget_manager
+from .process_isolation import ISOLATION_MODES, ProcessIsolatedController
 
 
 @dataclass
@@ -40,6 +45,33 @@ class ControllerDependency:
     data_mapping: Optional[Dict[str, str]] = None  # Map output keys to input keys
 
 
+@dataclass(frozen=True)
+class ControllerInputSpec:
+    """Precomputed input wiring of one controller."""
+
+    # sensor IDs to pass on, ``None`` for all sensor data
+    sensors: Optional[Tuple[str, ...]]
+    # (source controller, ((output key, input key), ...) or None for all data)
+    sources: Tuple[Tuple[str, Optional[Tuple[Tuple[str, str], ...]]], ...]
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """Immutable snapshot of the controller graph used by every pass.
+
+    Compiled whenever controllers or dependencies change so that a pass only
+    performs direct lookups instead of rescanning the dependency list.
+    """
+
+    order: Tuple[str, ...]
+    stages: Tuple[Tuple[str, ...], ...]
+    dependents: Mapping[str, Tuple[str, ...]]
+    inputs: Mapping[str, ControllerInputSpec]
+
+
+_EMPTY_PLAN = ExecutionPlan((), (), MappingProxyType({}), MappingProxyType({}))
+
+
 class ControllerManager:
     """Manages multiple controllers with dependency resolution and execution orchestration"""
 
@@ -48,15 +80,32 @@ class ControllerManager:
         manager_id: str = "default",
         max_concurrency: Optional[int] = None,
         enable_parallel_execution: Optional[bool] = None,
+        start_timeout_s: Optional[float] = None,
+        stop_timeout_s: Optional[float] = None,
     ):
         self.manager_id = manager_id
         self._controllers: Dict[str, ControllerStage] = {}
         self._dependencies: List[ControllerDependency] = []
-        self._execution_order: List[str] = []
-        self._execution_stages: List[List[str]] = []
+        self._input_specs: Dict[str, ControllerInputSpec] = {}
+        self._plan: ExecutionPlan = _EMPTY_PLAN
         self._running = False
+        # reactive execution: controllers whose new output awaits processing
+        self._pending_outputs: set[str] = set()
+        self._outputs_published = asyncio.Event()
+        self._reactive_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reactive_passes = 0
+        self._reactive_notifications = 0
+        # pure controllers: input versions, own output version and result of
+        # their last run
+        self._memo: Dict[str, Tuple[Tuple[int, ...], int, ControllerResult]] = {}
+        self._skip_counts: Dict[str, int] = {}
+        # runs skipped, cancelled or finished late because their deadline passed
+        self._deadline_misses: Dict[str, Dict[str, int]] = {}
         self._processing_stats: Dict[str, Any] = {}
+        self._cycle_latency = WindowedLatencyHistogram(ControllerStage.LATENCY_WINDOW_S)
         self._error_handlers: Dict[str, Callable[..., Any]] = {}
+        # per controller: start_ms/stop_ms and whether they timed out
+        self._lifecycle_stats: Dict[str, Dict[str, Any]] = {}
 
         # Concurrency control
         self._controller_locks: Dict[str, asyncio.Lock] = {}
@@ -84,6 +133,19 @@ class ControllerManager:
             par = str(env).lower() in {"1", "true", "yes"} if env is not None else False
         self._parallel_execution = bool(par)
 
+        # Per-controller start/stop timeouts
+        service = get_config_service()
+        if start_timeout_s is None and service is not None:
+            start_timeout_s = service.get(
+                "controller_manager.start_timeout_s", (int, float), None
+            )
+        if stop_timeout_s is None and service is not None:
+            stop_timeout_s = service.get(
+                "controller_manager.stop_timeout_s", (int, float), None
+            )
+        self._start_timeout_s = float(start_timeout_s or 30.0)
+        self._stop_timeout_s = float(stop_timeout_s or 10.0)
+
     def register_controller(self, controller: ControllerStage) -> None:
         """Register a controller with the manager"""
         if controller.controller_id in self._controllers:
@@ -93,9 +155,13 @@ class ControllerManager:
 
         self._controllers[controller.controller_id] = controller
         self._controller_locks[controller.controller_id] = asyncio.Lock()
+        controller.add_output_listener(self._on_controller_output)
 
-        # Recalculate execution order
-        self._calculate_execution_order()
+        # Recompile the plan
+        self._input_specs[controller.controller_id] = self._compile_inputs(
+            controller.controller_id
+        )
+        self._compile_plan()
 
         info(
             "Controller registered",
@@ -121,12 +187,17 @@ class ControllerManager:
                 input_sensors=config.get("input_sensors", []),
                 input_controllers=config.get("input_controllers", []),
                 output_name=config.get("output_name"),
+                isolation=config.get("isolation", "inline"),
             )
 
             ctrl_cls = CONTROLLER_CLASS_MAP.get(controller_type)
             if ctrl_cls is None:
                 raise ValueError(f"Unknown controller type: {controller_type}")
+            if cfg.isolation not in ISOLATION_MODES:
+                raise ValueError(f"Unknown isolation mode: {cfg.isolation}")
 
+            if cfg.isolation == "process":
+                return ProcessIsolatedController(controller_id, cfg, ctrl_cls)
             return ctrl_cls(controller_id, cfg)
 
         except Exception as exc:
@@ -157,6 +228,11 @@ class ControllerManager:
             return False
 
         # Remove dependencies
+        affected = {
+            dep.target_controller_id
+            for dep in self._dependencies
+            if dep.source_controller_id == controller_id
+        }
         self._dependencies = [
             dep
             for dep in self._dependencies
@@ -165,11 +241,21 @@ class ControllerManager:
         ]
 
         # Remove controller
+        self._controllers[controller_id].remove_output_listener(
+            self._on_controller_output
+        )
         del self._controllers[controller_id]
+        self._pending_outputs.discard(controller_id)
+        self._memo.pop(controller_id, None)
+        self._deadline_misses.pop(controller_id, None)
+        self._lifecycle_stats.pop(controller_id, None)
         del self._controller_locks[controller_id]
 
-        # Recalculate execution order
-        self._calculate_execution_order()
+        # Recompile the plan
+        del self._input_specs[controller_id]
+        for target_id in affected - {controller_id}:
+            self._input_specs[target_id] = self._compile_inputs(target_id)
+        self._compile_plan()
 
         info(
             "Controller unregistered",
@@ -192,8 +278,15 @@ class ControllerManager:
         dependency = ControllerDependency(source_id, target_id, data_mapping)
         self._dependencies.append(dependency)
 
-        # Recalculate execution order
-        self._calculate_execution_order()
+        # Recompile the plan; only the target's inputs changed
+        previous = self._input_specs[target_id]
+        self._input_specs[target_id] = self._compile_inputs(target_id)
+        try:
+            self._compile_plan()
+        except ValueError:
+            self._dependencies.remove(dependency)
+            self._input_specs[target_id] = previous
+            raise
 
         info(
             "Dependency added",
@@ -201,8 +294,30 @@ class ControllerManager:
             target_controller=target_id,
         )
 
-    def _calculate_execution_order(self) -> None:
-        """Calculate execution order using topological sort"""
+    def _compile_inputs(self, controller_id: str) -> ControllerInputSpec:
+        """Resolve which sensors and controller outputs feed ``controller_id``."""
+        config = self._controllers[controller_id].config
+        allowed = set(config.input_controllers)
+        sources = tuple(
+            (
+                dep.source_controller_id,
+                tuple(dep.data_mapping.items()) if dep.data_mapping else None,
+            )
+            for dep in self._dependencies
+            if dep.target_controller_id == controller_id
+            and (not allowed or dep.source_controller_id in allowed)
+        )
+        sensors = tuple(config.input_sensors) if config.input_sensors else None
+        return ControllerInputSpec(sensors, sources)
+
+    def _compile_plan(self) -> None:
+        """Build a new :class:`ExecutionPlan` from the registered graph.
+
+        Input specs are maintained per controller by the callers, so only the
+        controllers whose wiring changed are recompiled; the topological
+        order is rebuilt in O(controllers + dependencies).  Within a stage
+        controllers are ordered by descending priority.
+        """
         # Build adjacency list
         graph: Dict[str, List[str]] = {cid: [] for cid in self._controllers.keys()}
         in_degree: Dict[str, int] = {cid: 0 for cid in self._controllers.keys()}
@@ -214,11 +329,13 @@ class ControllerManager:
         # Topological sort + stage building
         queue = deque(cid for cid, degree in in_degree.items() if degree == 0)
         execution_order: List[str] = []
-        stages: List[List[str]] = []
+        stages: List[Tuple[str, ...]] = []
 
         while queue:
-            stage: List[str] = list(queue)
-            stages.append(stage)
+            queue = deque(
+                sorted(queue, key=lambda cid: -self._controllers[cid].priority)
+            )
+            stages.append(tuple(queue))
             next_queue: deque[str] = deque()
             while queue:
                 current = queue.popleft()
@@ -236,28 +353,51 @@ class ControllerManager:
                 f"Circular dependency detected involving controllers: {remaining}"
             )
 
-        self._execution_order = execution_order
-        self._execution_stages = stages
+        self._plan = ExecutionPlan(
+            order=tuple(execution_order),
+            stages=tuple(stages),
+            dependents=MappingProxyType(
+                {cid: tuple(targets) for cid, targets in graph.items()}
+            ),
+            inputs=MappingProxyType(dict(self._input_specs)),
+        )
         debug(
-            "Execution order updated",
+            "Execution plan compiled",
             manager_id=self.manager_id,
-            order=self._execution_order,
-            stages=self._execution_stages,
+            order=execution_order,
+            stages=stages,
         )
 
+    def refresh_plan(self) -> None:
+        """Recompile the plan after changing controller configs in place.
+
+        Input filters (``input_sensors``/``input_controllers``) and controller
+        priorities are captured when the plan is compiled.
+        """
+        self._input_specs = {
+            cid: self._compile_inputs(cid) for cid in self._controllers
+        }
+        self._compile_plan()
+
+    @property
+    def execution_plan(self) -> ExecutionPlan:
+        return self._plan
+
     async def start_all_controllers(self) -> bool:
-        """Start all registered controllers"""
+        """Start all registered controllers.
+
+        Controllers of one execution stage start concurrently; a stage starts
+        once its sources have finished starting.  Each start is bounded by
+        ``controller_manager.start_timeout_s``.
+        """
+        start = time.perf_counter()
         success_count = 0
 
-        for controller_id in self._controllers:
-            controller = self._controllers[controller_id]
-            if await controller.start():
-                success_count += 1
-            else:
-                error(
-                    "Failed to start controller",
-                    controller_id=controller_id,
-                )
+        for stage in self._plan.stages:
+            started = await asyncio.gather(
+                *(self._start_controller(cid) for cid in stage)
+            )
+            success_count += sum(started)
 
         self._running = success_count > 0
         info(
@@ -265,23 +405,86 @@ class ControllerManager:
             manager_id=self.manager_id,
             started=success_count,
             total=len(self._controllers),
+            duration_ms=(time.perf_counter() - start) * 1000,
         )
         return success_count == len(self._controllers)
 
+    async def _start_controller(self, controller_id: str) -> bool:
+        controller = self._controllers[controller_id]
+        stats = self._lifecycle_stats.setdefault(controller_id, {})
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            ok = await asyncio.wait_for(controller.start(), self._start_timeout_s)
+        except asyncio.TimeoutError:
+            timed_out, ok = True, False
+            controller.status = ControllerStatus.ERROR
+        except Exception as e:
+            ok = False
+            controller.status = ControllerStatus.ERROR
+            error(
+                "Error starting controller",
+                controller_id=controller_id,
+                error=str(e),
+            )
+        stats["start_ms"] = (time.perf_counter() - start) * 1000
+        stats["start_timed_out"] = timed_out
+        if not ok:
+            error(
+                "Failed to start controller",
+                controller_id=controller_id,
+                timed_out=timed_out,
+            )
+        return ok
+
     async def stop_all_controllers(self) -> None:
-        """Stop all controllers"""
+        """Stop all controllers.
+
+        Stages are stopped in reverse order so that dependents stop before the
+        controllers feeding them; controllers within a stage stop concurrently,
+        each bounded by ``controller_manager.stop_timeout_s``.
+        """
         self._running = False
+        start = time.perf_counter()
 
-        tasks = []
-        for controller in self._controllers.values():
-            tasks.append(controller.stop())
+        for stage in reversed(self._plan.stages):
+            await asyncio.gather(*(self._stop_controller(cid) for cid in stage))
 
-        await asyncio.gather(*tasks, return_exceptions=True)
         info(
             "All controllers stopped",
             manager_id=self.manager_id,
+            duration_ms=(time.perf_counter() - start) * 1000,
         )
 
+    async def _stop_controller(self, controller_id: str) -> None:
+        controller = self._controllers[controller_id]
+        stats = self._lifecycle_stats.setdefault(controller_id, {})
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            await asyncio.wait_for(controller.stop(), self._stop_timeout_s)
+        except asyncio.TimeoutError:
+            timed_out = True
+            error(
+                "Timed out stopping controller",
+                controller_id=controller_id,
+                timeout_s=self._stop_timeout_s,
+            )
+        except Exception as e:
+            error(
+                "Error stopping controller",
+                controller_id=controller_id,
+                error=str(e),
+            )
+        stats["stop_ms"] = (time.perf_counter() - start) * 1000
+        stats["stop_timed_out"] = timed_out
+
+    def get_lifecycle_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Duration in ms of the last start and stop of every controller."""
+        return {
+            cid: dict(self._lifecycle_stats.get(cid, {})) for cid in self._controllers
+        }
+
     async def process_data(
         self,
         sensor_data: Dict[str, Any],
@@ -291,37 +494,54 @@ class ControllerManager:
         if not self._running:
             return {}
 
-        metadata = metadata or {}
-        controller_outputs: Dict[str, Any] = {}
+        return await self._execute_stages(
+            self._plan.stages, sensor_data, metadata or {}
+        )
+
+    async def _execute_stages(
+        self,
+        stages: Tuple[Tuple[str, ...], ...],
+        sensor_data: Dict[str, Any],
+        metadata: Dict[str, Any],
+        controller_outputs: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, ControllerResult]:
+        """Run ``stages`` (a topologically ordered subset of the graph).
+
+        ``controller_outputs`` seeds the outputs of controllers outside
+        ``stages`` that the scheduled ones depend on.
+        """
+        controller_outputs = dict(controller_outputs or {})
         results: Dict[str, ControllerResult] = {}
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             if not self._parallel_execution:
                 async with self._execution_semaphore:
-                    for controller_id in self._execution_order:
+                    for controller_id in (cid for stage in stages for cid in stage):
                         controller = self._controllers[controller_id]
 
                         if controller.status != ControllerStatus.RUNNING:
+                            self._memo.pop(controller_id, None)
                             continue
 
-                        input_data = self._prepare_controller_input(
-                            controller_id, sensor_data, controller_outputs, metadata
+                        await self._process_controller(
+                            controller_id,
+                            sensor_data,
+                            metadata,
+                            controller_outputs,
+                            results,
+                            start_ns,
                         )
-
-                        async with self._controller_locks[controller_id]:
-                            result = await controller.process_with_timing(input_data)
-                        results[controller_id] = result
-
-                        if result.success and result.data is not None:
-                            controller_outputs[controller_id] = result.data
             else:
-                for stage in self._execution_stages:
+                for stage in stages:
+                    # stages are sorted by priority and the semaphore admits
+                    # waiters in order, so important controllers start first
                     async with asyncio.TaskGroup() as tg:
                         for controller_id in stage:
                             controller = self._controllers[controller_id]
                             if controller.status != ControllerStatus.RUNNING:
+                                self._memo.pop(controller_id, None)
                                 continue
 
                             tg.create_task(
@@ -331,6 +551,7 @@ class ControllerManager:
                                     metadata,
                                     controller_outputs,
                                     results,
+                                    start_ns,
                                 )
                             )
 
@@ -342,11 +563,102 @@ class ControllerManager:
             )
 
         # Update statistics
-        processing_time = (time.time() - start_time) * 1000
-        self._update_processing_stats(processing_time, results)
+        end_ns = time.perf_counter_ns()
+        self._cycle_latency.record(end_ns - start_ns, end_ns)
+        self._update_processing_stats((end_ns - start_ns) / 1e6, results)
 
         return results
 
+    # ------------------------------------------------------------------
+    # Reactive execution
+
+    def _on_controller_output(self, controller_id: str) -> None:
+        """Output listener registered on every controller."""
+        loop = self._reactive_loop
+        if loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._mark_output(controller_id)
+        else:
+            loop.call_soon_threadsafe(self._mark_output, controller_id)
+
+    def _mark_output(self, controller_id: str) -> None:
+        if controller_id not in self._controllers:
+            return
+        self._reactive_notifications += 1
+        self._pending_outputs.add(controller_id)
+        self._outputs_published.set()
+
+    def notify_output(self, controller_id: str) -> None:
+        """Schedule the dependents of ``controller_id`` as if it had published."""
+        self._on_controller_output(controller_id)
+
+    def _affected_stages(self, sources: set[str]) -> Tuple[Tuple[str, ...], ...]:
+        """Return ``sources`` and everything downstream, in execution stages."""
+        plan = self._plan
+        affected = set(sources)
+        stack = list(sources)
+        while stack:
+            for dependent in plan.dependents.get(stack.pop(), ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    stack.append(dependent)
+        stages = (
+            tuple(cid for cid in stage if cid in affected) for stage in plan.stages
+        )
+        return tuple(stage for stage in stages if stage)
+
+    def _upstream_outputs(self, stages: Tuple[Tuple[str, ...], ...]) -> Dict[str, Any]:
+        """Latest outputs of unscheduled controllers feeding ``stages``."""
+        scheduled = {cid for stage in stages for cid in stage}
+        outputs: Dict[str, Any] = {}
+        for controller_id in scheduled:
+            for source, _ in self._plan.inputs[controller_id].sources:
+                if source not in scheduled and source not in outputs:
+                    output = self._controllers[source].get_output()
+                    if output is not None:
+                        outputs[source] = output
+        return outputs
+
+    async def run_reactive(self) -> None:
+        """Process the graph whenever a controller publishes new output.
+
+        Each pass runs the publishing controllers, so their results reach
+        dependents exactly as in :meth:`process_data`, followed by all of their
+        transitive dependents in topological order.  Outputs published while
+        a pass is running are coalesced into the next pass.  Nothing runs
+        while no controller publishes.  Runs until cancelled.
+        """
+        self._reactive_loop = asyncio.get_running_loop()
+        try:
+            while True:
+                await self._outputs_published.wait()
+                self._outputs_published.clear()
+                sources, self._pending_outputs = self._pending_outputs, set()
+                if not self._running or not sources:
+                    continue
+                self._reactive_passes += 1
+                stages = self._affected_stages(sources)
+                try:
+                    await self._execute_stages(
+                        stages,
+                        {},
+                        {"trigger": sorted(sources)},
+                        self._upstream_outputs(stages),
+                    )
+                except Exception as e:
+                    error(
+                        "Error in reactive controller processing",
+                        manager_id=self.manager_id,
+                        error=str(e),
+                    )
+        finally:
+            self._reactive_loop = None
+
     def _prepare_controller_input(
         self,
         controller_id: str,
@@ -354,48 +666,34 @@ class ControllerManager:
         controller_outputs: Dict[str, Any],
         metadata: Dict[str, Any],
     ) -> ControllerInput:
-        """Prepare input data for a specific controller"""
-        controller = self._controllers[controller_id]
-        config = controller.config
+        """Prepare input data for a specific controller from the plan"""
+        spec = self._plan.inputs[controller_id]
 
         # Filter sensor data based on controller configuration
-        filtered_sensor_data = {}
-        if config.input_sensors:
-            for sensor_id in config.input_sensors:
-                if sensor_id in sensor_data:
-                    filtered_sensor_data[sensor_id] = sensor_data[sensor_id]
-        else:
-            # Include all sensor data if no specific sensors configured
+        if spec.sensors is None:
             filtered_sensor_data = sensor_data
-
-        # Prepare controller data from dependencies
-        controller_data = {}
-        for dep in self._dependencies:
-            if (
-                dep.target_controller_id == controller_id
-                and dep.source_controller_id in controller_outputs
-            ):
-                source_data = controller_outputs[dep.source_controller_id]
-
-                if dep.data_mapping:
-                    # Apply data mapping
-                    mapped_data = {}
-                    for source_key, target_key in dep.data_mapping.items():
-                        if source_key in source_data:
-                            mapped_data[target_key] = source_data[source_key]
-                    controller_data[dep.source_controller_id] = mapped_data
-                else:
-                    # Use all data
-                    controller_data[dep.source_controller_id] = source_data
-
-        # Filter controller data by input_controllers if specified
-        if config.input_controllers:
-            controller_data = {
-                cid: data
-                for cid, data in controller_data.items()
-                if cid in config.input_controllers
+        else:
+            filtered_sensor_data = {
+                sensor_id: sensor_data[sensor_id]
+                for sensor_id in spec.sensors
+                if sensor_id in sensor_data
             }
 
+        # Collect controller data from dependencies
+        controller_data: Dict[str, Any] = {}
+        for source_id, mapping in spec.sources:
+            source_data = controller_outputs.get(source_id)
+            if source_data is None:
+                continue
+            if mapping:
+                controller_data[source_id] = {
+                    target_key: source_data[source_key]
+                    for source_key, target_key in mapping
+                    if source_key in source_data
+                }
+            else:
+                controller_data[source_id] = source_data
+
         return ControllerInput(
             sensor_data=filtered_sensor_data,
             controller_data=controller_data,
@@ -410,22 +708,127 @@ class ControllerManager:
         metadata: Dict[str, Any],
         controller_outputs: Dict[str, Any],
         results: Dict[str, ControllerResult],
+        pass_start_ns: int,
     ) -> None:
         """Execute a single controller respecting locks and concurrency limits."""
+        async with self._execution_semaphore:
+            await self._process_controller(
+                controller_id,
+                sensor_data,
+                metadata,
+                controller_outputs,
+                results,
+                pass_start_ns,
+            )
+
+    async def _process_controller(
+        self,
+        controller_id: str,
+        sensor_data: Dict[str, Any],
+        metadata: Dict[str, Any],
+        controller_outputs: Dict[str, Any],
+        results: Dict[str, ControllerResult],
+        pass_start_ns: int,
+    ) -> None:
+        """Run one controller, reusing the last result of unchanged pure ones.
+
+        Low-priority controllers (``priority <= 0``) with a ``deadline_ms``
+        are skipped when the pass has already used up their budget and
+        cancelled when they exceed it; higher priorities always run to
+        completion and only record the miss.
+        """
+        controller = self._controllers[controller_id]
         input_data = self._prepare_controller_input(
             controller_id, sensor_data, controller_outputs, metadata
         )
 
-        async with self._execution_semaphore:
-            async with self._controller_locks[controller_id]:
-                result = await self._controllers[controller_id].process_with_timing(
-                    input_data
+        key = self._memo_key(controller, input_data)
+        memo = self._memo.get(controller_id)
+        if (
+            key is not None
+            and memo is not None
+            and memo[0] == key
+            # output published outside process() since the last run
+            and memo[1] == controller.output_version
+        ):
+            result = memo[2]
+            self._skip_counts[controller_id] = (
+                self._skip_counts.get(controller_id, 0) + 1
+            )
+        else:
+            timeout = None
+            deadline_ms = controller.deadline_ms
+            cancellable = deadline_ms is not None and controller.priority <= 0
+            if cancellable:
+                elapsed_ms = (time.perf_counter_ns() - pass_start_ns) / 1e6
+                timeout = (deadline_ms - elapsed_ms) / 1000
+                if timeout <= 0:
+                    self._record_deadline_miss(controller_id, "skipped")
+                    return
+            try:
+                result = await asyncio.wait_for(
+                    self._locked_process(controller_id, input_data), timeout
                 )
+            except asyncio.TimeoutError:
+                self._record_deadline_miss(controller_id, "cancelled")
+                result = ControllerResult.error_result(
+                    f"Deadline of {controller.deadline_ms:g} ms exceeded"
+                )
+            if (
+                deadline_ms is not None
+                and not cancellable
+                and (time.perf_counter_ns() - pass_start_ns) / 1e6 > deadline_ms
+            ):
+                self._record_deadline_miss(controller_id, "late")
+            if key is not None and result.success:
+                self._memo[controller_id] = (key, controller.output_version, result)
+            else:
+                self._memo.pop(controller_id, None)
 
         results[controller_id] = result
         if result.success and result.data is not None:
             controller_outputs[controller_id] = result.data
 
+    async def _locked_process(
+        self, controller_id: str, input_data: ControllerInput
+    ) -> ControllerResult:
+        async with self._controller_locks[controller_id]:
+            return await self._controllers[controller_id].process_with_timing(
+                input_data
+            )
+
+    def _record_deadline_miss(self, controller_id: str, kind: str) -> None:
+        misses = self._deadline_misses.setdefault(
+            controller_id, {"skipped": 0, "cancelled": 0, "late": 0}
+        )
+        misses[kind] += 1
+        debug(
+            "Controller missed its deadline",
+            controller_id=controller_id,
+            action=kind,
+        )
+
+    def _memo_key(
+        self, controller: ControllerStage, input_data: ControllerInput
+    ) -> Optional[Tuple[int, ...]]:
+        """Versions of the outputs feeding a pure controller.
+
+        ``None`` when the controller is not pure, receives sensor data, which
+        carries no version, or is disabled.  The latter drops the memo so a
+        disabled controller is not answered from it.
+        """
+        if not controller.pure or input_data.sensor_data or not controller.enabled:
+            return None
+        controller_data = input_data.controller_data
+        return tuple(
+            (
+                self._controllers[source].output_version
+                if source in controller_data
+                else -1
+            )
+            for source, _ in self._plan.inputs[controller.controller_id].sources
+        )
+
     def _update_processing_stats(
         self, total_time_ms: float, results: Dict[str, ControllerResult]
     ) -> None:
@@ -453,7 +856,7 @@ class ControllerManager:
             "manager_id": self.manager_id,
             "running": self._running,
             "total_controllers": len(self._controllers),
-            "execution_order": self._execution_order,
+            "execution_order": list(self._plan.order),
             "dependencies": [
                 {
                     "source": dep.source_controller_id,
@@ -463,9 +866,87 @@ class ControllerManager:
                 for dep in self._dependencies
             ],
             "processing_stats": self._processing_stats,
+            "lifecycle": self.get_lifecycle_stats(),
             "controller_stats": controller_stats,
+            "memory_budget": get_memory_budget_manager().get_stats(),
+            "cameras": self.get_camera_stats(),
+        }
+
+    def get_processing_stats(self) -> Dict[str, Any]:
+        """Latency percentiles of whole processing cycles and per controller.
+
+        Each entry reports count, mean, p50/p95/p99 and max in milliseconds
+        over the controllers' sliding latency window; controller entries also
+        count the runs of pure controllers skipped because no input changed
+        and the runs skipped, cancelled or (for higher priorities) finished
+        late because their deadline had passed.
+        """
+        return {
+            "cycle": self._cycle_latency.snapshot(time.perf_counter_ns()),
+            "reactive": {
+                "passes": self._reactive_passes,
+                "notifications": self._reactive_notifications,
+            },
+            "controllers": {
+                controller_id: {
+                    **controller.get_latency_stats(),
+                    "skipped": self._skip_counts.get(controller_id, 0),
+                    "priority": controller.priority,
+                    "deadline_ms": controller.deadline_ms,
+                    "deadline_misses": dict(
+                        self._deadline_misses.get(
+                            controller_id, {"skipped": 0, "cancelled": 0, "late": 0}
+                        )
+                    ),
+                }
+                for controller_id, controller in self._controllers.items()
+            },
         }
 
+    def reset_processing_stats(self, controller_id: Optional[str] = None) -> None:
+        """Reset latency histograms of one controller or of the whole graph."""
+        if controller_id is not None:
+            controller = self._controllers.get(controller_id)
+            if controller is not None:
+                controller.reset_latency_stats()
+            self._skip_counts.pop(controller_id, None)
+            self._deadline_misses.pop(controller_id, None)
+            return
+        self._cycle_latency.reset()
+        self._skip_counts.clear()
+        self._deadline_misses.clear()
+        for controller in self._controllers.values():
+            controller.reset_latency_stats()
+
+    def get_camera_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-camera capture, analysis and frame latency figures.
+
+        Controllers sharing a camera are grouped under its I/O key; the
+        capture figures come from whichever controller reads the device.
+        """
+        cameras: Dict[str, Dict[str, Any]] = {}
+        for controller_id, controller in self._controllers.items():
+            get_capture_stats = getattr(controller, "get_capture_stats", None)
+            if get_capture_stats is None:
+                continue
+            capture = get_capture_stats()
+            entry = cameras.setdefault(
+                capture["camera"], {"controllers": [], "capture": None}
+            )
+            entry["controllers"].append(controller_id)
+            if capture["frames"] and (
+                entry["capture"] is None
+                or capture["frames"] > entry["capture"]["frames"]
+            ):
+                entry["capture"] = capture
+            get_analysis_stats = getattr(controller, "get_analysis_stats", None)
+            if get_analysis_stats is not None:
+                entry.setdefault("analysis", {})[controller_id] = get_analysis_stats()
+        tracer = get_frame_tracer()
+        for camera, entry in cameras.items():
+            entry["latency"] = tracer.get_stats(camera)
+        return cameras
+
     def get_controller_outputs(self) -> Dict[str, Any]:
         """Get latest outputs from all controllers"""
         outputs = {}
@@ -489,6 +970,7 @@ class ControllerManager:
             return False
 
         controller = self._controllers[controller_id]
+        self._memo.pop(controller_id, None)
 
         try:
             await controller.stop()
@@ -518,6 +1000,7 @@ class ControllerManager:
                             "input_sensors": controller.config.input_sensors,
                             "input_controllers": controller.config.input_controllers,
                             "output_name": controller.config.output_name,
+                            "isolation": controller.config.isolation,
                         },
                     }
                     for cid, controller in self._controllers.items()
@@ -586,6 +1069,7 @@ def create_cvd_controller_manager() -> ControllerManager:
                 "motion_detection",
                 data_mapping={"frame": "image"},
             )
+        _add_webcam_pipelines(manager, service)
     else:
         # No configuration service found: create a minimal pipeline with
         # ``camera_capture`` feeding ``motion_detection`` so the application
@@ -618,6 +1102,39 @@ def create_cvd_controller_manager() -> ControllerManager:
     return manager
 
 
+def _add_webcam_pipelines(manager: ControllerManager, service: Any) -> None:
+    """Create a motion detection pipeline for every unclaimed webcam.
+
+    Webcams already referenced through a controller's ``cam_id`` or device
+    index keep their configured controllers.  Each remaining ``webcams``
+    entry gets a ``motion_detection_<cam_id>`` controller which captures on
+    its own camera I/O thread and analyses the frames, subject to the global
+    analysis cap.
+    """
+    claimed = {
+        getattr(ctrl, "webcam_id", None) or ctrl.config.parameters.get("cam_id")
+        for ctrl in manager._controllers.values()
+    }
+    claimed_devices = {
+        getattr(ctrl, "device_index", None) for ctrl in manager._controllers.values()
+    }
+    motion_cls = CONTROLLER_CLASS_MAP.get("motion_detection")
+    if motion_cls is None:
+        return
+    for cam_id, cam_cfg in service.get_webcam_configs():
+        if cam_id in claimed or cam_cfg.get("device_index") in claimed_devices:
+            continue
+        controller_id = f"motion_detection_{cam_id}"
+        if controller_id in manager._controllers:
+            continue
+        cfg = ControllerConfig(
+            controller_id=controller_id,
+            controller_type="motion_detection",
+            parameters={"cam_id": cam_id},
+        )
+        manager.register_controller(motion_cls(controller_id, cfg))
+
+
 def create_test_controller_manager() -> ControllerManager:
     """Create a simple controller manager for testing"""
     return ControllerManager("test")
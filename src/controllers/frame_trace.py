@@ -0,0 +1,113 @@
+"""
+End-to-end latency tracing of camera frames.
+
+Every frame read by a capture loop gets a :class:`FrameTrace` holding its
+sequence number and the monotonic time the read returned.  Stages along the
+way (rotation, motion analysis, process pool round trip, stream encoding and
+the socket write) record their durations against the trace, and the tracer
+keeps one histogram per camera and stage.
+
+Stage names ending in ``_wait`` measure the age of the frame when a consumer
+picked it up, i.e. queueing; the others measure compute.  ``*_total`` stages
+span from capture to the end of a consumer.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from cvd.utils.latency_histogram import LatencyHistogram
+
+
+class FrameTrace:
+    """Capture timestamp and sequence number travelling with one frame."""
+
+    __slots__ = ("tracer", "camera", "seq", "captured_ns")
+
+    def __init__(
+        self, tracer: "FrameTracer", camera: str, seq: int, captured_ns: int
+    ) -> None:
+        self.tracer = tracer
+        self.camera = camera
+        self.seq = seq
+        self.captured_ns = captured_ns
+
+    def span(self, stage: str, start_ns: int, end_ns: Optional[int] = None) -> int:
+        """Record ``stage`` as running from ``start_ns`` until ``end_ns``/now."""
+        end_ns = time.monotonic_ns() if end_ns is None else end_ns
+        latency = end_ns - start_ns
+        self.tracer.record(self.camera, stage, latency)
+        return latency
+
+    def since_capture(self, stage: str, now_ns: Optional[int] = None) -> int:
+        """Record the age of the frame at ``stage``."""
+        return self.span(stage, self.captured_ns, now_ns)
+
+    def as_metadata(self) -> Dict[str, Any]:
+        return {"frame_seq": self.seq, "capture_ns": self.captured_ns}
+
+
+class FrameTracer:
+    """Per-camera, per-stage latency histograms fed by :class:`FrameTrace`."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._seq: Dict[str, int] = {}
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+
+    def begin(self, camera: str, captured_ns: Optional[int] = None) -> FrameTrace:
+        """Stamp a freshly read frame of ``camera``."""
+        captured_ns = time.monotonic_ns() if captured_ns is None else captured_ns
+        with self._lock:
+            seq = self._seq.get(camera, 0) + 1
+            self._seq[camera] = seq
+        return FrameTrace(self, camera, seq, captured_ns)
+
+    def record(self, camera: str, stage: str, latency_ns: int) -> None:
+        histogram = self._histograms.get((camera, stage))
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(
+                    (camera, stage), LatencyHistogram()
+                )
+        histogram.record(latency_ns)
+
+    def get_stats(self, camera: Optional[str] = None) -> Dict[str, Any]:
+        """Return ``{camera: {stage: summary}}`` or the stages of ``camera``."""
+        with self._lock:
+            items = list(self._histograms.items())
+            frames = dict(self._seq)
+        stats: Dict[str, Dict[str, Any]] = {}
+        for (cam, stage), histogram in sorted(items):
+            if camera is not None and cam != camera:
+                continue
+            entry = stats.setdefault(cam, {"frames": frames.get(cam, 0)})
+            entry[stage] = histogram.snapshot()
+        if camera is not None:
+            return stats.get(camera, {"frames": frames.get(camera, 0)})
+        return stats
+
+    def reset(self, camera: Optional[str] = None) -> None:
+        with self._lock:
+            for (cam, _), histogram in self._histograms.items():
+                if camera is None or cam == camera:
+                    histogram.reset()
+
+
+_global_tracer: FrameTracer | None = None
+_tracer_lock = threading.Lock()
+
+
+def get_frame_tracer() -> FrameTracer:
+    """Return the global :class:`FrameTracer`."""
+    global _global_tracer
+    if _global_tracer is None:
+        with _tracer_lock:
+            if _global_tracer is None:
+                _global_tracer = FrameTracer()
+    return _global_tracer
+
+
+__all__ = ["FrameTrace", "FrameTracer", "get_frame_tracer"]
@@ -0,0 +1,409 @@
+"""
+Global memory budget for controller caches holding image data.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+import cv2
+import numpy as np
+
+from cvd.utils.config_service import get_config_service
+from cvd.utils.log_service import debug
+
+EVICTION_POLICIES = ("evict", "compress")
+
+
+@dataclass(frozen=True)
+class CompressedFrame:
+    """JPEG encoded replacement for an image evicted from memory."""
+
+    data: bytes
+    shape: Tuple[int, ...]
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data)
+
+    def decode(self) -> Optional[np.ndarray]:
+        flags = cv2.IMREAD_GRAYSCALE if len(self.shape) == 2 else cv2.IMREAD_COLOR
+        return cv2.imdecode(np.frombuffer(self.data, np.uint8), flags)
+
+
+def estimate_nbytes(value: Any) -> int:
+    """Return the bytes held by image arrays in ``value``.
+
+    Only ``value`` itself or arrays directly inside a plain dict, list or
+    tuple are counted (each once); nothing is walked recursively, so storing
+    an output stays cheap.  Everything else counts as zero.
+    """
+    if isinstance(value, (np.ndarray, CompressedFrame)):
+        return value.nbytes
+    if type(value) is dict:
+        items: Any = value.values()
+    elif type(value) in (list, tuple):
+        items = value
+    else:
+        return 0
+    arrays = {id(v): v.nbytes for v in items if isinstance(v, np.ndarray)}
+    return sum(arrays.values())
+
+
+def _compressible(value: Any) -> bool:
+    return (
+        isinstance(value, np.ndarray)
+        and value.dtype == np.uint8
+        and (value.ndim == 2 or (value.ndim == 3 and value.shape[2] in (1, 3)))
+    )
+
+
+class CacheRef:
+    """Weak handle to one stored version of a :class:`BudgetedCache` entry.
+
+    Calling the handle returns the entry while it has not been replaced or
+    evicted, decoding it if the budget compressed it meanwhile.  Afterwards
+    it behaves like a weak reference to the original array.  The handle does
+    not keep the cache or its data alive.
+    """
+
+    __slots__ = ("_cache", "_key", "_version", "_original")
+
+    def __init__(self, cache: "BudgetedCache", key: Any, version: int) -> None:
+        self._cache = weakref.ref(cache)
+        self._key = key
+        self._version = version
+        value = cache._data[key]
+        self._original = weakref.ref(value) if isinstance(value, np.ndarray) else None
+
+    def __call__(self) -> Any:
+        original = self._original() if self._original is not None else None
+        if original is not None:
+            return original
+        cache = self._cache()
+        if cache is None:
+            return None
+        with cache._manager._lock:
+            if cache._versions.get(self._key) != self._version:
+                return None
+            value = cache._data.get(self._key)
+        if isinstance(value, CompressedFrame):
+            return value.decode()
+        return value
+
+
+class BudgetedCache(MutableMapping):
+    """Dict-like cache whose ndarray contents count against the budget.
+
+    Compressed entries are decoded transparently on access so callers keep
+    receiving arrays, at the cost of JPEG quality.
+    """
+
+    def __init__(
+        self, component: str, manager: Optional["MemoryBudgetManager"] = None
+    ) -> None:
+        self.component = component
+        self._data: Dict[Any, Any] = {}
+        # bumped on every store so CacheRefs notice replaced entries
+        self._versions: Dict[Any, int] = {}
+        self._next_version = 0
+        self._manager = manager or get_memory_budget_manager()
+        self._manager.register(self)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._data[key]
+        self._manager.touch(self, key)
+        if isinstance(value, CompressedFrame):
+            return value.decode()
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        manager = self._manager
+        tracked = manager.max_bytes is not None or manager.accounting
+        nbytes = estimate_nbytes(value) if tracked else 0
+        with manager._lock:
+            self._data[key] = value
+            self._next_version += 1
+            self._versions[key] = self._next_version
+            manager.store(self, key, nbytes)
+
+    def __delitem__(self, key: Any) -> None:
+        with self._manager._lock:
+            del self._data[key]
+            self._versions.pop(key, None)
+            self._manager.remove(self, key)
+
+    def ref(self, key: Any) -> CacheRef:
+        """Return a :class:`CacheRef` to the value currently stored at ``key``."""
+        with self._manager._lock:
+            return CacheRef(self, key, self._versions[key])
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        for key in list(self._data):
+            del self[key]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(estimate_nbytes(v) for v in self._data.values())
+
+    # Called by the manager (holding its lock) when the budget is exceeded
+    def _replace(
+        self, key: Any, original: Any, frame: Optional[CompressedFrame]
+    ) -> bool:
+        """Swap ``original`` for ``frame`` (or drop it) unless it was replaced."""
+        if key not in self._data or self._data[key] is not original:
+            return False
+        if frame is None:
+            del self._data[key]
+            self._versions.pop(key, None)
+        else:
+            self._data[key] = frame
+        return True
+
+
+class MemoryBudgetManager:
+    """Tracks bytes held per controller cache and enforces a global cap.
+
+    Only entries holding image data (``nbytes > 0``) are tracked, ordered by
+    last store/access; when the total exceeds ``max_bytes`` the least
+    recently used arrays are compressed to JPEG (``policy="compress"``) or
+    dropped (``policy="evict"``).  Other outputs, such as dicts or result
+    objects, are never reclaimed, and neither is the entry being stored by
+    its own insertion.  Without ``max_bytes`` and with ``accounting``
+    disabled, stores skip the size estimate entirely.  Compression runs on a
+    background thread so storing from the event loop never encodes JPEGs;
+    entries being compressed already count as reclaimed.
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        *,
+        policy: str = "compress",
+        jpeg_quality: int = 80,
+        accounting: bool = True,
+    ) -> None:
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown memory budget policy: {policy}")
+        self.max_bytes = max_bytes
+        self.accounting = accounting
+        self.policy = policy
+        self.jpeg_quality = jpeg_quality
+        self._lock = threading.RLock()
+        self._caches: Dict[int, "weakref.ref[BudgetedCache]"] = {}
+        # (cache id, key) -> bytes, least recently used first
+        self._entries: "OrderedDict[Tuple[int, Any], int]" = OrderedDict()
+        self._component_bytes: Dict[str, int] = {}
+        self._total_bytes = 0
+        self._peak_bytes = 0
+        self._evictions = 0
+        self._compressions = 0
+        # entries handed to the compression thread -> bytes before compression
+        self._compressing: Dict[Tuple[int, Any], int] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: Set[Future] = set()
+
+    def register(self, cache: BudgetedCache) -> None:
+        cache_id = id(cache)
+        component = cache.component
+
+        # the callback must not reference ``cache`` or it would never be freed
+        def _forget(_ref: Any) -> None:
+            with self._lock:
+                for entry in [e for e in self._entries if e[0] == cache_id]:
+                    self._account(component, -self._entries.pop(entry))
+                self._caches.pop(cache_id, None)
+
+        with self._lock:
+            self._caches[cache_id] = weakref.ref(cache, _forget)
+            self._component_bytes.setdefault(cache.component, 0)
+
+    def _account(self, component: str, delta: int) -> None:
+        self._total_bytes += delta
+        self._component_bytes[component] = (
+            self._component_bytes.get(component, 0) + delta
+        )
+        if self._total_bytes > self._peak_bytes:
+            self._peak_bytes = self._total_bytes
+
+    def store(self, cache: BudgetedCache, key: Any, nbytes: int) -> None:
+        entry = (id(cache), key)
+        with self._lock:
+            old = self._entries.pop(entry, 0)
+            if nbytes:
+                self._entries[entry] = nbytes
+            self._account(cache.component, nbytes - old)
+            self._enforce(protect=entry)
+
+    def touch(self, cache: BudgetedCache, key: Any) -> None:
+        entry = (id(cache), key)
+        with self._lock:
+            if entry in self._entries:
+                self._entries.move_to_end(entry)
+
+    def remove(self, cache: BudgetedCache, key: Any) -> None:
+        with self._lock:
+            old = self._entries.pop((id(cache), key), None)
+            if old is not None:
+                self._account(cache.component, -old)
+
+    def _enforce(self, protect: Tuple[int, Any]) -> None:
+        if self.max_bytes is None:
+            return
+        for entry in list(self._entries):
+            pending = sum(self._compressing.values())
+            if self._total_bytes - pending <= self.max_bytes:
+                return
+            if entry == protect or entry in self._compressing:
+                continue
+            ref = self._caches.get(entry[0])
+            cache = ref() if ref is not None else None
+            if cache is None:
+                continue
+            value = cache._data.get(entry[1])
+            if not isinstance(value, np.ndarray):
+                continue
+            if self.policy == "compress" and _compressible(value):
+                self._compressing[entry] = self._entries[entry]
+                self._submit(self._compress, ref, entry, value)
+                continue
+            cache._replace(entry[1], value, None)
+            self._reclaimed(cache, entry, 0)
+
+    def _reclaimed(
+        self, cache: BudgetedCache, entry: Tuple[int, Any], remaining: int
+    ) -> None:
+        old = self._entries[entry]
+        if remaining:
+            self._compressions += 1
+            self._entries[entry] = remaining
+        else:
+            self._evictions += 1
+            del self._entries[entry]
+        self._account(cache.component, remaining - old)
+        debug(
+            "memory_budget_reclaim",
+            component=cache.component,
+            freed=old - remaining,
+            total=self._total_bytes,
+        )
+
+    def _submit(self, fn: Any, *args: Any) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="memory-budget"
+            )
+        job = self._executor.submit(fn, *args)
+        self._jobs.add(job)
+        job.add_done_callback(self._jobs.discard)
+
+    def _compress(
+        self,
+        cache_ref: "weakref.ref[BudgetedCache]",
+        entry: Tuple[int, Any],
+        value: np.ndarray,
+    ) -> None:
+        ok, buf = cv2.imencode(
+            ".jpg", value, [int(cv2.IMWRITE_JPEG_QUALITY), self.jpeg_quality]
+        )
+        frame = CompressedFrame(buf.tobytes(), value.shape) if ok else None
+        with self._lock:
+            self._compressing.pop(entry, None)
+            cache = cache_ref()
+            if cache is None or entry not in self._entries:
+                return
+            # a newer value stored meanwhile has its own accounting
+            if not cache._replace(entry[1], value, frame):
+                return
+            self._reclaimed(cache, entry, frame.nbytes if frame else 0)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait for pending compressions; return ``False`` on timeout."""
+        with self._lock:
+            jobs = list(self._jobs)
+        return not wait_futures(jobs, timeout=timeout).not_done
+
+    def get_usage(self, prefix: str = "") -> Dict[str, int]:
+        """Return bytes held per component whose name starts with ``prefix``."""
+        with self._lock:
+            return {
+                name: nbytes
+                for name, nbytes in self._component_bytes.items()
+                if name.startswith(prefix)
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_bytes": self.max_bytes,
+                "policy": self.policy,
+                "total_bytes": self._total_bytes,
+                "peak_bytes": self._peak_bytes,
+                "evictions": self._evictions,
+                "compressions": self._compressions,
+                "components": dict(self._component_bytes),
+            }
+
+
+_global_mgr: MemoryBudgetManager | None = None
+_mgr_lock = threading.Lock()
+
+
+def get_memory_budget_manager() -> MemoryBudgetManager:
+    """Return the global :class:`MemoryBudgetManager`.
+
+    The cap is read from ``memory_budget.max_mb`` on first use; without it
+    usage is only accounted (unless ``memory_budget.accounting`` is false),
+    never limited.
+    """
+    global _global_mgr
+    if _global_mgr is None:
+        with _mgr_lock:
+            if _global_mgr is None:
+                max_bytes = None
+                policy = "compress"
+                quality = 80
+                accounting = True
+                service = get_config_service()
+                if service is not None:
+                    max_mb = service.get("memory_budget.max_mb", (int, float), None)
+                    if max_mb is not None:
+                        max_bytes = int(max_mb * 1024 * 1024)
+                    policy = service.get("memory_budget.policy", str, policy)
+                    quality = service.get("memory_budget.jpeg_quality", int, quality)
+                    accounting = service.get(
+                        "memory_budget.accounting", bool, accounting
+                    )
+                _global_mgr = MemoryBudgetManager(
+                    max_bytes,
+                    policy=policy,
+                    jpeg_quality=quality,
+                    accounting=accounting,
+                )
+    return _global_mgr
+
+
+__all__ = [
+    "BudgetedCache",
+    "CacheRef",
+    "CompressedFrame",
+    "MemoryBudgetManager",
+    "estimate_nbytes",
+    "get_memory_budget_manager",
+]
@@ -0,0 +1,471 @@
+"""
+Run a controller in a dedicated worker process.
+
+A controller configured with ``isolation: process`` is replaced by a
+:class:`ProcessIsolatedController` proxy.  The real controller is constructed,
+started and kept inside a worker process, so its state lives there and CPU
+heavy processing no longer blocks the asyncio loop of the application.
+
+Each call sends the :class:`ControllerInput` over a pipe.  NumPy arrays of at
+least :data:`SHARED_ARRAY_MIN_BYTES` are written into a shared memory arena
+that is reused between calls instead of being pickled; the pipe only carries
+their offsets, shapes and dtypes.  Results travel back the same way.
+
+A worker that dies or stops answering within ``isolation_timeout_s`` is killed
+and restarted up to ``max_restarts`` times; the call that hit the crash
+returns an error result but the controller keeps running.  The shared memory
+a killed worker leaves behind is unlinked by the proxy.
+
+A call cancelled by its caller stops waiting right away; the worker, whose
+late reply would otherwise answer the next call, is replaced in the
+background.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import multiprocessing as mp
+import threading
+import time
+from multiprocessing import resource_tracker
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+
+from cvd.utils.log_service import error, info, warning
+
+from .controller_base import (
+    ControllerConfig,
+    ControllerInput,
+    ControllerResult,
+    ControllerStage,
+    ControllerStatus,
+)
+
+ISOLATION_MODES = ("inline", "process")
+
+# smaller arrays are cheaper to pickle than to place in shared memory
+SHARED_ARRAY_MIN_BYTES = 1 << 16
+_ALIGN = 64
+
+
+class _ArrayRef:
+    """Location of an array inside a shared memory arena."""
+
+    __slots__ = ("offset", "shape", "dtype")
+
+    def __init__(self, offset: int, shape: Tuple[int, ...], dtype: str) -> None:
+        self.offset = offset
+        self.shape = shape
+        self.dtype = dtype
+
+    def __reduce__(self):
+        return (_ArrayRef, (self.offset, self.shape, self.dtype))
+
+
+class _SharedArena:
+    """Growable shared memory block the sending side packs arrays into."""
+
+    def __init__(self) -> None:
+        self._shm: Optional[SharedMemory] = None
+
+    def pack(self, obj: Any) -> Tuple[Optional[str], Any]:
+        arrays: List[np.ndarray] = []
+        size = _collect_arrays(obj, arrays, 0)
+        if not arrays:
+            return None, obj
+        if self._shm is None or self._shm.size < size:
+            previous = self._shm.size if self._shm is not None else 0
+            self.close()
+            self._shm = SharedMemory(create=True, size=max(size, 2 * previous))
+        return self._shm.name, _encode(obj, self._shm.buf, [0])
+
+    def close(self) -> None:
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+
+class _ArenaReader:
+    """Receiving side of :class:`_SharedArena`; copies arrays out of it."""
+
+    def __init__(self) -> None:
+        self._shm: Optional[SharedMemory] = None
+
+    def unpack(self, name: Optional[str], obj: Any) -> Any:
+        if name is None:
+            return obj
+        if self._shm is None or self._shm.name != name:
+            self.close()
+            self._shm = SharedMemory(name=name)
+            # the sending side owns and unlinks the segment
+            resource_tracker.unregister(self._shm._name, "shared_memory")
+        return _decode(obj, self._shm.buf)
+
+    def close(self, unlink: bool = False) -> None:
+        """Detach; with ``unlink`` also remove a segment the sender left."""
+        if self._shm is not None:
+            self._shm.close()
+            if unlink:
+                # registered again so unlink() keeps the tracker balanced
+                resource_tracker.register(self._shm._name, "shared_memory")
+                try:
+                    self._shm.unlink()
+                except FileNotFoundError:
+                    # the sender unlinked it on a clean exit
+                    resource_tracker.unregister(self._shm._name, "shared_memory")
+            self._shm = None
+
+
+def _is_shared(value: Any) -> bool:
+    return (
+        isinstance(value, np.ndarray)
+        and value.dtype != object
+        and value.nbytes >= SHARED_ARRAY_MIN_BYTES
+    )
+
+
+def _collect_arrays(obj: Any, arrays: List[np.ndarray], size: int) -> int:
+    """Return the arena size needed for the arrays in ``obj``."""
+    if _is_shared(obj):
+        arrays.append(obj)
+        return size + (obj.nbytes + _ALIGN - 1) // _ALIGN * _ALIGN
+    if isinstance(obj, dict):
+        for value in obj.values():
+            size = _collect_arrays(value, arrays, size)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            size = _collect_arrays(value, arrays, size)
+    return size
+
+
+def _encode(obj: Any, buf: memoryview, offset: List[int]) -> Any:
+    if _is_shared(obj):
+        start = offset[0]
+        target = np.ndarray(obj.shape, obj.dtype, buffer=buf, offset=start)
+        target[...] = obj
+        offset[0] = start + (obj.nbytes + _ALIGN - 1) // _ALIGN * _ALIGN
+        return _ArrayRef(start, obj.shape, obj.dtype.str)
+    if isinstance(obj, dict):
+        return {key: _encode(value, buf, offset) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_encode(value, buf, offset) for value in obj]
+    if isinstance(obj, tuple):
+        return tuple(_encode(value, buf, offset) for value in obj)
+    return obj
+
+
+def _decode(obj: Any, buf: memoryview) -> Any:
+    if isinstance(obj, _ArrayRef):
+        view = np.ndarray(obj.shape, np.dtype(obj.dtype), buffer=buf, offset=obj.offset)
+        # the arena is overwritten by the next call
+        return view.copy()
+    if isinstance(obj, dict):
+        return {key: _decode(value, buf) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_decode(value, buf) for value in obj]
+    if isinstance(obj, tuple):
+        return tuple(_decode(value, buf) for value in obj)
+    return obj
+
+
+# ----------------------------------------------------------------------
+# Worker process
+
+
+def _worker_main(
+    conn: Connection,
+    controller_cls: Type[ControllerStage],
+    controller_id: str,
+    config: ControllerConfig,
+) -> None:
+    asyncio.run(_serve(conn, controller_cls(controller_id, config)))
+
+
+async def _serve(conn: Connection, controller: ControllerStage) -> None:
+    arena = _SharedArena()
+    reader = _ArenaReader()
+    conn.send(("started", await controller.start()))
+    try:
+        while True:
+            message = await asyncio.to_thread(conn.recv)
+            if message[0] == "stop":
+                await controller.stop()
+                conn.send(("stopped",))
+                return
+            _, name, payload = message
+            sensor_data, controller_data, timestamp, metadata = reader.unpack(
+                name, payload
+            )
+            try:
+                result = await controller.process(
+                    ControllerInput(sensor_data, controller_data, timestamp, metadata)
+                )
+            except Exception as e:
+                result = ControllerResult.error_result(
+                    f"Exception in controller {controller.controller_id}: {e}"
+                )
+            name, payload = arena.pack(
+                (result.success, result.data, result.error_message, result.metadata)
+            )
+            conn.send(("result", name, payload))
+    except (EOFError, OSError):
+        # parent went away
+        pass
+    finally:
+        reader.close()
+        arena.close()
+
+
+# ----------------------------------------------------------------------
+# Proxy
+
+
+class _WorkerCrashed(Exception):
+    pass
+
+
+class _CallAbandoned(_WorkerCrashed):
+    """The caller stopped waiting for the reply (e.g. a missed deadline)."""
+
+
+class ProcessIsolatedController(ControllerStage):
+    """Proxy running ``controller_cls`` in a dedicated worker process.
+
+    Parameters read from the controller config besides the ones of the
+    wrapped controller: ``max_restarts`` (default 3), ``isolation_timeout_s``
+    (default 30) bounding start-up and every call, ``restart_reset_s``
+    (default 300) after which a worker that has not crashed gets its restart
+    budget back, and ``start_method`` for :mod:`multiprocessing`.
+    """
+
+    def __init__(
+        self,
+        controller_id: str,
+        config: ControllerConfig,
+        controller_cls: Type[ControllerStage],
+    ) -> None:
+        super().__init__(controller_id, config)
+        self.controller_cls = controller_cls
+        params = config.parameters
+        # scheduling hints default to those of the wrapped class
+        self.pure = bool(params.get("pure", controller_cls.pure))
+        self.priority = int(params.get("priority", controller_cls.priority))
+        deadline_ms = params.get("deadline_ms", controller_cls.deadline_ms)
+        self.deadline_ms = float(deadline_ms) if deadline_ms is not None else None
+        self.max_restarts = int(params.get("max_restarts", 3))
+        self.timeout_s = float(params.get("isolation_timeout_s", 30.0))
+        self.restart_reset_s = float(params.get("restart_reset_s", 300.0))
+        self.start_method: Optional[str] = params.get("start_method")
+
+        self._process: Optional[mp.process.BaseProcess] = None
+        self._conn: Optional[Connection] = None
+        # one request in flight; also serialises calls abandoned by the caller
+        self._io_lock = threading.Lock()
+        self._arena = _SharedArena()
+        self._reader = _ArenaReader()
+        self._restarts = 0
+        self._crashes = 0
+        self._abandoned = 0
+        self._started_at: Optional[float] = None
+        self._recovered = False
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process is not None else None
+
+    async def initialize(self) -> bool:
+        return await asyncio.to_thread(self._spawn)
+
+    async def cleanup(self) -> None:
+        await asyncio.to_thread(self._shutdown_worker)
+
+    async def process(self, input_data: ControllerInput) -> ControllerResult:
+        abandon = threading.Event()
+        try:
+            return await asyncio.to_thread(self._call, input_data, abandon)
+        except asyncio.CancelledError:
+            # the thread keeps running: make it give up the lock and replace
+            # the worker instead of blocking the next call behind this one
+            abandon.set()
+            self._abandoned += 1
+            raise
+        except _WorkerCrashed as exc:
+            self._crashes += 1
+            error(
+                "Isolated controller worker crashed",
+                controller_id=self.controller_id,
+                reason=str(exc),
+                restarts=self._restarts,
+            )
+            if (
+                self._started_at is not None
+                and time.monotonic() - self._started_at >= self.restart_reset_s
+            ):
+                # the worker ran healthily for a while: a new incident
+                self._restarts = 0
+            if self._restarts < self.max_restarts:
+                self._restarts += 1
+                self._recovered = await asyncio.to_thread(self._spawn)
+            return ControllerResult.error_result(f"Controller worker crashed: {exc}")
+
+    async def process_with_timing(
+        self, input_data: ControllerInput
+    ) -> ControllerResult:
+        self._recovered = False
+        result = await super().process_with_timing(input_data)
+        if self._recovered:
+            # the failed call is reported, but the restarted worker keeps
+            # the controller schedulable
+            self.status = ControllerStatus.RUNNING
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        stats["isolation"] = {
+            "mode": "process",
+            "pid": self.pid,
+            "alive": self._process is not None and self._process.is_alive(),
+            "crashes": self._crashes,
+            "restarts": self._restarts,
+            "abandoned": self._abandoned,
+        }
+        return stats
+
+    # ------------------------------------------------------------------
+    # Worker management, called from threads
+
+    def _spawn(self) -> bool:
+        with self._io_lock:
+            return self._spawn_locked()
+
+    def _spawn_locked(self) -> bool:
+        self._terminate()
+        ctx = mp.get_context(self.start_method)
+        conn, child_conn = ctx.Pipe()
+        config = dataclasses.replace(self.config, isolation="inline")
+        process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self.controller_cls, self.controller_id, config),
+            name=f"controller-{self.controller_id}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self._process, self._conn = process, conn
+        try:
+            reply = self._receive()
+        except _WorkerCrashed as exc:
+            error(
+                "Isolated controller failed to start",
+                controller_id=self.controller_id,
+                reason=str(exc),
+            )
+            self._terminate()
+            return False
+        if not reply[1]:
+            self._terminate()
+            return False
+        self._started_at = time.monotonic()
+        info(
+            "Isolated controller worker started",
+            controller_id=self.controller_id,
+            pid=process.pid,
+        )
+        return True
+
+    def _call(
+        self, input_data: ControllerInput, abandon: Optional[threading.Event] = None
+    ) -> ControllerResult:
+        with self._io_lock:
+            if abandon is not None and abandon.is_set():
+                raise _CallAbandoned("cancelled before it was sent")
+            if self._conn is None:
+                raise _WorkerCrashed("worker not running")
+            name, payload = self._arena.pack(
+                (
+                    input_data.sensor_data,
+                    input_data.controller_data,
+                    input_data.timestamp,
+                    input_data.metadata,
+                )
+            )
+            try:
+                self._conn.send(("process", name, payload))
+            except OSError as exc:
+                self._terminate()
+                raise _WorkerCrashed(str(exc)) from exc
+            try:
+                _, name, payload = self._receive(abandon)
+            except _CallAbandoned:
+                self._spawn_locked()
+                raise
+            success, data, error_message, metadata = self._reader.unpack(name, payload)
+            return ControllerResult(
+                success=success,
+                data=data,
+                error_message=error_message,
+                metadata=metadata,
+            )
+
+    def _receive(self, abandon: Optional[threading.Event] = None) -> Tuple[Any, ...]:
+        """Wait for the next reply, detecting dead or hung workers."""
+        assert self._conn is not None and self._process is not None
+        deadline = time.monotonic() + self.timeout_s
+        try:
+            while not self._conn.poll(0.05):
+                if abandon is not None and abandon.is_set():
+                    raise _CallAbandoned("caller stopped waiting")
+                if not self._process.is_alive():
+                    raise _WorkerCrashed(
+                        f"worker exited with code {self._process.exitcode}"
+                    )
+                if time.monotonic() > deadline:
+                    raise _WorkerCrashed(f"no reply within {self.timeout_s:g}s")
+            return self._conn.recv()
+        except _WorkerCrashed:
+            self._terminate()
+            raise
+        except (EOFError, OSError) as exc:
+            self._terminate()
+            raise _WorkerCrashed(str(exc)) from exc
+
+    def _shutdown_worker(self) -> None:
+        with self._io_lock:
+            if self._conn is not None:
+                try:
+                    self._conn.send(("stop",))
+                    self._receive()
+                except (_WorkerCrashed, OSError) as exc:
+                    warning(
+                        "Isolated controller did not stop cleanly",
+                        controller_id=self.controller_id,
+                        reason=str(exc),
+                    )
+            self._terminate(graceful=True)
+            self._arena.close()
+
+    def _terminate(self, graceful: bool = False) -> None:
+        process, self._process = self._process, None
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.close()
+        if process is not None:
+            if graceful:
+                process.join(timeout=1.0)
+            if process.is_alive():
+                process.kill()
+            process.join()
+        # a killed worker never unlinks its result arena
+        self._reader.close(unlink=True)
+
+
+__all__ = [
+    "ISOLATION_MODES",
+    "SHARED_ARRAY_MIN_BYTES",
+    "ProcessIsolatedController",
+]
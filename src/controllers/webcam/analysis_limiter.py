@@ -0,0 +1,88 @@
+"""Global cap on the combined motion analysis rate of all cameras."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from cvd.utils.config_service import get_config_service
+
+
+class AnalysisRateLimiter:
+    """Share a total analysis budget of ``max_fps`` frames/s between cameras.
+
+    Every registered camera gets an equal slice (``max_fps / cameras``) and
+    frames arriving faster than that are skipped rather than queued, so the
+    analysis always works on the newest frame and no camera can consume the
+    budget of the others.  ``max_fps`` of ``None`` or ``0`` disables the cap.
+    """
+
+    def __init__(self, max_fps: Optional[float] = None) -> None:
+        self.max_fps = max_fps or None
+        self._lock = threading.Lock()
+        self._last: Dict[str, float] = {}
+        self._allowed: Dict[str, int] = {}
+        self._skipped: Dict[str, int] = {}
+
+    def register(self, key: str) -> None:
+        with self._lock:
+            self._last.setdefault(key, float("-inf"))
+            self._allowed.setdefault(key, 0)
+            self._skipped.setdefault(key, 0)
+
+    def unregister(self, key: str) -> None:
+        with self._lock:
+            self._last.pop(key, None)
+
+    def allow(self, key: str, now: Optional[float] = None) -> bool:
+        """Return ``True`` if ``key`` may analyse a frame now."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if key not in self._last:
+                self._last[key] = float("-inf")
+            if self.max_fps:
+                interval = len(self._last) / self.max_fps
+                if now - self._last[key] < interval:
+                    self._skipped[key] = self._skipped.get(key, 0) + 1
+                    return False
+            self._last[key] = now
+            self._allowed[key] = self._allowed.get(key, 0) + 1
+            return True
+
+    def get_stats(self, key: Optional[str] = None) -> Dict[str, Any]:
+        with self._lock:
+            if key is not None:
+                return {
+                    "analysed": self._allowed.get(key, 0),
+                    "skipped_by_cap": self._skipped.get(key, 0),
+                }
+            return {
+                "max_fps": self.max_fps,
+                "cameras": len(self._last),
+                "analysed": sum(self._allowed.values()),
+                "skipped_by_cap": sum(self._skipped.values()),
+            }
+
+
+_global_limiter: AnalysisRateLimiter | None = None
+_limiter_lock = threading.Lock()
+
+
+def get_analysis_rate_limiter() -> AnalysisRateLimiter:
+    """Return the global limiter configured from ``webcam_analysis.max_total_fps``."""
+    global _global_limiter
+    if _global_limiter is None:
+        with _limiter_lock:
+            if _global_limiter is None:
+                max_fps = None
+                service = get_config_service()
+                if service is not None:
+                    max_fps = service.get(
+                        "webcam_analysis.max_total_fps", (int, float), None
+                    )
+                _global_limiter = AnalysisRateLimiter(max_fps)
+    return _global_limiter
+
+
+__all__ = ["AnalysisRateLimiter", "get_analysis_rate_limiter"]
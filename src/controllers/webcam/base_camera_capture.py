@@ -4,14 +4,22 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Any
+from collections import deque
+from typing import Any, Dict, Optional, Tuple
 
 import cv2
 import platform
 
-from ..camera_utils import apply_uvc_settings, rotate_frame
-from cvd.utils.concurrency.thread_pool import run_camera_io
+from ..camera_utils import UvcState, apply_uvc_settings, rotate_frame
+from .camera_sources import open_source_capture
+from ..frame_trace import FrameTrace, get_frame_tracer
+from cvd.utils.concurrency.thread_pool import (
+    camera_io_context,
+    get_thread_pool_manager,
+    run_camera_io,
+)
 from cvd.utils.log_service import info, warning, error
 
 
@@ -29,16 +37,62 @@ class BaseCameraCapture(ABC):
     fps: Any
     rotation: Any
     uvc_settings: Any
+    source: Any = None
     """Mixin providing a reusable camera capture loop."""
 
+    # number of recent reads used for fps/latency/CPU figures
+    STATS_WINDOW = 120
+
     def __init__(self, controller_id: str, config):
         super().__init__(controller_id, config)
         self.controller_id = controller_id
         self.config = config
         self._capture: Optional[cv2.VideoCapture] = None
+        # UVC values applied to the handle in use
+        self._uvc_state: Optional[UvcState] = None
         self._capture_task: Optional[asyncio.Task] = None
+        # camera I/O pool this controller counts as a user of
+        self._camera_pool_key: Optional[str] = None
         self._stop_event = asyncio.Event()
         self.capture_backend_fallbacks = []
+        self._frames_captured = 0
+        self._read_cpu_total = 0.0
+        # (monotonic end time, read latency s, read thread CPU s)
+        self._read_samples: deque[Tuple[float, float, float]] = deque(
+            maxlen=self.STATS_WINDOW
+        )
+        # trace of the frame currently handled / last published
+        self._frame_trace: Optional[FrameTrace] = None
+
+    @property
+    def camera_io_key(self) -> str:
+        """Key of the dedicated I/O thread used for this camera."""
+        return getattr(self, "webcam_id", None) or f"video{self.device_index}"
+
+    def _capture_uvc_state(self, cap: Any) -> UvcState:
+        """UVC state of ``cap``, started afresh whenever the handle changes."""
+        if self._uvc_state is None or self._uvc_state.capture is not cap:
+            self._uvc_state = UvcState(cap)
+        return self._uvc_state
+
+    def _hold_camera_pool(self) -> None:
+        """Count this controller as a user of its camera's I/O pool.
+
+        Following a changed ``camera_io_key`` releases the previous pool.
+        """
+        key = self.camera_io_key
+        if key == self._camera_pool_key:
+            return
+        manager = get_thread_pool_manager()
+        if self._camera_pool_key is not None:
+            manager.release_camera_pool(self._camera_pool_key, wait=False)
+        manager.acquire_camera_pool(key)
+        self._camera_pool_key = key
+
+    async def _release_camera_pool(self) -> None:
+        key, self._camera_pool_key = self._camera_pool_key, None
+        if key is not None:
+            await asyncio.to_thread(get_thread_pool_manager().release_camera_pool, key)
 
     # ------------------------------------------------------------------
     # Hooks for subclasses
@@ -52,10 +106,67 @@ class BaseCameraCapture(ABC):
         return None
 
     # ------------------------------------------------------------------
+    async def _reuse_capture(self) -> bool:
+        """Adopt an already opened handle, e.g. from the access test.
+
+        The configured resolution is applied and verified; a handle that
+        cannot deliver it is released so the device is reopened properly.
+        """
+        cap = self._capture
+        if cap is None:
+            return False
+        try:
+            if not await run_camera_io(cap.isOpened):
+                raise RuntimeError("capture closed")
+            width, height = getattr(self, "width", None), getattr(self, "height", None)
+            if width:
+                await run_camera_io(cap.set, cv2.CAP_PROP_FRAME_WIDTH, int(width))
+            if height:
+                await run_camera_io(cap.set, cv2.CAP_PROP_FRAME_HEIGHT, int(height))
+            if not await self._has_resolution(cap):
+                raise RuntimeError("capture not in the configured resolution")
+            if getattr(self, "fps", None):
+                await run_camera_io(cap.set, cv2.CAP_PROP_FPS, int(self.fps))
+            await apply_uvc_settings(
+                cap,
+                self.uvc_settings,
+                controller_id=self.controller_id,
+                state=self._capture_uvc_state(cap),
+            )
+        except Exception:
+            with contextlib.suppress(Exception):
+                await run_camera_io(cap.release)
+            self._capture = None
+            self._uvc_state = None
+            return False
+        await self.on_capture_opened()
+        return True
+
+    async def _has_resolution(self, cap: Any) -> bool:
+        """Whether ``cap`` reports the configured width and height."""
+        for prop, value in (
+            (cv2.CAP_PROP_FRAME_WIDTH, getattr(self, "width", None)),
+            (cv2.CAP_PROP_FRAME_HEIGHT, getattr(self, "height", None)),
+        ):
+            if value and int(await run_camera_io(cap.get, prop)) != int(value):
+                return False
+        return True
+
     async def _open_capture(self) -> bool:
+        self._hold_camera_pool()
+        with camera_io_context(self.camera_io_key):
+            return await self._open_capture_device()
+
+    async def _open_capture_device(self) -> bool:
+        if await self._reuse_capture():
+            return True
+
+        source = getattr(self, "source", None)
+
         # prefer DirectShow on Windows when no backend was specified
         if (
-            getattr(self, "capture_backend", None) is None
+            not source
+            and getattr(self, "capture_backend", None) is None
             and platform.system() == "Windows"
             and cv2.__dict__.get("CAP_DSHOW") is not None
         ):
@@ -76,11 +187,22 @@ class BaseCameraCapture(ABC):
         else:
             fallback = cv2.CAP_DSHOW if cv2.__dict__.get("CAP_DSHOW") else cv2.CAP_V4L2
             backends.append(fallback)
+        if source:
+            # synthetic/file sources have no backends to fall back to
+            backends = backends[:1]
 
         for backend in backends:
             cap = None
             try:
-                if backend is None:
+                if source:
+                    cap = await run_camera_io(
+                        open_source_capture,
+                        source,
+                        getattr(self, "width", None),
+                        getattr(self, "height", None),
+                        getattr(self, "fps", None),
+                    )
+                elif backend is None:
                     cap = await run_camera_io(cv2.VideoCapture, self.device_index)
                 else:
                     cap = await run_camera_io(
@@ -101,7 +223,10 @@ class BaseCameraCapture(ABC):
                 if getattr(self, "fps", None):
                     await run_camera_io(cap.set, cv2.CAP_PROP_FPS, int(self.fps))
                 await apply_uvc_settings(
-                    cap, self.uvc_settings, controller_id=self.controller_id
+                    cap,
+                    self.uvc_settings,
+                    controller_id=self.controller_id,
+                    state=self._capture_uvc_state(cap),
                 )
                 ret, _ = await run_camera_io(cap.read)
                 if not ret:
@@ -122,6 +247,7 @@ class BaseCameraCapture(ABC):
                         await run_camera_io(cap.release)
 
         self._capture = None
+        self._uvc_state = None
         return False
 
     # ------------------------------------------------------------------
@@ -160,10 +286,20 @@ class BaseCameraCapture(ABC):
                     await asyncio.sleep(delay)
                     continue
 
-                ret, frame = await run_camera_io(self._capture.read)
+                started = time.monotonic()
+                ret, frame, cpu, read_ns = await run_camera_io(
+                    _timed_read, self._capture
+                )
+                self._record_read(started, cpu)
                 if ret:
+                    trace = get_frame_tracer().begin(self.camera_io_key, read_ns)
+                    # hop from the camera I/O thread back to the event loop
+                    trace.since_capture("capture_wait")
                     if getattr(self, "rotation", 0):
+                        rotate_start = time.monotonic_ns()
                         frame = rotate_frame(frame, self.rotation)
+                        trace.span("rotate", rotate_start)
+                    self._frame_trace = trace
                     await self.handle_frame(frame)
                     failure_count = 0
                     delay = base_delay
@@ -178,6 +314,7 @@ class BaseCameraCapture(ABC):
                         )
                         await run_camera_io(self._capture.release)
                         self._capture = None
+                        self._uvc_state = None
                         continue
             except Exception as e:  # pragma: no cover - defensive
                 error(
@@ -191,13 +328,23 @@ class BaseCameraCapture(ABC):
             await asyncio.sleep(delay)
 
     # Public helpers ---------------------------------------------------
+    @property
+    def is_streaming(self) -> bool:
+        """Whether this controller holds (or is opening) its capture device."""
+        return self._capture is not None or (
+            self._capture_task is not None and not self._capture_task.done()
+        )
+
     def start_capture(self) -> None:
         """Start the asynchronous capture loop if not already running."""
         if self._capture_task and not self._capture_task.done():
             return
 
         self._stop_event.clear()
-        self._capture_task = asyncio.create_task(self._capture_loop())
+        self._hold_camera_pool()
+        # the task copies this context, so all its camera I/O uses our thread
+        with camera_io_context(self.camera_io_key):
+            self._capture_task = asyncio.create_task(self._capture_loop())
         info(
             "Camera capture started",
             controller_id=self.controller_id,
@@ -214,5 +361,50 @@ class BaseCameraCapture(ABC):
 
     async def cleanup_capture(self) -> None:
         if self._capture is not None:
-            await run_camera_io(self._capture.release)
+            with camera_io_context(self.camera_io_key):
+                await run_camera_io(self._capture.release)
             self._capture = None
+            self._uvc_state = None
+        await self._release_camera_pool()
+
+    @property
+    def frame_trace(self) -> Optional[FrameTrace]:
+        """Trace of the most recently captured frame."""
+        return self._frame_trace
+
+    # Statistics -------------------------------------------------------
+    def _record_read(self, started: float, cpu: float) -> None:
+        now = time.monotonic()
+        self._frames_captured += 1
+        self._read_cpu_total += cpu
+        self._read_samples.append((now, now - started, cpu))
+
+    def get_capture_stats(self) -> Dict[str, Any]:
+        """Per-camera capture figures over the last :attr:`STATS_WINDOW` reads."""
+        samples = list(self._read_samples)
+        stats: Dict[str, Any] = {
+            "camera": self.camera_io_key,
+            "frames": self._frames_captured,
+            "io_cpu_s": self._read_cpu_total,
+            "fps": 0.0,
+            "read_latency_ms": None,
+            "read_latency_max_ms": None,
+            "io_cpu_percent": 0.0,
+        }
+        if not samples:
+            return stats
+        latencies = [latency for _, latency, _ in samples]
+        stats["read_latency_ms"] = 1000 * sum(latencies) / len(latencies)
+        stats["read_latency_max_ms"] = 1000 * max(latencies)
+        span = samples[-1][0] - samples[0][0]
+        if span > 0:
+            stats["fps"] = (len(samples) - 1) / span
+            stats["io_cpu_percent"] = 100 * sum(c for _, _, c in samples[1:]) / span
+        return stats
+
+
+def _timed_read(capture: Any) -> Tuple[bool, Any, float, int]:
+    """Read a frame, reporting the I/O thread CPU time and when it returned."""
+    started = time.thread_time()
+    ret, frame = capture.read()
+    return ret, frame, time.thread_time() - started, time.monotonic_ns()
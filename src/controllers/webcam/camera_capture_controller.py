@@ -5,7 +5,7 @@ import asyncio
 import contextlib
 from typing import Optional, Any
 
-from cvd.utils.concurrency.thread_pool import run_camera_io
+from cvd.utils.concurrency.thread_pool import camera_io_context, run_camera_io
 from cvd.controllers.camera_utils import apply_uvc_settings
 from cvd.utils.config_service import get_config_service
 from cvd.controllers.controller_base import (
@@ -43,6 +43,7 @@ class CameraCaptureController(BaseCameraCapture, ControllerStage):
         self.capture_backend_fallbacks = params.get("capture_backend_fallbacks", [])
         self.webcam_id = params.get("cam_id")
         self.rotation = params.get("rotation", 0)
+        self.source = params.get("source")
         self.uvc_settings = {}
         self.uvc_settings.update(params.get("uvc", {}))
         self.uvc_settings.update(params.get("uvc_settings", {}))
@@ -58,6 +59,7 @@ class CameraCaptureController(BaseCameraCapture, ControllerStage):
                         self.width, self.height = res
                     self.fps = cam_cfg.get("fps", self.fps)
                     self.rotation = cam_cfg.get("rotation", self.rotation)
+                    self.source = cam_cfg.get("source", self.source)
                     self.capture_backend = cam_cfg.get(
                         "capture_backend", self.capture_backend
                     )
@@ -79,12 +81,14 @@ class CameraCaptureController(BaseCameraCapture, ControllerStage):
         return opened
 
     async def handle_frame(self, frame: Any) -> None:
-        """Store the latest captured frame."""
-        self._output_cache[self.controller_id] = frame
+        """Publish the latest captured frame."""
+        self.publish_output(frame)
 
     async def start(self) -> bool:
         """Start capturing frames."""
         if not await super().start():
+            # do not keep a handle from the access test open for nothing
+            await self.cleanup_capture()
             return False
         self.start_capture()
         return True
@@ -98,12 +102,20 @@ class CameraCaptureController(BaseCameraCapture, ControllerStage):
         await self.cleanup_capture()
         await super().cleanup()
 
+    def get_stats(self) -> dict[str, Any]:
+        stats = super().get_stats()
+        stats["capture"] = self.get_capture_stats()
+        return stats
+
     async def process(self, input_data: ControllerInput) -> ControllerResult:
         """Return the latest captured frame."""
         frame = self._output_cache.get(self.controller_id)
         if frame is None:
             return ControllerResult.success_result(None)
-        return ControllerResult.success_result({"frame": frame})
+        trace = self.frame_trace
+        return ControllerResult.success_result(
+            {"frame": frame}, metadata=trace.as_metadata() if trace else None
+        )
 
     async def apply_uvc_settings(
         self, settings: Optional[dict[str, Any]] | None = None
@@ -112,11 +124,13 @@ class CameraCaptureController(BaseCameraCapture, ControllerStage):
         if settings:
             self.uvc_settings.update(settings)
         if self._capture is not None:
-            await apply_uvc_settings(
-                self._capture,
-                self.uvc_settings if settings is None else settings,
-                controller_id=self.controller_id,
-            )
+            with camera_io_context(self.camera_io_key):
+                await apply_uvc_settings(
+                    self._capture,
+                    self.uvc_settings if settings is None else settings,
+                    controller_id=self.controller_id,
+                    state=self._capture_uvc_state(self._capture),
+                )
 
     async def test_camera_access(self) -> bool:
         """Check if the configured camera can be accessed.
@@ -124,10 +138,27 @@ class CameraCaptureController(BaseCameraCapture, ControllerStage):
         Tries the configured backend first and falls back to alternative
         backends and lower resolutions when opening the camera fails.  The
         chosen backend is logged and the result is reported to the user via
-        :func:`notify_later`.
+        :func:`notify_later`.  A handle that worked at the configured
+        resolution is kept open and adopted by :meth:`_open_capture` instead
+        of reopening the device; fallback handles are released.
         """
+        self._hold_camera_pool()
+        with camera_io_context(self.camera_io_key):
+            return await self._test_camera_access()
+
+    async def _test_camera_access(self) -> bool:
         from cvd.gui.ui_helpers import notify_later
 
+        # A capture that is already streaming proves access; opening the
+        # device a second time would only disturb it.
+        if self._capture is not None:
+            with contextlib.suppress(Exception):
+                if await run_camera_io(self._capture.isOpened):
+                    return True
+
+        if self.source:
+            return await self._open_capture_device()
+
         # Build list of backends to test
         backends = []
         if self.capture_backend is not None:
@@ -172,7 +203,6 @@ class CameraCaptureController(BaseCameraCapture, ControllerStage):
                     await run_camera_io(cap.set, cv2.CAP_PROP_FRAME_WIDTH, w)
                     await run_camera_io(cap.set, cv2.CAP_PROP_FRAME_HEIGHT, h)
                     ret, _ = await run_camera_io(cap.read)
-                    await run_camera_io(cap.release)
                     if ret:
                         info(
                             "camera_access_test_success",
@@ -186,7 +216,19 @@ class CameraCaptureController(BaseCameraCapture, ControllerStage):
                             f"Camera accessible via backend {backend} at {w}x{h}",
                             type="positive",
                         )
+                        # only a handle in the configured mode is reusable
+                        reusable = (w, h) == resolutions[0]
+                        if not (reusable and await self._has_resolution(cap)):
+                            await run_camera_io(cap.release)
+                            return True
+                        # Keep the working handle for _open_capture
+                        if self._capture is not None:
+                            with contextlib.suppress(Exception):
+                                await run_camera_io(self._capture.release)
+                        self._capture = cap
+                        self._uvc_state = None
                         return True
+                    await run_camera_io(cap.release)
                 except Exception as exc:
                     warning(
                         "camera_access_test_failed",
@@ -0,0 +1,267 @@
+"""Hardware-free camera sources with a ``cv2.VideoCapture``-like interface.
+
+Selected per webcam through a ``source`` entry in the ``webcams`` config::
+
+    "source": {"type": "synthetic", "shapes": 3, "noise": 8,
+               "motion_schedule": [[0, 10], [20, 30]]}
+    "source": {"type": "file", "path": "clips/tank.mp4", "loop": true}
+    "source": {"type": "file", "path": "frames/*.png"}
+
+Both deliver frames as fast as they are read unless ``realtime`` is set, so
+the capture -> motion -> stream path can be benchmarked at any frame rate.
+"""
+
+from __future__ import annotations
+
+import glob
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+SOURCE_TYPES = ("synthetic", "file")
+_IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff"}
+
+
+class _SourceCapture(ABC):
+    """Shared property handling and optional real-time pacing."""
+
+    def __init__(self, width: int, height: int, fps: float, realtime: bool) -> None:
+        self._props: Dict[int, float] = {
+            cv2.CAP_PROP_FRAME_WIDTH: float(width),
+            cv2.CAP_PROP_FRAME_HEIGHT: float(height),
+            cv2.CAP_PROP_FPS: float(fps),
+        }
+        self._realtime = realtime
+        self._opened = True
+        self._frame_index = 0
+        self._next_frame_at: Optional[float] = None
+
+    # cv2.VideoCapture interface ---------------------------------------
+    def isOpened(self) -> bool:
+        return self._opened
+
+    def release(self) -> None:
+        self._opened = False
+
+    def get(self, prop: int) -> float:
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return float(self._frame_index)
+        return self._props.get(prop, 0.0)
+
+    def set(self, prop: int, value: float) -> bool:
+        # UVC properties are accepted and remembered but have no effect
+        self._props[prop] = float(value)
+        return True
+
+    def grab(self) -> bool:
+        return self._opened
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        return self.read()
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if not self._opened:
+            return False, None
+        self._pace()
+        frame = self._next_frame()
+        if frame is None:
+            return False, None
+        self._frame_index += 1
+        return True, frame
+
+    # ------------------------------------------------------------------
+    @property
+    def fps(self) -> float:
+        return self._props[cv2.CAP_PROP_FPS] or 30.0
+
+    def _pace(self) -> None:
+        if not self._realtime:
+            return
+        now = time.monotonic()
+        if self._next_frame_at is not None and now < self._next_frame_at:
+            time.sleep(self._next_frame_at - now)
+            now = self._next_frame_at
+        self._next_frame_at = now + 1.0 / self.fps
+
+    @abstractmethod
+    def _next_frame(self) -> Optional[np.ndarray]:
+        """Return the next frame or ``None`` once the source is exhausted."""
+
+
+class SyntheticCapture(_SourceCapture):
+    """Generates a textured background with moving shapes and sensor noise.
+
+    Motion follows the frame clock (``frame_index / fps``), not wall time, so
+    sequences are reproducible.  ``motion_schedule`` lists ``[start, end]``
+    windows in seconds during which the shapes move; outside them the scene
+    is static apart from noise.  Without a schedule the shapes always move.
+    """
+
+    def __init__(
+        self,
+        width: int = 640,
+        height: int = 480,
+        fps: float = 30,
+        *,
+        shapes: int = 3,
+        noise: float = 4.0,
+        motion_schedule: Optional[Sequence[Sequence[float]]] = None,
+        seed: int = 0,
+        realtime: bool = False,
+    ) -> None:
+        super().__init__(width, height, fps, realtime)
+        self._rng = np.random.default_rng(seed)
+        self._noise = float(noise)
+        self._schedule = [(float(a), float(b)) for a, b in motion_schedule or []]
+        self._shapes = [
+            {
+                "pos": self._rng.random(2),
+                "vel": (self._rng.random(2) - 0.5) * 0.4,
+                "radius": 0.04 + 0.06 * self._rng.random(),
+                "color": tuple(int(c) for c in self._rng.integers(60, 255, 3)),
+            }
+            for _ in range(max(0, int(shapes)))
+        ]
+        self._moving_time = 0.0
+        self._background: Optional[np.ndarray] = None
+
+    def _moving(self, t: float) -> bool:
+        if not self._schedule:
+            return True
+        return any(start <= t < end for start, end in self._schedule)
+
+    def _make_background(self, width: int, height: int) -> np.ndarray:
+        x = np.linspace(40, 120, width, dtype=np.float32)
+        y = np.linspace(0, 40, height, dtype=np.float32)[:, None]
+        gray = (x[None, :] + y).astype(np.uint8)
+        return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+
+    def _next_frame(self) -> Optional[np.ndarray]:
+        width = int(self._props[cv2.CAP_PROP_FRAME_WIDTH])
+        height = int(self._props[cv2.CAP_PROP_FRAME_HEIGHT])
+        if self._background is None or self._background.shape[:2] != (height, width):
+            self._background = self._make_background(width, height)
+        if self._moving(self._frame_index / self.fps):
+            self._moving_time += 1.0 / self.fps
+
+        frame = self._background.copy()
+        scale = min(width, height)
+        for shape in self._shapes:
+            # bounce inside the unit square
+            pos = (shape["pos"] + shape["vel"] * self._moving_time) % 2.0
+            pos = np.where(pos > 1.0, 2.0 - pos, pos)
+            center = (int(pos[0] * (width - 1)), int(pos[1] * (height - 1)))
+            cv2.circle(frame, center, int(shape["radius"] * scale), shape["color"], -1)
+        if self._noise > 0:
+            noise = self._rng.normal(0, self._noise, frame.shape)
+            frame = np.clip(frame + noise, 0, 255).astype(np.uint8)
+        return frame
+
+
+class FileCapture(_SourceCapture):
+    """Plays a video file or image sequence, looping at the end."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        loop: bool = True,
+        fps: Optional[float] = None,
+        realtime: bool = False,
+    ) -> None:
+        self._loop = loop
+        self._video: Optional[cv2.VideoCapture] = None
+        self._images: List[str] = _image_sequence(path)
+        if self._images:
+            first = cv2.imread(self._images[0])
+            height, width = first.shape[:2] if first is not None else (0, 0)
+            native_fps = 0.0
+        else:
+            self._video = cv2.VideoCapture(path)
+            width = int(self._video.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(self._video.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            native_fps = self._video.get(cv2.CAP_PROP_FPS)
+        super().__init__(width, height, fps or native_fps or 30, realtime)
+        self._opened = bool(self._images) or bool(
+            self._video is not None and self._video.isOpened()
+        )
+
+    def set(self, prop: int, value: float) -> bool:
+        # the recorded resolution cannot be changed
+        if prop in (cv2.CAP_PROP_FRAME_WIDTH, cv2.CAP_PROP_FRAME_HEIGHT):
+            return False
+        return super().set(prop, value)
+
+    def release(self) -> None:
+        super().release()
+        if self._video is not None:
+            self._video.release()
+
+    def _next_frame(self) -> Optional[np.ndarray]:
+        if self._images:
+            if self._frame_index >= len(self._images) and not self._loop:
+                return None
+            return cv2.imread(self._images[self._frame_index % len(self._images)])
+        assert self._video is not None
+        ret, frame = self._video.read()
+        if not ret and self._loop:
+            self._video.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self._video.read()
+        return frame if ret else None
+
+
+def _image_sequence(path: str) -> List[str]:
+    p = Path(path)
+    if p.is_dir():
+        files = [str(f) for f in p.iterdir() if f.suffix.lower() in _IMAGE_SUFFIXES]
+    elif any(ch in path for ch in "*?["):
+        files = glob.glob(path)
+    elif p.suffix.lower() in _IMAGE_SUFFIXES:
+        files = [path]
+    else:
+        return []
+    return sorted(files)
+
+
+def open_source_capture(
+    source: Dict[str, Any],
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    fps: Optional[float] = None,
+) -> _SourceCapture:
+    """Create the capture described by a webcam ``source`` config entry."""
+    kind = source.get("type")
+    realtime = bool(source.get("realtime", False))
+    if kind == "synthetic":
+        return SyntheticCapture(
+            int(source.get("width", width or 640)),
+            int(source.get("height", height or 480)),
+            float(source.get("fps", fps or 30)),
+            shapes=source.get("shapes", 3),
+            noise=source.get("noise", 4.0),
+            motion_schedule=source.get("motion_schedule"),
+            seed=source.get("seed", 0),
+            realtime=realtime,
+        )
+    if kind == "file":
+        if not source.get("path"):
+            raise ValueError("File camera source requires a 'path'")
+        return FileCapture(
+            str(source["path"]),
+            loop=bool(source.get("loop", True)),
+            fps=source.get("fps", fps),
+            realtime=realtime,
+        )
+    raise ValueError(f"Unknown camera source type: {kind}")
+
+
+__all__ = [
+    "SOURCE_TYPES",
+    "SyntheticCapture",
+    "FileCapture",
+    "open_source_capture",
+]
@@ -5,13 +5,17 @@ Motion detection controller using OpenCV background subtraction.
 import cv2
 import numpy as np
 from PIL import Image
-from typing import Dict, Any, Optional, Tuple, Deque
-from collections import deque
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field
+from pathlib import Path
+import json
+import os
+import re
 import time
 import math
 import asyncio
 import contextlib
+from collections import deque
 
 from cvd.controllers.controller_base import (
     ImageController,
@@ -28,14 +32,27 @@ from cvd.utils.concurrency.process_pool import (
     get_process_pool_manager,
 )
 from cvd.utils.log_service import info, warning, error
-from cvd.utils.concurrency.thread_pool import run_camera_io
+from cvd.utils.concurrency.thread_pool import (
+    camera_io_context,
+    run_camera_io,
+    run_file_io,
+)
 from cvd.controllers.camera_utils import apply_uvc_settings
+from cvd.controllers.memory_budget import BudgetedCache, CacheRef
 from .base_camera_capture import BaseCameraCapture
+from .motion_history import MotionHistory
+from .analysis_limiter import get_analysis_rate_limiter
 
 
 @dataclass
 class MotionDetectionResult:
-    """Result from motion detection"""
+    """Result from motion detection
+
+    Only scalar fields are populated by default.  The analyzed frame and mask
+    are attached when the controller runs with ``attach_debug_images``;
+    otherwise :meth:`get_frame` and :meth:`get_motion_mask` resolve weak
+    handles that stay valid while the images are the controller's latest.
+    """
 
     motion_detected: bool
     motion_area: float  # Total area of motion
@@ -47,6 +64,41 @@ class MotionDetectionResult:
     frame_delta: Optional[np.ndarray] = None  # Frame difference (for visualization)
     motion_mask: Optional[np.ndarray] = None  # Motion mask (for visualization)
     frame: Optional[np.ndarray] = None  # Original frame (for visualization)
+    _frame_ref: Optional[CacheRef] = field(default=None, repr=False, compare=False)
+    _mask_ref: Optional[CacheRef] = field(default=None, repr=False, compare=False)
+
+    def get_frame(self) -> Optional[np.ndarray]:
+        """Return the analyzed frame if attached or still available."""
+        if self.frame is not None:
+            return self.frame
+        return self._frame_ref() if self._frame_ref is not None else None
+
+    def get_motion_mask(self) -> Optional[np.ndarray]:
+        """Return the motion mask if attached or still available."""
+        if self.motion_mask is not None:
+            return self.motion_mask
+        return self._mask_ref() if self._mask_ref is not None else None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Weak handles cannot be pickled and are meaningless in another process
+        state = self.__dict__.copy()
+        state["_frame_ref"] = None
+        state["_mask_ref"] = None
+        return state
+
+
+def warm_motion_worker() -> None:
+    """Process pool initializer: load OpenCV and run :func:`analyze_motion` once."""
+    mask = np.zeros((32, 32), dtype=np.uint8)
+    mask[8:24, 8:24] = 255
+    analyze_motion(
+        mask,
+        min_contour_area=1,
+        roundness_enabled=True,
+        roundness_threshold=0.0,
+        motion_threshold_percentage=1.0,
+        confidence_threshold=0.0,
+    )
 
 
 def analyze_motion(
@@ -118,7 +170,9 @@ def analyze_motion(
         motion_center=motion_center,
         motion_bbox=motion_bbox,
         confidence=confidence,
-        motion_mask=mask,
+        # The mask stays in the caller's process; returning it would copy the
+        # whole image back through the pool for every frame.
+        motion_mask=None,
         frame_delta=None,  # Could add frame differencing if needed
     )
 
@@ -128,9 +182,14 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
 
     def __init__(self, controller_id: str, config: ControllerConfig):
         super().__init__(controller_id, config)
-        # Obtain shared process pool for motion analysis (CPU-bound)
+        # Obtain shared process pool for motion analysis (CPU-bound); its
+        # workers import OpenCV and run the contour path before their first
+        # frame
         self._pool_manager = get_process_pool_manager()
-        self._motion_pool = self._pool_manager.get_pool(ProcessPoolType.CPU)
+        self._motion_pool = self._pool_manager.get_pool(
+            ProcessPoolType.CPU,
+            config=ProcessPoolConfig(initializer=warm_motion_worker),
+        )
 
         # Parameters from config
         params = config.parameters
@@ -143,6 +202,7 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
         self.capture_backend = params.get("capture_backend")
         self.capture_backend_fallbacks = params.get("capture_backend_fallbacks", [])
         self.rotation = params.get("rotation", 0)
+        self.source = params.get("source")
         self.uvc_settings = {}
         self.uvc_settings.update(params.get("uvc", {}))
         self.uvc_settings.update(params.get("uvc_settings", {}))
@@ -158,6 +218,7 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
                         self.width, self.height = res
                     self.fps = cam_cfg.get("fps", self.fps)
                     self.rotation = cam_cfg.get("rotation", self.rotation)
+                    self.source = cam_cfg.get("source", self.source)
                     self.capture_backend = cam_cfg.get(
                         "capture_backend", self.capture_backend
                     )
@@ -239,8 +300,57 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
         # Decayed confidence average for probability method
         self._multi_frame_avg: float = 0.0
 
+        # Attach full frame and mask to every result (debugging/visualization)
+        self.attach_debug_images = params.get("attach_debug_images", False)
+
         self.warmup_frames = params.get("warmup_frames", 0)
         self._warmup_counter = 0
+        # whether the warm-up was checked against a stored background model
+        self._warmup_resolved = False
+
+        # Background model persistence. The learned background is stored per
+        # camera and ROI so a restart can seed a fresh subtractor instead of
+        # relearning the scene from scratch.
+        self.persist_background = params.get("persist_background", True)
+        self.background_state_dir: Optional[Path] = None
+        state_dir = params.get("background_state_dir")
+        if state_dir is None:
+            service = get_config_service()
+            if service is not None:
+                storage_paths = (
+                    service.get("data_storage.storage_paths", dict, {}) or {}
+                )
+                cache_dir = storage_paths.get(
+                    "cache", str(Path(storage_paths.get("base", "data")) / "cache")
+                )
+                state_dir = str(Path(cache_dir) / "motion_background")
+        if state_dir is not None:
+            self.background_state_dir = Path(state_dir)
+        self.background_seed_frames = max(
+            1, int(params.get("background_seed_frames", 5))
+        )
+        self.background_save_interval_s = params.get("background_save_interval_s", 300)
+        self.background_state_max_age_s = params.get(
+            "background_state_max_age_s", 24 * 3600
+        )
+        self._bg_state_key: Optional[str] = None
+        self._bg_model_frames = 0
+        self._bg_last_save = time.monotonic()
+
+        # Motion heatmap: the post-processed mask is downscaled and summed into
+        # a small float32 accumulator; colorizing happens only on request.
+        self.heatmap_enabled = params.get("heatmap_enabled", True)
+        self.heatmap_scale = float(params.get("heatmap_scale", 0.25))
+        if not 0 < self.heatmap_scale <= 1:
+            warning(
+                "heatmap_scale must be in (0, 1], using default",
+                controller_id=self.controller_id,
+                value=self.heatmap_scale,
+            )
+            self.heatmap_scale = 0.25
+        self.heatmap_decay = float(params.get("heatmap_decay", 0.0))
+        self._heatmap: Optional[np.ndarray] = None
+        self._heatmap_frames = 0
 
         # Optional region of interest for motion analysis
         self._roi_x: int = 0
@@ -255,15 +365,23 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
         # Background subtractor
         self._bg_subtractor: Optional[cv2.BackgroundSubtractor] = None
         self._frame_count = 0
-        self._last_frame: Optional[np.ndarray] = None
+        # latest frame/mask; the strong references behind the weak handles
+        # in results, counted against the global memory budget
+        self._latest_images = BudgetedCache(f"{controller_id}.latest_images")
+        # (monotonic end time, analysis duration s) of recent self-captured frames
+        self._analysis_samples: deque[Tuple[float, float]] = deque(
+            maxlen=self.STATS_WINDOW
+        )
         self._frame_size: Optional[Tuple[int, int]] = None
+        # shape of the converted frame before the ROI crop (capture resolution
+        # and colour format) the background model was trained on
+        self._source_shape: Optional[Tuple[int, ...]] = None
 
         # Statistics
         self._max_history = params.get("max_history", 100)
-        self._motion_history: Deque[dict[str, Any]] = deque(maxlen=self._max_history)
-        self._motion_history_motion_count: int = 0
-        self._recent_motion_flags: Deque[bool] = deque(maxlen=self.multi_frame_window)
-        self._recent_motion_count: int = 0
+        self._motion_history = MotionHistory(
+            self._max_history, recent_window=self.multi_frame_window
+        )
 
         # Lock to protect shared state in async processing
         self._state_lock = asyncio.Lock()
@@ -334,6 +452,12 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
                     algorithm=self.algorithm,
                 )
                 return False
+            # The stored model for the current camera/ROI is restored lazily
+            # once the first frame reveals its shape.
+            self._bg_state_key = None
+            self._bg_model_frames = 0
+            # spawn and warm the analysis workers while the camera opens
+            self._motion_pool.start(wait=False)
 
             info(
                 f"Initialized motion detection controller with {self.algorithm} algorithm",
@@ -360,6 +484,9 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
         self, image_data: Any, metadata: Dict[str, Any]
     ) -> ControllerResult:
         """Process image for motion detection"""
+        trace = metadata.get("frame_trace")
+        if trace is not None:
+            trace.since_capture("motion_wait")
         try:
             # Convert image data to OpenCV format
             frame = self._convert_to_cv_frame(image_data)
@@ -367,6 +494,7 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
                 return ControllerResult.error_result(
                     "Failed to convert image data to OpenCV format"
                 )
+            source_shape = tuple(frame.shape)
 
             # Crop to region of interest if configured
             if self.roi_width is not None and self.roi_height is not None:
@@ -416,13 +544,27 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
                     "Background subtractor not initialized after initialization"
                 )
 
+            # Switch to (or seed) the background model of the active camera/ROI
+            state_key = self._background_state_key()
+            if state_key != self._bg_state_key:
+                await self._switch_background_state(state_key, frame, source_shape)
+            self._source_shape = source_shape
+
             # Apply background subtraction
+            subtract_start = time.monotonic_ns()
             fg_mask = self._bg_subtractor.apply(frame, learningRate=self.learning_rate)
+            self._bg_model_frames += 1
 
             # Post-process the mask
             processed_mask = self._post_process_mask(fg_mask)
+            if self.heatmap_enabled:
+                self._accumulate_heatmap(processed_mask)
+
+            if trace is not None:
+                trace.span("motion_subtract", subtract_start)
 
             # Offload heavy analysis to dedicated process pool
+            pool_start = time.monotonic_ns()
             motion_result = await self._motion_pool.submit_async(
                 analyze_motion,
                 processed_mask,
@@ -432,6 +574,9 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
                 motion_threshold_percentage=self.motion_threshold_percentage,
                 confidence_threshold=self.confidence_threshold,
             )
+            post_start = time.monotonic_ns()
+            if trace is not None:
+                trace.span("motion_pool", pool_start, post_start)
 
             # Adjust bbox and center to original frame coordinates when ROI is active
             if (
@@ -462,9 +607,10 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
                 if self.multi_frame_enabled:
                     probability = motion_result.confidence
                     if self.multi_frame_method == "threshold":
-                        if len(self._recent_motion_flags) >= self.multi_frame_window:
+                        history = self._motion_history
+                        if history.recent_count >= self.multi_frame_window:
                             probability = (
-                                self._recent_motion_count / self.multi_frame_window
+                                history.recent_motion_count / self.multi_frame_window
                             )
                         if probability < self.multi_frame_threshold:
                             motion_result.motion_detected = False
@@ -477,24 +623,46 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
                             self._multi_frame_avg >= self.multi_frame_threshold
                         )
 
-                # Attach frame and mask for optional visualization
-                motion_result.frame = frame
-                motion_result.motion_mask = processed_mask
+                # Results carry only weak handles to the images unless debug
+                # images were requested, so retained outputs stay small
+                if self.attach_debug_images:
+                    motion_result.frame = frame
+                    motion_result.motion_mask = processed_mask
+                else:
+                    motion_result.frame = None
+                    motion_result.motion_mask = None
 
                 # Update frame count and last frame
                 self._frame_count += 1
-                self._last_frame = frame
+                self._latest_images["frame"] = frame
+                self._latest_images["mask"] = processed_mask
+                if not self.attach_debug_images:
+                    # handles follow the cached images even once compressed
+                    motion_result._frame_ref = self._latest_images.ref("frame")
+                    motion_result._mask_ref = self._latest_images.ref("mask")
 
+            if (
+                self.background_save_interval_s
+                and time.monotonic() - self._bg_last_save
+                >= self.background_save_interval_s
+            ):
+                await self.save_background_state()
+
+            result_metadata = {
+                "controller_type": "motion_detection",
+                "frame_count": self._frame_count,
+                "timestamp": metadata.get("timestamp", time.time()),
+                "source_sensor": metadata.get("source_sensor"),
+                "algorithm": self.algorithm,
+                "frame_size": self._frame_size,
+            }
+            if trace is not None:
+                end_ns = time.monotonic_ns()
+                trace.span("motion_post", post_start, end_ns)
+                trace.since_capture("motion_total", end_ns)
+                result_metadata.update(trace.as_metadata())
             return ControllerResult.success_result(
-                motion_result,
-                metadata={
-                    "controller_type": "motion_detection",
-                    "frame_count": self._frame_count,
-                    "timestamp": metadata.get("timestamp", time.time()),
-                    "source_sensor": metadata.get("source_sensor"),
-                    "algorithm": self.algorithm,
-                    "frame_size": self._frame_size,
-                },
+                motion_result, metadata=result_metadata
             )
         except Exception as e:
             error(
@@ -505,6 +673,253 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
             )
             return ControllerResult.error_result(f"Motion detection error: {e}")
 
+    # ------------------------------------------------------------------
+    # Background model persistence
+
+    def _background_state_key(self) -> str:
+        """Return the storage key for the active camera, ROI and algorithm."""
+        camera = self.webcam_id or f"device{self.device_index}"
+        if self.roi_width is not None and self.roi_height is not None:
+            roi = (
+                f"roi{int(self.roi_x)}_{int(self.roi_y)}_"
+                f"{int(self.roi_width)}x{int(self.roi_height)}"
+            )
+        else:
+            roi = "full"
+        key = f"{camera}_{roi}_{self.algorithm}"
+        return re.sub(r"[^A-Za-z0-9_.-]", "_", key)
+
+    def _background_state_params(self) -> Dict[str, Any]:
+        """Parameters a stored background model must match to be reused."""
+        return {
+            "algorithm": self.algorithm,
+            "history": self.history,
+            "var_threshold": self.var_threshold,
+            "dist2_threshold": self.dist2_threshold,
+            "detect_shadows": self.detect_shadows,
+            "rotation": self.rotation,
+        }
+
+    def _background_state_paths(self, key: str) -> Tuple[Path, Path]:
+        assert self.background_state_dir is not None
+        return (
+            self.background_state_dir / f"{key}.png",
+            self.background_state_dir / f"{key}.json",
+        )
+
+    async def save_background_state(self) -> bool:
+        """Persist the current background model for the active camera/ROI."""
+        self._bg_last_save = time.monotonic()
+        if (
+            not self.persist_background
+            or self.background_state_dir is None
+            or self._bg_subtractor is None
+            or self._bg_state_key is None
+            # Do not overwrite a good model with a barely trained one
+            or self._bg_model_frames < self.background_seed_frames
+        ):
+            return False
+        try:
+            background = await run_camera_io(self._bg_subtractor.getBackgroundImage)
+        except Exception as exc:
+            warning(
+                "Failed to read background model",
+                controller_id=self.controller_id,
+                error=str(exc),
+            )
+            return False
+        if background is None or background.size == 0:
+            return False
+
+        image_path, meta_path = self._background_state_paths(self._bg_state_key)
+        meta = {
+            "params": self._background_state_params(),
+            "shape": list(background.shape),
+            "source_shape": (
+                list(self._source_shape) if self._source_shape is not None else None
+            ),
+            "frames": self._bg_model_frames,
+            "saved_at": time.time(),
+        }
+
+        def _write() -> None:
+            image_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_image = image_path.with_suffix(".tmp.png")
+            if not cv2.imwrite(str(tmp_image), background):
+                raise OSError(f"Could not write {tmp_image}")
+            tmp_meta = meta_path.with_suffix(".tmp")
+            tmp_meta.write_text(json.dumps(meta))
+            os.replace(tmp_image, image_path)
+            os.replace(tmp_meta, meta_path)
+
+        try:
+            await run_file_io(_write)
+        except Exception as exc:
+            warning(
+                "Failed to save background model",
+                controller_id=self.controller_id,
+                path=str(image_path),
+                error=str(exc),
+            )
+            return False
+        return True
+
+    async def _read_background_meta(
+        self, key: str, source_shape: Optional[Tuple[int, ...]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return the metadata of a stored, still usable model for ``key``.
+
+        The model must have been trained on frames of ``source_shape``
+        (default: the frames currently analysed), so a resolution or colour
+        format change never reuses it.
+        """
+        if not self.persist_background or self.background_state_dir is None:
+            return None
+        image_path, meta_path = self._background_state_paths(key)
+
+        def _read() -> Optional[Dict[str, Any]]:
+            if not image_path.exists() or not meta_path.exists():
+                return None
+            return json.loads(meta_path.read_text())
+
+        try:
+            meta = await run_file_io(_read)
+        except Exception as exc:
+            warning(
+                "Failed to load background model",
+                controller_id=self.controller_id,
+                path=str(meta_path),
+                error=str(exc),
+            )
+            return None
+        if meta is None or meta.get("params") != self._background_state_params():
+            return None
+        if source_shape is None:
+            source_shape = self._source_shape
+        if source_shape is None or meta.get("source_shape") != list(source_shape):
+            return None
+        max_age = self.background_state_max_age_s
+        if max_age and time.time() - meta.get("saved_at", 0) > max_age:
+            return None
+        return meta
+
+    async def _load_background_state(
+        self, key: str, shape: Tuple[int, ...]
+    ) -> Optional[np.ndarray]:
+        """Load a stored background image compatible with ``shape``."""
+        meta = await self._read_background_meta(key)
+        if meta is None or tuple(meta.get("shape", ())) != tuple(shape):
+            return None
+        image_path, _ = self._background_state_paths(key)
+        try:
+            background = await run_file_io(
+                cv2.imread, str(image_path), cv2.IMREAD_UNCHANGED
+            )
+        except Exception as exc:
+            warning(
+                "Failed to load background model",
+                controller_id=self.controller_id,
+                path=str(image_path),
+                error=str(exc),
+            )
+            return None
+        if background is None or tuple(background.shape) != tuple(shape):
+            return None
+        return background
+
+    async def _switch_background_state(
+        self,
+        key: str,
+        frame: np.ndarray,
+        source_shape: Optional[Tuple[int, ...]] = None,
+    ) -> None:
+        """Activate the background model for ``key``, seeding it if stored."""
+        assert self._bg_subtractor is not None
+        if self._bg_state_key is not None:
+            # ROI or camera changed: keep the old model and start a fresh one
+            await self.save_background_state()
+            await self.initialize()
+            assert self._bg_subtractor is not None
+        self._bg_state_key = key
+        self._bg_model_frames = 0
+        if source_shape is not None:
+            self._source_shape = source_shape
+
+        background = await self._load_background_state(key, frame.shape)
+        if background is None:
+            return
+        subtractor = self._bg_subtractor
+
+        # Replay the stored background with a cumulative-average learning rate
+        # so every Gaussian of the fresh model converges on it.
+        def _seed() -> None:
+            for i in range(self.background_seed_frames):
+                subtractor.apply(background, learningRate=1.0 / (i + 1))
+
+        await run_camera_io(_seed)
+        self._bg_model_frames = self.background_seed_frames
+        self._warmup_counter = 0
+        info(
+            "Background model restored",
+            controller_id=self.controller_id,
+            key=key,
+        )
+
+    # ------------------------------------------------------------------
+    # Motion heatmap
+
+    def _accumulate_heatmap(self, mask: np.ndarray) -> None:
+        """Add ``mask`` to the low-resolution motion heatmap."""
+        height, width = mask.shape[:2]
+        size = (
+            max(1, int(width * self.heatmap_scale)),
+            max(1, int(height * self.heatmap_scale)),
+        )
+        if self._heatmap is None or self._heatmap.shape[::-1] != size:
+            # First frame or the analysis region changed
+            self._heatmap = np.zeros((size[1], size[0]), dtype=np.float32)
+            self._heatmap_frames = 0
+        small = cv2.resize(mask, size, interpolation=cv2.INTER_AREA)
+        if self.heatmap_decay > 0:
+            cv2.accumulateWeighted(small, self._heatmap, self.heatmap_decay)
+        else:
+            cv2.accumulate(small, self._heatmap)
+        self._heatmap_frames += 1
+
+    def reset_heatmap(self) -> None:
+        """Discard the accumulated motion heatmap."""
+        self._heatmap = None
+        self._heatmap_frames = 0
+
+    def get_heatmap(self) -> Optional[np.ndarray]:
+        """Return the motion heatmap normalized to ``[0, 1]``."""
+        if self._heatmap is None or not self._heatmap_frames:
+            return None
+        peak = float(self._heatmap.max())
+        if peak <= 0:
+            return np.zeros_like(self._heatmap)
+        return self._heatmap / peak
+
+    def render_heatmap_png(
+        self, size: Optional[Tuple[int, int]] = None
+    ) -> Optional[bytes]:
+        """Colorize the heatmap and encode it as PNG.
+
+        ``size`` optionally upscales the image to ``(width, height)``; by
+        default the analysis resolution of the accumulated masks is used.
+        """
+        heatmap = self.get_heatmap()
+        if heatmap is None:
+            return None
+        image = (heatmap * 255).astype(np.uint8)
+        if size is None and self._frame_size is not None:
+            size = self._frame_size
+        if size is not None:
+            image = cv2.resize(image, size, interpolation=cv2.INTER_LINEAR)
+        colored = cv2.applyColorMap(image, cv2.COLORMAP_JET)
+        success, buf = cv2.imencode(".png", colored)
+        return buf.tobytes() if success else None
+
     def _convert_to_cv_frame(self, image_data: Any) -> Optional[np.ndarray]:
         """Convert various image data formats to an OpenCV BGR frame"""
         try:
@@ -598,62 +1013,21 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
 
     def _update_statistics(self, result: MotionDetectionResult) -> None:
         """Update motion detection statistics"""
-        oldest: Optional[dict[str, Any]] = None
-        if len(self._motion_history) == self._motion_history.maxlen:
-            oldest = self._motion_history[0]
         self._motion_history.append(
-            {
-                "timestamp": time.time(),
-                "motion_detected": result.motion_detected,
-                "motion_percentage": result.motion_percentage,
-                "confidence": result.confidence,
-            }
+            time.time(),
+            result.motion_detected,
+            result.motion_percentage,
+            result.motion_area,
+            result.confidence,
         )
-        if result.motion_detected:
-            self._motion_history_motion_count += 1
-        if oldest and oldest.get("motion_detected"):
-            self._motion_history_motion_count -= 1
-
-        old_flag = False
-        if len(self._recent_motion_flags) == self._recent_motion_flags.maxlen:
-            old_flag = self._recent_motion_flags[0]
-        self._recent_motion_flags.append(result.motion_detected)
-        if result.motion_detected:
-            self._recent_motion_count += 1
-        if old_flag:
-            self._recent_motion_count -= 1
 
     def get_motion_statistics(self) -> Dict[str, Any]:
         """Get motion detection statistics"""
-        if not self._motion_history:
-            return {}
+        return self._motion_history.get_statistics()
 
-        motion_frames = self._motion_history_motion_count
-        detections = [h for h in self._motion_history if h["motion_detected"]]
-
-        return {
-            "total_frames": len(self._motion_history),
-            "motion_frames": motion_frames,
-            "motion_rate": motion_frames / len(self._motion_history),
-            "avg_motion_percentage": (
-                np.mean([h["motion_percentage"] for h in detections])
-                if detections
-                else 0
-            ),
-            "avg_confidence": (
-                np.mean([h["confidence"] for h in detections]) if detections else 0
-            ),
-            "last_motion_time": (
-                next(
-                    (
-                        h["timestamp"]
-                        for h in reversed(self._motion_history)
-                        if h["motion_detected"]
-                    ),
-                    None,
-                )
-            ),
-        }
+    def export_motion_history(self) -> Dict[str, np.ndarray]:
+        """Return the motion history as arrays, oldest entry first."""
+        return self._motion_history.as_arrays()
 
     async def cleanup(self) -> None:
         """Cleanup motion detection resources"""
@@ -672,12 +1046,11 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
                 break
         self._pool_manager.release_pool(ProcessPoolType.CPU, wait=True)
 
+        await self.save_background_state()
         self._bg_subtractor = None
-        self._last_frame = None
+        self._bg_state_key = None
+        self._latest_images.clear()
         self._motion_history.clear()
-        self._recent_motion_flags.clear()
-        self._motion_history_motion_count = 0
-        self._recent_motion_count = 0
         info(
             "Motion detection controller cleaned up",
             controller_id=self.controller_id,
@@ -687,7 +1060,9 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
         if not await super().start():
             return False
         self._warmup_counter = self.warmup_frames
+        self._warmup_resolved = False
         if not self.config.input_controllers:
+            get_analysis_rate_limiter().register(self.camera_io_key)
             self.start_capture()
         else:
             info(
@@ -699,25 +1074,68 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
 
     async def stop(self) -> None:
         await self.stop_capture()
+        get_analysis_rate_limiter().unregister(self.camera_io_key)
         await super().stop()
 
     async def on_capture_opened(self) -> None:
+        await self.save_background_state()
         self._bg_subtractor = None
+        self._bg_state_key = None
         self._warmup_counter = self.warmup_frames
+        self._warmup_resolved = False
 
     async def handle_frame(self, frame: Any) -> None:
+        if self._warmup_counter > 0 and not self._warmup_resolved:
+            self._warmup_resolved = True
+            # A stored model seeds the subtractor on the first processed
+            # frame, so there is nothing to warm up.
+            source = self._convert_to_cv_frame(frame)
+            if source is not None and await self._read_background_meta(
+                self._background_state_key(), tuple(source.shape)
+            ):
+                self._warmup_counter = 0
         if self._warmup_counter > 0:
             self._warmup_counter -= 1
             return
+        # Over the global analysis budget: drop this frame, keep the newest
+        if not get_analysis_rate_limiter().allow(self.camera_io_key):
+            return
+        started = time.monotonic()
         result = await self.process_image(
             frame,
             {
                 "source_sensor": self.webcam_id or "camera",
                 "timestamp": time.time(),
+                "frame_trace": self.frame_trace,
             },
         )
+        now = time.monotonic()
+        self._analysis_samples.append((now, now - started))
         if result.success:
-            self._output_cache[self.controller_id] = result.data
+            self.publish_output(result.data)
+
+    def get_analysis_stats(self) -> Dict[str, Any]:
+        """Analysis rate and latency of self-captured frames."""
+        samples = list(self._analysis_samples)
+        stats: Dict[str, Any] = {
+            "analysis_fps": 0.0,
+            "analysis_latency_ms": None,
+            **get_analysis_rate_limiter().get_stats(self.camera_io_key),
+        }
+        if samples:
+            stats["analysis_latency_ms"] = (
+                1000 * sum(d for _, d in samples) / len(samples)
+            )
+            span = samples[-1][0] - samples[0][0]
+            if span > 0:
+                stats["analysis_fps"] = (len(samples) - 1) / span
+        return stats
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        stats["capture"] = self.get_capture_stats()
+        stats["analysis"] = self.get_analysis_stats()
+        return stats
 
     async def process(self, input_data: ControllerInput) -> ControllerResult:
         output = self._output_cache.get(self.controller_id)
@@ -732,8 +1150,10 @@ class MotionDetectionController(BaseCameraCapture, ImageController):
         if settings:
             self.uvc_settings.update(settings)
         if self._capture is not None:
-            await apply_uvc_settings(
-                self._capture,
-                self.uvc_settings if settings is None else settings,
-                controller_id=self.controller_id,
-            )
+            with camera_io_context(self.camera_io_key):
+                await apply_uvc_settings(
+                    self._capture,
+                    self.uvc_settings if settings is None else settings,
+                    controller_id=self.controller_id,
+                    state=self._capture_uvc_state(self._capture),
+                )
@@ -0,0 +1,161 @@
+"""Fixed-size motion history backed by a numpy structured ring buffer."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+MOTION_HISTORY_DTYPE = np.dtype(
+    [
+        ("timestamp", np.float64),
+        ("detected", np.bool_),
+        ("percentage", np.float64),
+        ("area", np.float64),
+        ("confidence", np.float64),
+    ]
+)
+
+
+class _WindowSums:
+    """Running sums over the most recent ``size`` history entries."""
+
+    __slots__ = ("size", "count", "detected", "percentage", "confidence")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.detected = 0
+        # sums over detected entries only
+        self.percentage = 0.0
+        self.confidence = 0.0
+
+    def add(self, row: np.void, sign: int) -> None:
+        self.count += sign
+        if row["detected"]:
+            self.detected += sign
+            self.percentage += sign * float(row["percentage"])
+            self.confidence += sign * float(row["confidence"])
+
+    def recompute(self, rows: np.ndarray) -> None:
+        detected = rows["detected"]
+        self.count = len(rows)
+        self.detected = int(np.count_nonzero(detected))
+        self.percentage = float(rows["percentage"][detected].sum())
+        self.confidence = float(rows["confidence"][detected].sum())
+
+
+class MotionHistory:
+    """Ring buffer of motion results with O(1) rolling statistics.
+
+    Two sliding windows are maintained over the same preallocated buffer: the
+    full history of ``capacity`` entries and a ``recent`` window used for
+    multi-frame decisions.  Appending updates both running sums in constant
+    time; they are recomputed from the buffer once per wrap-around to keep
+    floating point drift bounded.
+    """
+
+    def __init__(self, capacity: int, recent_window: int = 1) -> None:
+        self.capacity = max(1, int(capacity))
+        self.recent_window = max(1, int(recent_window))
+        self._size = max(self.capacity, self.recent_window)
+        self._buffer = np.zeros(self._size, dtype=MOTION_HISTORY_DTYPE)
+        self._history = _WindowSums(self.capacity)
+        self._recent = _WindowSums(self.recent_window)
+        self._appended = 0
+        self._last_motion_seq = -1
+        self._last_motion_time: Optional[float] = None
+
+    def __len__(self) -> int:
+        return min(self._appended, self.capacity)
+
+    def append(
+        self,
+        timestamp: float,
+        detected: bool,
+        percentage: float,
+        area: float,
+        confidence: float,
+    ) -> None:
+        seq = self._appended
+        for window in (self._history, self._recent):
+            if seq >= window.size:
+                window.add(self._buffer[(seq - window.size) % self._size], -1)
+
+        row = self._buffer[seq % self._size]
+        row["timestamp"] = timestamp
+        row["detected"] = detected
+        row["percentage"] = percentage
+        row["area"] = area
+        row["confidence"] = confidence
+        self._history.add(row, 1)
+        self._recent.add(row, 1)
+        if detected:
+            self._last_motion_seq = seq
+            self._last_motion_time = timestamp
+        self._appended = seq + 1
+
+        if self._appended % self._size == 0:
+            self._history.recompute(self._tail(self.capacity))
+            self._recent.recompute(self._tail(self.recent_window))
+
+    def clear(self) -> None:
+        self._appended = 0
+        self._history.reset()
+        self._recent.reset()
+        self._last_motion_seq = -1
+        self._last_motion_time = None
+
+    def _tail(self, n: int) -> np.ndarray:
+        """Return the last ``n`` entries in chronological order (a copy)."""
+        n = min(n, self._appended)
+        indices = np.arange(self._appended - n, self._appended) % self._size
+        return self._buffer[indices]
+
+    # ------------------------------------------------------------------
+    @property
+    def recent_count(self) -> int:
+        return self._recent.count
+
+    @property
+    def recent_motion_count(self) -> int:
+        return self._recent.detected
+
+    @property
+    def motion_count(self) -> int:
+        return self._history.detected
+
+    @property
+    def last_motion_time(self) -> Optional[float]:
+        if self._appended - self._last_motion_seq > self.capacity:
+            return None
+        return self._last_motion_time
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Summary statistics over the full history window."""
+        total = self._history.count
+        if not total:
+            return {}
+        motion = self._history.detected
+        return {
+            "total_frames": total,
+            "motion_frames": motion,
+            "motion_rate": motion / total,
+            "avg_motion_percentage": (
+                self._history.percentage / motion if motion else 0
+            ),
+            "avg_confidence": self._history.confidence / motion if motion else 0,
+            "last_motion_time": self.last_motion_time,
+            "recent_frames": self._recent.count,
+            "recent_motion_rate": (
+                self._recent.detected / self._recent.count if self._recent.count else 0
+            ),
+        }
+
+    def as_arrays(self) -> Dict[str, np.ndarray]:
+        """Export the history as one array per field, oldest entry first."""
+        rows = self._tail(self.capacity)
+        return {name: rows[name] for name in MOTION_HISTORY_DTYPE.names or ()}
@@ -22,20 +22,26 @@ if __name__ == "__main__" and __package__ is None:
 import asyncio
 import contextlib
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Type, cast
+from typing import Any, Dict, Optional, Tuple, Type, cast
 import re
 
 import cv2
 import numpy as np
 from fastapi import Request
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from nicegui import app, ui
 
 from src.controllers import controller_manager as controller_manager_module
 from src.controllers.webcam import MotionDetectionController
 from src.controllers.controller_base import ControllerConfig, ControllerStatus
 from src.controllers.controller_manager import ControllerManager
-from src.controllers.camera_utils import probe_camera_modes
+from src.controllers.camera_utils import (
+    camera_identity,
+    enumerate_cameras,
+    load_cached_camera_modes,
+    probe_camera_modes,
+    store_camera_modes,
+)
 from src.controllers.webcam import CameraCaptureController
 from src.core.experiment_manager import (
     ExperimentConfig,
@@ -68,7 +74,7 @@ from src.utils.concurrency.async_utils import install_signal_handlers
 from src.utils.config_service import ConfigurationService, set_config_service
 from src.gui.ui_helpers import notify_later
 from src.gui.utils import generate_mjpeg_stream
-from src.utils.log_service import info, warning, error
+from src.utils.log_service import debug, info, warning, error
 from src.controllers.roi_utils import clamp_roi, rotate_roi
 
 # Maximum frames per second for the MJPEG video feed
@@ -150,6 +156,7 @@ class SimpleGUIApplication:
         self._processing_task: Optional[asyncio.Task] = None
         self._alert_task: Optional[asyncio.Task] = None
         self._motion_task: Optional[asyncio.Task] = None
+        self._camera_probe_task: Optional[asyncio.Task] = None
         self.supported_camera_modes: list[tuple[int, int, int]] = []
         self._last_motion_time: datetime = datetime.now()
 
@@ -728,32 +735,40 @@ class SimpleGUIApplication:
         self._update_uvc_setting("exposure", value)
 
     async def scan_cameras(self):
-        """Scan for connected camera devices."""
-        # The simplified implementation always exposes a single camera with
-        # index ``0``. The UI elements for scanning and device selection remain
-        # intact but will only ever show this one option.
-        devices = ["0"]
+        """Scan for connected camera devices.
+
+        Devices are listed from sysfs metadata so cameras are never opened
+        (or disturbed while streaming) just to be discovered.  Where sysfs is
+        unavailable a single camera with index ``0`` is assumed.
+        """
+        cameras = await run_in_executor(enumerate_cameras)
+        devices = [str(cam.index) for cam in cameras] or ["0"]
 
         if self.webcam_stream:
             self.webcam_stream.update_devices(devices)
 
-        notify_later("Found 1 camera", type="positive")
+        count = len(devices)
+        notify_later(
+            f"Found {count} camera{'s' if count != 1 else ''}", type="positive"
+        )
 
     def select_camera(self, e):
         """Select the active camera device.
 
-        The new implementation ignores the provided value and always selects
-        camera index ``0``. Existing controllers are updated accordingly so the
-        rest of the application continues to operate as before.
+        Existing controllers are pointed at the chosen index; the device is
+        only opened when capture is (re)started.
         """
 
-        index = 0
+        try:
+            index = int(getattr(e, "value", 0) or 0)
+        except (TypeError, ValueError):
+            index = 0
         self.settings["device_index"] = index
         if self.camera_controller:
             self.camera_controller.device_index = index
         if self.motion_controller:
             self.motion_controller.device_index = index
-        notify_later("Camera device set to 0", type="positive")
+        notify_later(f"Camera device set to {index}", type="positive")
 
     def set_roi(self):
         """Set region of interest"""
@@ -927,6 +942,9 @@ class SimpleGUIApplication:
             self._current_experiment_id = exp_id
             self.experiment_running = True
             self._experiment_start = datetime.now()
+            # The motion heatmap covers the running experiment only
+            if self.motion_controller is not None:
+                self.motion_controller.reset_heatmap()
             self.experiment_section.start_experiment_btn.disable()
             self.experiment_section.stop_experiment_btn.enable()
             self.experiment_section.experiment_icon.classes("text-green-600")
@@ -1193,7 +1211,9 @@ class SimpleGUIApplication:
             output = self.camera_controller.get_output()
             frame = None
             if isinstance(output, dict):
-                frame = output.get("frame") or output.get("image")
+                frame = output.get("frame")
+                if frame is None:
+                    frame = output.get("image")
             elif output is not None:
                 frame = output
             if frame is not None:
@@ -1361,13 +1381,28 @@ class SimpleGUIApplication:
                 error("alert_check_failed", exc_info=exc)
 
     async def _processing_loop(self) -> None:
-        """Continuously process controller data."""
+        """Run the controller graph.
+
+        The default ``polling`` mode processes the whole graph every
+        ``processing_interval_ms``; in ``reactive`` mode controllers only run
+        when an upstream controller publishes new output.
+        """
+        mode = self.config_service.get(
+            "controller_manager.execution_mode", str, "polling"
+        )
+        if mode == "reactive":
+            try:
+                await self.controller_manager.run_reactive()
+            except asyncio.CancelledError:
+                pass
+            return
+
+        interval_ms = self.config_service.get(
+            "controller_manager.processing_interval_ms", int, 30
+        )
+        interval = max(0.001, interval_ms / 1000.0)
         while True:
             try:
-                interval_ms = self.config_service.get(
-                    "controller_manager.processing_interval_ms", int, 30
-                )
-                interval = max(0.001, interval_ms / 1000.0)
                 await asyncio.sleep(interval)
                 await self.controller_manager.process_data({})
             except asyncio.CancelledError:
@@ -1475,15 +1510,19 @@ class SimpleGUIApplication:
                         )
                     self.update_camera_status(True)
 
-            async def frame_source() -> Optional[np.ndarray]:
-                frame = None
+            async def frame_source() -> Tuple[Optional[np.ndarray], Any]:
+                # read frame and trace in one step so they always match
+                frame, trace = None, None
                 if self.camera_controller is not None:
                     output = self.camera_controller.get_output()
+                    trace = getattr(self.camera_controller, "frame_trace", None)
                     if isinstance(output, dict):
-                        frame = output.get("frame") or output.get("image")
+                        frame = output.get("frame")
+                        if frame is None:
+                            frame = output.get("image")
                     elif output is not None:
                         frame = output
-                return frame
+                return frame, trace
 
             try:
                 stream_gen = generate_mjpeg_stream(
@@ -1525,17 +1564,109 @@ class SimpleGUIApplication:
                 media_type="multipart/x-mixed-replace; boundary=frame",
             )
 
+        @ui.page("/motion_heatmap")
+        async def motion_heatmap(controller_id: str = "motion_detection"):
+            controller = self.controller_manager.get_controller(controller_id)
+            if not isinstance(controller, MotionDetectionController):
+                return JSONResponse(
+                    {"detail": f"Unknown motion controller {controller_id}"},
+                    status_code=404,
+                )
+            png = await run_in_executor(controller.render_heatmap_png)
+            if png is None:
+                return JSONResponse(
+                    {"detail": "No motion heatmap available yet"}, status_code=404
+                )
+            return Response(content=png, media_type="image/png")
+
+    def _camera_identity(self) -> str:
+        controller = self.camera_controller
+        return camera_identity(
+            getattr(controller, "device_index", 0) if controller else 0,
+            getattr(controller, "capture_backend", None) if controller else None,
+        )
+
+    def _set_camera_modes(self, modes: list[tuple[int, int, int]]) -> None:
+        self.supported_camera_modes = modes
+        if getattr(self, "webcam_stream", None):
+            self.webcam_stream.available_resolutions = modes
+            self.webcam_stream.update_resolutions(modes)
+
+    def _device_streaming(self, device_index: int) -> bool:
+        for controller in (self.camera_controller, self.motion_controller):
+            if (
+                controller is not None
+                and getattr(controller, "device_index", None) == device_index
+                and getattr(controller, "is_streaming", False)
+            ):
+                return True
+        return False
+
+    async def refresh_camera_modes(self) -> list[tuple[int, int, int]]:
+        """Probe the camera for supported modes and update the probe cache.
+
+        Successful results are stored under the camera's identity so later
+        startups skip probing until a different device is attached.  A device
+        that is already streaming is never reopened for probing; its current
+        mode is offered until a later startup can probe it.
+        """
+        controller = self.camera_controller
+        if controller is not None and self._device_streaming(
+            getattr(controller, "device_index", 0)
+        ):
+            debug("Skipping camera mode probe: device is streaming")
+            modes = [
+                (
+                    int(controller.width or 640),
+                    int(controller.height or 480),
+                    int(controller.fps or 30),
+                )
+            ]
+            self._set_camera_modes(modes)
+            return modes
+        if getattr(controller, "source", None):
+            # synthetic and file sources deliver whatever they are set to
+            modes = [
+                (
+                    int(controller.width or 640),
+                    int(controller.height or 480),
+                    int(controller.fps or 30),
+                )
+            ]
+            self._set_camera_modes(modes)
+            return modes
+        try:
+            modes = await probe_camera_modes(
+                getattr(controller, "device_index", 0) if controller else 0,
+                capture_backend=(
+                    getattr(controller, "capture_backend", None) if controller else None
+                ),
+                fallback=False,
+            )
+        except Exception as exc:
+            warning("Camera mode probe failed", error=str(exc))
+            modes = []
+        if modes:
+            await store_camera_modes(self._camera_identity(), modes)
+        else:
+            modes = [(640, 480, 30)]
+        self._set_camera_modes(modes)
+        return modes
+
     async def startup(self) -> None:
         """Start controllers and processing loop"""
         install_signal_handlers(self.experiment_manager._task_manager)
-        try:
-            self.supported_camera_modes = await probe_camera_modes()
-        except Exception:
-            self.supported_camera_modes = []
+        force_probe = self.config_service.get("camera_probe.force", bool, False)
+        cached = None
+        if not force_probe:
+            try:
+                cached = await load_cached_camera_modes(self._camera_identity())
+            except Exception:
+                cached = None
+        if cached:
+            self._set_camera_modes(cached)
 
         if getattr(self, "webcam_stream", None):
-            self.webcam_stream.available_resolutions = self.supported_camera_modes
-            self.webcam_stream.update_resolutions(self.supported_camera_modes)
             await self.scan_cameras()
 
         if self.camera_controller is not None:
@@ -1546,6 +1677,19 @@ class SimpleGUIApplication:
                 return
 
         success = await self.controller_manager.start_all_controllers()
+        if (
+            self.camera_controller is not None
+            and self.camera_controller.status != ControllerStatus.RUNNING
+            and hasattr(self.camera_controller, "cleanup_capture")
+        ):
+            # release a handle the access test kept for a camera that never ran
+            with contextlib.suppress(Exception):
+                await self.camera_controller.cleanup_capture()
+
+        if not cached:
+            # Probe in the background once controllers run; devices that are
+            # already streaming are not reopened.
+            self._camera_probe_task = asyncio.create_task(self.refresh_camera_modes())
 
         if success:
             self._processing_task = asyncio.create_task(self._processing_loop())
@@ -1583,6 +1727,11 @@ class SimpleGUIApplication:
             with contextlib.suppress(Exception):
                 await self._motion_task
             self._motion_task = None
+        if self._camera_probe_task:
+            self._camera_probe_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._camera_probe_task
+            self._camera_probe_task = None
         if self._experiment_timer:
             try:
                 self._experiment_timer.cancel()
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from typing import Any, Awaitable, Callable, AsyncIterator, Optional
 
 import cv2
@@ -16,7 +17,13 @@ async def generate_mjpeg_stream(
     request: Optional[Any] = None,
     timeout: float = 3.0,
 ) -> AsyncIterator[bytes]:
-    """Yield JPEG encoded frames from ``frame_source`` for MJPEG streaming."""
+    """Yield JPEG encoded frames from ``frame_source`` for MJPEG streaming.
+
+    ``frame_source`` returns a frame or a ``(frame, trace)`` pair read
+    together from the capture; with a trace, the wait before encoding, the
+    encode, the socket write and the total capture-to-display latency are
+    recorded once per captured frame.
+    """
 
     last_sent = 0.0
     fps_cap = max(float(fps_cap), 1.0)
@@ -24,6 +31,7 @@ async def generate_mjpeg_stream(
     no_frame_start: Optional[float] = None
     placeholder_bytes: Optional[bytes] = None
     placeholder_mode = False
+    last_seq: Optional[int] = None
 
     while True:
         if request is not None:
@@ -33,20 +41,36 @@ async def generate_mjpeg_stream(
             except asyncio.CancelledError:
                 break
 
-        frame = await frame_source()
+        frame, trace = await frame_source(), None
+        if isinstance(frame, tuple):
+            frame, trace = frame
         now = asyncio.get_running_loop().time()
         if frame is not None:
             no_frame_start = None
             placeholder_mode = False
             if interval <= 0 or now - last_sent >= interval:
+                if trace is not None and trace.seq == last_seq:
+                    trace = None  # already measured when first sent
+                encode_start = time.monotonic_ns()
+                if trace is not None:
+                    trace.since_capture("stream_wait", encode_start)
                 success, buf = await run_camera_io(cv2.imencode, ".jpg", frame)
                 if success:
                     jpeg = buf.tobytes()
+                    write_start = time.monotonic_ns()
+                    if trace is not None:
+                        trace.span("stream_encode", encode_start, write_start)
                     yield (
                         b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
                         + jpeg
                         + b"\r\n"
                     )
+                    # the response resumes us once the chunk has been sent
+                    if trace is not None:
+                        written = time.monotonic_ns()
+                        trace.span("stream_write", write_start, written)
+                        trace.since_capture("display_total", written)
+                        last_seq = trace.seq
                     last_sent = now
         else:
             if no_frame_start is None:
@@ -50,6 +50,7 @@ from .thread_pool import (
     run_file_io,
     run_network_io,
     thread_pool_context,
+    camera_io_context,
 )
 
 __all__ = [
@@ -80,6 +81,7 @@ __all__ = [
     "run_file_io",
     "run_network_io",
     "thread_pool_context",
+    "camera_io_context",
     # submodules
     "async_utils",
     "process_pool",
@@ -7,22 +7,42 @@ Changelog
   `kill_on_timeout=True`.
 * `scale_workers` avoids resizing while tasks are running,
   unless `force_shutdown=True`.
+* Workers can run an `initializer` and be started eagerly
+  (`prestart=True` or `start()`); `submit_async_detailed` reports
+  whether a task ran on a warm worker.
+* `map_async`/`submit_batch` send many small calls in chunks, with
+  per-chunk timeouts and per-item telemetry.
+* Pools take `process_pool.*` settings from the application container and
+  recycle their workers after `max_tasks_per_worker` tasks or above
+  `max_worker_rss_mb`.
+* A raising `initializer` leaves its worker cold instead of breaking the
+  pool, and an executor broken by a dying worker is replaced on next submit.
 """
 
 from __future__ import annotations
 
 import asyncio
+import math
 import multiprocessing as mp
 import os
+import queue
 import signal
 import threading
+import time
+from collections import deque
 from concurrent.futures import Future, ProcessPoolExecutor
-from dataclasses import dataclass
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Callable, Iterable, Mapping
 
 from utils.log_service import info, warning
 
+try:
+    import psutil  # type: ignore
+except Exception:  # pragma: no cover
+    psutil = None  # type: ignore
+
 
 class ProcessPoolType(Enum):
     DEFAULT = "default"
@@ -36,6 +56,25 @@ class ProcessPoolConfig:
     timeout: float | None = None
     kill_on_timeout: bool = False
     kill_signal: int = signal.SIGTERM
+    # run once in every worker before its first task, e.g. to import and
+    # exercise heavy modules
+    initializer: Callable[..., Any] | None = None
+    initargs: tuple = ()
+    # spawn and initialise all workers when the pool is created
+    prestart: bool = False
+    # replace the workers once one of them ran this many tasks or its
+    # resident memory (sampled every rss_sample_interval_s) exceeds the limit
+    max_tasks_per_worker: int | None = None
+    max_worker_rss_mb: float | None = None
+    rss_sample_interval_s: float = 5.0
+
+
+@dataclass
+class PoolTaskResult:
+    value: Any
+    warm: bool  # the worker had been initialised or had run a task before
+    worker_pid: int
+    wall_time: float
 
 
 @dataclass
@@ -47,11 +86,69 @@ class _Telemetry:
     timed_out: int = 0
     active: int = 0
     total_wall_time: float = 0.0
+    warm_tasks: int = 0
+    cold_tasks: int = 0
+    workers_started: int = 0
+    init_failures: int = 0
+    chunks: int = 0
+    recycled: int = 0
 
     def inc(self, field: str) -> None:
         setattr(self, field, getattr(self, field) + 1)
 
 
+# ───────── Worker side ─────────
+_worker_warm = False
+
+
+def _init_worker(
+    ready: Any, initializer: Callable[..., Any] | None, initargs: tuple
+) -> None:
+    global _worker_warm
+    ok = True
+    if initializer is not None:
+        # an exception here would break the whole executor; the worker
+        # stays cold instead and its first task pays the start-up cost
+        try:
+            initializer(*initargs)
+        except Exception as exc:
+            ok = False
+            warning("process_pool_initializer_failed", pid=os.getpid(), error=repr(exc))
+        else:
+            _worker_warm = True
+    ready.put((os.getpid(), ok))
+
+
+def _run_task(
+    func: Callable[..., Any], args: tuple, kwargs: dict
+) -> tuple[Any, bool, int]:
+    global _worker_warm
+    warm = _worker_warm
+    result = func(*args, **kwargs)
+    _worker_warm = True
+    return result, warm, os.getpid()
+
+
+def _run_chunk(
+    func: Callable[..., Any], chunk: list[tuple]
+) -> tuple[list[tuple[bool, Any]], bool, int]:
+    """Call ``func(*args)`` for every item, capturing errors per item."""
+    global _worker_warm
+    warm = _worker_warm
+    outcomes: list[tuple[bool, Any]] = []
+    for args in chunk:
+        try:
+            outcomes.append((True, func(*args)))
+        except Exception as exc:
+            outcomes.append((False, exc))
+    _worker_warm = True
+    return outcomes, warm, os.getpid()
+
+
+def _noop() -> None:
+    pass
+
+
 class ManagedProcessPool:
     def __init__(
         self,
@@ -66,29 +163,148 @@ class ManagedProcessPool:
         self._closed = False
         self._telemetry = _Telemetry()
         self._telemetry_lock = threading.Lock()
+        # workers of the current executor report their PID once initialised
+        self._ready: Any = None
+        self._ready_workers = 0
+        # start-up no-ops of the current executor; one failing means a
+        # worker died before it could report ready
+        self._spawned: list[Future] = []
+        # executor generation and per-worker task counts / RSS within it
+        self._generation = 0
+        self._workers: dict[int, dict[str, Any]] = {}
+        if config.prestart:
+            self.start(wait=False)
+
+    # ───────── Start-up ─────────
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._ready = mp.get_context().Queue()
+                self._ready_workers = 0
+                self._spawned = []
+                self._generation += 1
+                self._workers = {}
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    initializer=_init_worker,
+                    initargs=(
+                        self._ready,
+                        self.config.initializer,
+                        tuple(self.config.initargs),
+                    ),
+                )
+                if self.config.prestart:
+                    self._spawn_workers(self._executor)
+            return self._executor
+
+    def _spawn_workers(self, executor: ProcessPoolExecutor) -> None:
+        # A submit spawns a worker whenever none is idle (fork spawns all of
+        # them at once), so one no-op per worker starts the whole pool.
+        self._spawned += [executor.submit(_noop) for _ in range(self._max_workers)]
+
+    def start(self, wait: bool = True, timeout: float | None = None) -> int:
+        """Spawn all workers and run the initializer in each of them.
+
+        With ``wait`` blocks until every worker reported ready or
+        ``timeout`` expired.  Returns the number of workers started so far.
+        """
+        if self._closed:
+            raise RuntimeError("Pool closed")
+        with self._lock:
+            fresh = self._executor is None
+        executor = self._get_executor()
+        self._collect_ready()
+        if (not fresh or not self.config.prestart) and (
+            self._ready_workers < self._max_workers
+        ):
+            self._spawn_workers(executor)
+        if wait:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while self._ready_workers < self._max_workers:
+                remaining = 0.1
+                if deadline is not None:
+                    remaining = min(remaining, deadline - time.monotonic())
+                if remaining <= 0 or self._spawn_failed():
+                    break
+                self._collect_ready(timeout=remaining)
+        return self._ready_workers
+
+    def _spawn_failed(self) -> bool:
+        return any(
+            f.done() and not f.cancelled() and f.exception() is not None
+            for f in self._spawned
+        )
+
+    def _collect_ready(self, timeout: float = 0.0) -> None:
+        """Count workers that finished their initializer."""
+        ready = self._ready
+        if ready is None:
+            return
+        try:
+            while True:
+                if timeout > 0:
+                    _, ok = ready.get(timeout=timeout)
+                    timeout = 0.0
+                else:
+                    _, ok = ready.get_nowait()
+                with self._telemetry_lock:
+                    self._ready_workers += 1
+                    self._telemetry.workers_started += 1
+                    if not ok:
+                        self._telemetry.init_failures += 1
+        except queue.Empty:
+            pass
 
     # ───────── Submission ─────────
     def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
         if self._closed:
             raise RuntimeError("Pool closed")
-        if self._executor is None:
-            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
         with self._telemetry_lock:
             self._telemetry.inc("submitted")
             self._telemetry.active += 1
-        fut = self._executor.submit(func, *args, **kwargs)
+        try:
+            fut = self._executor_submit(func, *args, **kwargs)
+        except BaseException:
+            with self._telemetry_lock:
+                self._telemetry.active -= 1
+                self._telemetry.inc("failed")
+            raise
         fut.add_done_callback(self._on_done)
         return fut
 
+    def _executor_submit(
+        self, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Future:
+        """Submit to the current executor, replacing it once if it broke."""
+        executor = self._get_executor()
+        try:
+            return executor.submit(func, *args, **kwargs)
+        except BrokenProcessPool:
+            # a worker died abruptly; its tasks already failed
+            self._discard_executor(executor)
+            return self._get_executor().submit(func, *args, **kwargs)
+
     async def submit_async(
         self, func: Callable[..., Any], *args: Any, **kwargs: Any
     ) -> Any:
-        fut = self.submit(func, *args, **kwargs)
+        result = await self.submit_async_detailed(func, *args, **kwargs)
+        return result.value
+
+    async def submit_async_detailed(
+        self, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> PoolTaskResult:
+        """Like :meth:`submit_async` but also report the worker's warmth."""
+        start = time.perf_counter()
+        fut = self.submit(_run_task, func, args, kwargs)
+        generation = self._generation
         wrapped: asyncio.Future[Any] = asyncio.wrap_future(fut)
         try:
             if self.config.timeout is not None:
-                return await asyncio.wait_for(wrapped, timeout=self.config.timeout)
-            return await wrapped
+                value, warm, pid = await asyncio.wait_for(
+                    wrapped, timeout=self.config.timeout
+                )
+            else:
+                value, warm, pid = await wrapped
         except asyncio.TimeoutError:
             with self._telemetry_lock:
                 self._telemetry.inc("timed_out")
@@ -104,6 +320,272 @@ class ManagedProcessPool:
             fut.cancel()
             # Pool remains intact
             raise
+        wall_time = time.perf_counter() - start
+        with self._telemetry_lock:
+            self._telemetry.inc("warm_tasks" if warm else "cold_tasks")
+            self._telemetry.total_wall_time += wall_time
+        self._after_tasks(generation, pid, 1)
+        return PoolTaskResult(value, warm, pid, wall_time)
+
+    # ───────── Batches ─────────
+    async def map_async(
+        self,
+        func: Callable[[Any], Any],
+        iterable: Iterable[Any],
+        *,
+        chunksize: int | None = None,
+        ordered: bool = True,
+        timeout: float | None = None,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Any]:
+        """Yield ``func(item)`` for every item, computed in chunks.
+
+        Results stream in input order, or as chunks finish with
+        ``ordered=False``.  ``chunksize`` defaults to spreading the items
+        over four chunks per worker.  ``timeout`` (default
+        ``config.timeout``) bounds every chunk; at most one chunk per worker
+        is in flight, including timed-out chunks that are still running, so
+        the clock starts when a worker is free.  A failed
+        item raises when it is reached unless ``return_exceptions`` is set,
+        in which case the exception is yielded instead.
+        """
+        async for _, value in self._stream_chunks(
+            func,
+            [(item,) for item in iterable],
+            chunksize,
+            ordered,
+            timeout,
+            return_exceptions,
+        ):
+            yield value
+
+    async def submit_batch(
+        self,
+        func: Callable[..., Any],
+        args_list: Iterable[tuple],
+        *,
+        chunksize: int | None = None,
+        timeout: float | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Return ``[func(*args) for args in args_list]`` computed in chunks."""
+        items = list(args_list)
+        results: list[Any] = [None] * len(items)
+        async for index, value in self._stream_chunks(
+            func, items, chunksize, False, timeout, return_exceptions
+        ):
+            results[index] = value
+        return results
+
+    async def _stream_chunks(
+        self,
+        func: Callable[..., Any],
+        items: list[tuple],
+        chunksize: int | None,
+        ordered: bool,
+        timeout: float | None,
+        return_exceptions: bool,
+    ) -> AsyncIterator[tuple[int, Any]]:
+        if not items:
+            return
+        if self._closed:
+            raise RuntimeError("Pool closed")
+        timeout = self.config.timeout if timeout is None else timeout
+        size = chunksize or math.ceil(len(items) / (self._max_workers * 4))
+        queued = deque(
+            (start, items[start : start + size]) for start in range(0, len(items), size)
+        )
+        # wrapped future -> (first index, items, executor future, submitted at,
+        # executor generation)
+        in_flight: dict[asyncio.Future[Any], tuple[int, int, Future, float, int]] = {}
+        # timed-out chunks cannot be cancelled once running and keep their
+        # worker busy until they return: wrapped future -> executor generation
+        stalled: dict[asyncio.Future[Any], int] = {}
+        buffered: dict[int, tuple[bool, Any]] = {}
+        next_index = 0
+        try:
+            while queued or in_flight:
+                for wrapped, generation in list(stalled.items()):
+                    if wrapped.done() or generation != self._generation:
+                        del stalled[wrapped]
+                while queued and len(in_flight) + len(stalled) < self._max_workers:
+                    start, chunk = queued.popleft()
+                    fut = self._submit_chunk(func, chunk)
+                    in_flight[asyncio.wrap_future(fut)] = (
+                        start,
+                        len(chunk),
+                        fut,
+                        time.monotonic(),
+                        self._generation,
+                    )
+                if not in_flight:
+                    # every worker is still busy with a timed-out chunk
+                    await asyncio.wait(stalled, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+                wait_for = None
+                if timeout is not None:
+                    oldest = min(entry[3] for entry in in_flight.values())
+                    wait_for = max(0.0, oldest + timeout - time.monotonic())
+                done, _ = await asyncio.wait(
+                    in_flight, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED
+                )
+                now = time.monotonic()
+                for wrapped, entry in list(in_flight.items()):
+                    start, count, fut, submitted, generation = entry
+                    if wrapped in done:
+                        outcomes = self._chunk_outcomes(wrapped, count, generation)
+                    elif timeout is not None and now - submitted >= timeout:
+                        outcomes = self._chunk_timed_out(func, fut, count, timeout)
+                        if not wrapped.done():
+                            stalled[wrapped] = generation
+                    else:
+                        continue
+                    del in_flight[wrapped]
+                    with self._telemetry_lock:
+                        self._telemetry.total_wall_time += now - submitted
+                    for offset, outcome in enumerate(outcomes):
+                        if ordered:
+                            buffered[start + offset] = outcome
+                            continue
+                        if not outcome[0] and not return_exceptions:
+                            raise outcome[1]
+                        yield start + offset, outcome[1]
+                    while next_index in buffered:
+                        ok, value = buffered.pop(next_index)
+                        if not ok and not return_exceptions:
+                            raise value
+                        yield next_index, value
+                        next_index += 1
+        finally:
+            for entry in in_flight.values():
+                entry[2].cancel()
+
+    def _submit_chunk(self, func: Callable[..., Any], chunk: list[tuple]) -> Future:
+        count = len(chunk)
+        with self._telemetry_lock:
+            self._telemetry.submitted += count
+            self._telemetry.active += count
+            self._telemetry.chunks += 1
+        try:
+            fut = self._executor_submit(_run_chunk, func, chunk)
+        except BaseException:
+            with self._telemetry_lock:
+                self._telemetry.active -= count
+                self._telemetry.failed += count
+            raise
+        fut.add_done_callback(lambda f: self._on_chunk_done(f, count))
+        return fut
+
+    def _chunk_outcomes(
+        self, wrapped: asyncio.Future[Any], count: int, generation: int
+    ) -> list[tuple[bool, Any]]:
+        if wrapped.cancelled():
+            return [(False, asyncio.CancelledError())] * count
+        exc = wrapped.exception()
+        if exc is not None:
+            # the chunk as a whole failed, e.g. a worker died
+            return [(False, exc)] * count
+        outcomes, warm, pid = wrapped.result()
+        with self._telemetry_lock:
+            self._telemetry.warm_tasks += count if warm else count - 1
+            self._telemetry.cold_tasks += 0 if warm else 1
+        self._after_tasks(generation, pid, count)
+        return outcomes
+
+    def _chunk_timed_out(
+        self, func: Callable[..., Any], fut: Future, count: int, timeout: float
+    ) -> list[tuple[bool, Any]]:
+        with self._telemetry_lock:
+            self._telemetry.timed_out += count
+        warning(f"Chunk of {func.__name__!s} timed out after {timeout}s")
+        fut.cancel()
+        if self.config.kill_on_timeout:
+            self._kill_children(sig=self.config.kill_signal)
+            self._terminate_executor()
+        error = asyncio.TimeoutError(f"chunk timed out after {timeout}s")
+        return [(False, error)] * count
+
+    # ───────── Recycling ─────────
+    def _after_tasks(self, generation: int, pid: int, count: int) -> None:
+        """Account ``count`` tasks run by worker ``pid`` and recycle if due."""
+        cfg = self.config
+        with self._lock:
+            if generation != self._generation:
+                return  # worker of an executor that is already retired
+            worker = self._workers.setdefault(
+                pid, {"tasks": 0, "rss_bytes": None, "sampled_at": 0.0}
+            )
+            worker["tasks"] += count
+            now = time.monotonic()
+            sample = now - worker["sampled_at"] >= cfg.rss_sample_interval_s
+            if sample:
+                worker["sampled_at"] = now
+        if sample and psutil is not None:
+            try:
+                rss = psutil.Process(pid).memory_info().rss
+            except Exception:
+                rss = None
+            worker["rss_bytes"] = rss
+        reason = None
+        if cfg.max_tasks_per_worker and worker["tasks"] >= cfg.max_tasks_per_worker:
+            reason = "tasks"
+        elif (
+            cfg.max_worker_rss_mb is not None
+            and worker["rss_bytes"] is not None
+            and worker["rss_bytes"] > cfg.max_worker_rss_mb * 1024 * 1024
+        ):
+            reason = "rss"
+        if reason is not None:
+            self.recycle(reason, generation)
+
+    def recycle(self, reason: str = "manual", generation: int | None = None) -> None:
+        """Replace all workers without dropping submitted tasks.
+
+        New tasks go to a fresh executor while the old one finishes the tasks
+        it already holds and then exits.  With an ``initializer`` (or
+        ``prestart``) the new workers are spawned and warmed up right away,
+        while the old ones are still draining, so the next task does not pay
+        the start-up cost.
+        """
+        with self._lock:
+            if self._executor is None or (
+                generation is not None and generation != self._generation
+            ):
+                return
+            old_exec, self._executor = self._executor, None
+            self._ready = None
+            workers = self._workers
+        with self._telemetry_lock:
+            self._telemetry.recycled += 1
+        if (self.config.prestart or self.config.initializer) and not self._closed:
+            self.start(wait=False)
+        old_exec.shutdown(wait=False)
+        info(
+            "process_pool_recycled",
+            pool=self.pool_type.value,
+            reason=reason,
+            tasks={pid: w["tasks"] for pid, w in workers.items()},
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Telemetry counters plus task count and RSS of every live worker."""
+        with self._telemetry_lock:
+            stats: dict[str, Any] = dict(vars(self._telemetry))
+        with self._lock:
+            stats["max_workers"] = self._max_workers
+            stats["generation"] = self._generation
+            stats["workers"] = {
+                pid: {
+                    "tasks": w["tasks"],
+                    "rss_mb": (
+                        w["rss_bytes"] / (1024 * 1024)
+                        if w["rss_bytes"] is not None
+                        else None
+                    ),
+                }
+                for pid, w in self._workers.items()
+            }
+        return stats
 
     # ───────── Scaling ─────────
     def scale_workers(self, max_workers: int, *, force_shutdown: bool = False) -> None:
@@ -118,6 +600,7 @@ class ManagedProcessPool:
                 return
             self._max_workers = new_max
             old_exec, self._executor = self._executor, None
+            self._ready = None
         if old_exec:
             old_exec.shutdown(wait=not force_shutdown, cancel_futures=force_shutdown)
             info("pool_scaled", new_max=new_max, force=force_shutdown)
@@ -133,9 +616,33 @@ class ManagedProcessPool:
             else:
                 self._telemetry.inc("finished")
 
+    def _on_chunk_done(self, fut: Future, count: int) -> None:
+        with self._telemetry_lock:
+            self._telemetry.active -= count
+            if fut.cancelled():
+                self._telemetry.cancelled += count
+            elif fut.exception():
+                self._telemetry.failed += count
+            else:
+                outcomes, _, _ = fut.result()
+                failed = sum(1 for ok, _ in outcomes if not ok)
+                self._telemetry.failed += failed
+                self._telemetry.finished += count - failed
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        """Drop ``executor`` if it is still current; the next call starts anew."""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self._ready = None
+        executor.shutdown(wait=False)
+        warning("process_pool_broken", pool=self.pool_type.value)
+
     def _terminate_executor(self) -> None:
         with self._lock:
             exec_, self._executor = self._executor, None
+            self._ready = None
         if exec_:
             exec_.shutdown(cancel_futures=True)
 
@@ -169,13 +676,31 @@ class ProcessPoolManager:
         self._pools: dict[ProcessPoolType, ManagedProcessPool] = {}
         self._refcounts: dict[ProcessPoolType, int] = {}
         self._lock = threading.Lock()
+        # ``process_pool.*`` configuration for settings a pool leaves unset
+        self._settings: dict[str, Any] = {}
+
+    def set_defaults(self, settings: Mapping[str, Any]) -> None:
+        """Use ``settings`` for pools created afterwards.
+
+        Keys follow the ``process_pool`` configuration section:
+        ``max_workers``, ``task_timeout_s``, ``max_tasks_per_worker`` and
+        ``max_worker_rss_mb``.
+        """
+        self._settings = {k: v for k, v in settings.items() if v is not None}
 
     def get_pool(
         self, pool_type: ProcessPoolType, *, config: ProcessPoolConfig | None = None
     ) -> ManagedProcessPool:
+        """Return the shared pool of ``pool_type``, creating it on first use.
+
+        Settings left unset in ``config`` are taken from
+        :meth:`set_defaults`.
+        """
         with self._lock:
             if pool_type not in self._pools:
-                cfg = config or self._defaults.get(pool_type, ProcessPoolConfig())
+                cfg = self._with_defaults(
+                    config or self._defaults.get(pool_type, ProcessPoolConfig())
+                )
                 self._pools[pool_type] = ManagedProcessPool(cfg, pool_type=pool_type)
                 self._refcounts[pool_type] = 1
             else:
@@ -203,6 +728,20 @@ class ProcessPoolManager:
         pool = self.get_pool(pool_type)
         return await pool.submit_async(fn, *args, **kwargs)
 
+    def _with_defaults(self, config: ProcessPoolConfig) -> ProcessPoolConfig:
+        def setting(key: str, current: Any) -> Any:
+            return current if current is not None else self._settings.get(key)
+
+        max_workers = setting("max_workers", config.max_workers)
+        max_tasks = setting("max_tasks_per_worker", config.max_tasks_per_worker)
+        return replace(
+            config,
+            max_workers=int(max_workers) if max_workers else None,
+            timeout=setting("task_timeout_s", config.timeout),
+            max_tasks_per_worker=int(max_tasks) if max_tasks else None,
+            max_worker_rss_mb=setting("max_worker_rss_mb", config.max_worker_rss_mb),
+        )
+
     async def shutdown_all(self) -> None:
         with self._lock:
             pools = list(self._pools.items())
@@ -217,19 +756,24 @@ _global_mgr: ProcessPoolManager | None = None
 _mgr_lock = threading.Lock()
 
 
-def get_process_pool_manager() -> ProcessPoolManager:
-    """Return global :class:`ProcessPoolManager` instance."""
+def get_process_pool_manager(
+    settings: Mapping[str, Any] | None = None,
+) -> ProcessPoolManager:
+    """Return global :class:`ProcessPoolManager` and apply ``settings``."""
     global _global_mgr
     if _global_mgr is None:
         with _mgr_lock:
             if _global_mgr is None:
                 _global_mgr = ProcessPoolManager()
+    if settings is not None:
+        _global_mgr.set_defaults(settings)
     return _global_mgr
 
 
 __all__ = [
     "ProcessPoolType",
     "ProcessPoolConfig",
+    "PoolTaskResult",
     "ManagedProcessPool",
     "ProcessPoolManager",
     "get_process_pool_manager",
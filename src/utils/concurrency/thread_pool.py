@@ -6,6 +6,17 @@ Changelog
 * **Slot-Leak behoben**: Semaphore wird bei Submit-Fehlern freigegeben.
 * **Thread-sichere Executor-Initialisierung** mittels `self._lock`.
 * **Circuit-Breaker Hysterese**: +1 s `hysteresis_seconds`.
+* **Autoscaling**: Worker-Anzahl zwischen `min_workers` und `max_workers`
+  anhand von Queue-Wartezeit und Auslastung (`thread_pool.auto_scale`).
+* **Async-Admission**: `submit_async` wartet auf freie Slots, ohne den Event
+  Loop zu blockieren, und plant Retries auf dem Loop ein. Admission-, Queue-
+  und Ausführungszeit werden getrennt gemessen.
+* **Prioritäten**: Tasks mit `priority` (und optional `deadline`) werden aus
+  einer Prioritäts-Queue mit Aging verteilt; Wartezeiten je Priorität in
+  `get_stats`. `queue_maxsize` begrenzt laufende plus wartende Tasks, ohne
+  Limit werden alle Tasks sofort in die Queue übernommen.
+* **Task-Registry**: abgeschlossene Tasks verlassen die Registry per
+  Done-Callback; optional Ringpuffer der letzten Tasks (`task_history`).
 """
 
 from __future__ import annotations
@@ -13,15 +24,18 @@ from __future__ import annotations
 import asyncio
 import contextlib
 from contextlib import contextmanager
+import heapq
 import inspect
 import os
 import time
-from concurrent.futures import Future, ThreadPoolExecutor, CancelledError
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, replace
 from enum import Enum
 from threading import BoundedSemaphore, Lock
 from types import TracebackType
-from typing import Any, Callable, Dict, Optional, Set, TypeVar
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, TypeVar
 
 from utils.log_service import debug, error, info, warning
 
@@ -102,6 +116,22 @@ class ThreadPoolConfig:
     circuit_breaker_reset_timeout: float | None = 60.0
     hysteresis_seconds: float = 1.0  # NEU: Verzögerung für Circuit-Breaker Hysterese
 
+    # Autoscaling (None → Vorgabe des ThreadPoolManager, s. set_autoscale_defaults)
+    auto_scale: bool | None = None
+    min_workers: int | None = None
+    scale_interval_s: float = 1.0
+    scale_up_wait_ms: float = 50.0
+    scale_down_utilization: float = 0.3
+    scale_down_intervals: int = 3  # Hysterese: so viele ruhige Fenster in Folge
+    scale_cooldown_s: float = 5.0
+
+    # Prioritäten: pro ``priority_aging_s`` Wartezeit steigt ein Task um eine
+    # Stufe (None/0 → kein Aging)
+    priority_aging_s: float | None = 1.0
+
+    # Diagnose: Metadaten der letzten N abgeschlossenen Tasks (0 → aus)
+    task_history: int = 0
+
     # Observability
     enable_tracing: bool = False
     enable_metrics: bool = False
@@ -126,14 +156,49 @@ class _PoolStats:
     retries_performed: int = 0
     cb_open_events: int = 0
     sandbox_violations: int = 0
+    scale_ups: int = 0
+    scale_downs: int = 0
+    # Latenzen (Summen in Sekunden)
+    tasks_started: int = 0
+    queue_wait_s: float = 0.0
+    exec_s: float = 0.0
+    admission_waits: int = 0
+    admission_wait_s: float = 0.0
+    deadline_expired: int = 0
 
     def as_dict(self) -> Dict[str, Any]:
-        return self.__dict__.copy()
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class _QueuedTask:
+    fn: Callable[..., Any]
+    args: tuple
+    kwargs: Dict[str, Any]
+    future: Future[Any]
+    task_id: str | None
+    enqueued: float  # perf_counter beim Einreihen
+    priority: int = 0  # größer = dringender
+    deadline: float | None = None  # time.time(), bis zu der der Task starten muss
+    queue_wait_s: float | None = None  # gesetzt, sobald der Task startet
+    exec_s: float | None = None
+    # Versuch von submit_async mit weiteren Retries: ein Fehler zählt erst,
+    # wenn der Submitter aufgibt
+    retryable: bool = False
 
 
 # ─────────────────────────────── managed pool ────────────────────────────────
 class ManagedThreadPool:
-    """Thread-pool mit Back-Pressure, Robustness, Observability **und** Sandbox."""
+    """Thread-pool mit Back-Pressure, Robustness, Observability **und** Sandbox.
+
+    Tasks landen zunächst in einer eigenen Prioritäts-Queue und werden nur so
+    weit an den Executor weitergereicht, wie aktuell Worker vorgesehen sind.
+    Wartende Tasks gewinnen mit der Zeit an Priorität (``priority_aging_s``),
+    damit Bulk-Arbeit nicht verhungert. Mit
+    ``auto_scale`` wächst diese Zahl sofort, sobald mehr Tasks warten als
+    Worker frei sind, sowie bei hoher Queue-Wartezeit bis ``max_workers`` und
+    schrumpft bei geringer Auslastung bis ``min_workers``.
+    """
 
     # ── construction ──
     def __init__(self, cfg: ThreadPoolConfig):
@@ -141,7 +206,15 @@ class ManagedThreadPool:
         self.pool_type = cfg.pool_type
 
         self._workers = self._calc_workers(cfg)
-        # lazy init der Semaphore für Back-Pressure
+        self._auto_scale = bool(cfg.auto_scale) and self._workers > 1
+        self._min_workers = (
+            min(self._workers, max(1, cfg.min_workers or 1))
+            if self._auto_scale
+            else self._workers
+        )
+        # aktuell vorgesehene Worker (ändert sich nur mit auto_scale)
+        self._target = self._min_workers
+        # lazy init der Semaphore für Back-Pressure (nur mit queue_maxsize)
         self._sema: BoundedSemaphore | None = None
         self._executor: ThreadPoolExecutor | None = None
         # Lock für thread-sichere Executor-Init
@@ -151,7 +224,32 @@ class ManagedThreadPool:
         # Stats and task tracking
         self._stats = _PoolStats()
         self._stats_lock = Lock()
+        # nur laufende/wartende Tasks mit task_id (für cancel_task)
         self._futures: Dict[str, Future[Any]] = {}
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=max(0, cfg.task_history))
+
+        # Dispatcher: eigene Heap-Queue, begrenzt auf ``_target`` laufende Tasks
+        self._queue_lock = Lock()
+        self._pending: List[tuple[float, int, _QueuedTask]] = []
+        self._seq = 0
+        self._running = 0
+        # Queue-Wartezeit je Priorität: [Tasks, Summe s, Maximum s]
+        self._priority_waits: Dict[int, List[float]] = {}
+        # async Submitter, die auf einen freien Slot warten
+        self._slot_waiters: Deque[
+            tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]
+        ] = deque()
+
+        # Autoscaling-Messfenster
+        now = time.perf_counter()
+        self._window_start = now
+        self._busy_mark = now
+        self._busy_s = 0.0
+        self._window_wait_s = 0.0
+        self._window_started = 0
+        self._idle_windows = 0
+        self._last_scale = float("-inf")
+        self._scaling: Deque[Dict[str, Any]] = deque(maxlen=20)
 
         # Circuit-Breaker
         self._cb_failures = 0
@@ -174,7 +272,9 @@ class ManagedThreadPool:
         return max(1, int(cpu_cnt * cfg.cpu_factor))
 
     def _ensure_executor(self) -> ThreadPoolExecutor:
-        # thread-sichere Initialisierung des Executors
+        # thread-sichere Initialisierung des Executors; er ist auf
+        # ``max_workers`` ausgelegt, wie viele davon laufen, begrenzt
+        # ``_dispatch`` über ``_target``
         with self._lock:
             if self._executor is None:
                 self._executor = ThreadPoolExecutor(
@@ -207,24 +307,80 @@ class ManagedThreadPool:
                     raise SecurityError("CPU-bound operation denied by pool policy")
 
     # ── slot helpers ──
+    def _ensure_sema(self) -> BoundedSemaphore | None:
+        # lazy init der Semaphore für Back-Pressure; ohne ``queue_maxsize``
+        # landet jeder Task in der Prioritäts-Queue (sonst bliebe sie leer)
+        if self.config.queue_maxsize is None:
+            return None
+        with self._lock:
+            if self._sema is None:
+                self._sema = BoundedSemaphore(self.config.queue_maxsize)
+        return self._sema
+
     def _acquire_slot(self) -> None:
-        # lazy init der Semaphore für Back-Pressure
-        if self._sema is None:
-            maxsize = (
-                self.config.queue_maxsize
-                if self.config.queue_maxsize is not None
-                else self._workers
-            )
-            self._sema = BoundedSemaphore(maxsize)
-        if not self._sema.acquire(blocking=self.config.queue_block):
+        sema = self._ensure_sema()
+        if sema and not sema.acquire(blocking=self.config.queue_block):
             # bei voller Queue Fehler auslösen
             raise RuntimeError("Thread-pool queue full")
 
+    async def _acquire_slot_async(self) -> None:
+        """Wie :meth:`_acquire_slot`, wartet aber ohne den Loop zu blockieren."""
+        sema = self._ensure_sema()
+        if sema is None or sema.acquire(blocking=False):
+            return
+        if not self.config.queue_block:
+            raise RuntimeError("Thread-pool queue full")
+
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        while True:
+            waiter: asyncio.Future[None] = loop.create_future()
+            with self._queue_lock:
+                self._slot_waiters.append((loop, waiter))
+            # erneut prüfen: der Slot kann vor dem Eintragen frei geworden sein
+            if sema.acquire(blocking=False):
+                self._drop_slot_waiter(waiter)
+                break
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if not self._drop_slot_waiter(waiter):
+                    # Weckruf schon zugestellt → an den nächsten weitergeben
+                    self._wake_slot_waiter()
+                raise
+            if sema.acquire(blocking=False):
+                break
+        with self._stats_lock:
+            self._stats.admission_waits += 1
+            self._stats.admission_wait_s += time.perf_counter() - started
+
+    def _drop_slot_waiter(self, waiter: asyncio.Future[None]) -> bool:
+        with self._queue_lock:
+            for entry in self._slot_waiters:
+                if entry[1] is waiter:
+                    self._slot_waiters.remove(entry)
+                    return True
+        return False
+
+    def _wake_slot_waiter(self) -> None:
+        with self._queue_lock:
+            if not self._slot_waiters:
+                return
+            loop, waiter = self._slot_waiters.popleft()
+
+        def _wake() -> None:
+            if not waiter.done():
+                waiter.set_result(None)
+
+        with contextlib.suppress(RuntimeError):  # Loop bereits geschlossen
+            loop.call_soon_threadsafe(_wake)
+
     def _release_slot(self) -> None:
         # sichere Freigabe der Semaphore
         if self._sema:
             with contextlib.suppress(ValueError):
                 self._sema.release()
+            self._wake_slot_waiter()
 
     # ── circuit-breaker helpers ──
     def _circuit_ok(self) -> bool:
@@ -293,13 +449,7 @@ class ManagedThreadPool:
         return _inner
 
     # ── submission ──
-    def submit_task(
-        self,
-        fn: Callable[..., T],
-        *args: Any,
-        task_id: str | None = None,
-        **kwargs: Any,
-    ) -> Future[T]:
+    def _check_submission(self, fn: Callable[..., Any]) -> None:
         if self._shutdown:
             raise RuntimeError("Pool closed")
         if not self._circuit_ok():
@@ -314,31 +464,76 @@ class ManagedThreadPool:
             error("sandbox_violation", pool=self.pool_type.value, msg=str(se))
             raise
 
+    def _wrap_nice(self, fn: Callable[..., T]) -> Callable[..., T]:
+        if self.config.nice is None:
+            return fn
+
+        def _with_nice(*a: Any, **kw: Any):
+            try:
+                if hasattr(os, "nice"):
+                    assert self.config.nice is not None
+                    os.nice(self.config.nice)  # type: ignore[attr-defined]
+            except Exception:  # pragma: no cover
+                pass
+            return fn(*a, **kw)
+
+        return _with_nice
+
+    def submit_task(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        task_id: str | None = None,
+        priority: int = 0,
+        deadline: float | None = None,
+        **kwargs: Any,
+    ) -> Future[T]:
+        """Reicht ``fn`` ein.
+
+        Höhere ``priority`` wird zuerst verteilt. Startet der Task nicht vor
+        ``deadline`` (``time.time()``), schlägt sein Future mit
+        :class:`TimeoutError` fehl.
+        """
+        self._check_submission(fn)
+
         # Back-Pressure
         self._acquire_slot()
 
-        # Metrics pre-increment
-        if self._metrics_enabled and _M_SUBMITTED and _M_ACTIVE:
-            _M_SUBMITTED.labels(pool=self.pool_type.value).inc()
-            _M_ACTIVE.labels(pool=self.pool_type.value).inc()
-
         # Compose wrapper (retry, nice)
-        target: Callable[..., T] = self._wrap_retry(fn)
-
-        if self.config.nice is not None:
+        target = self._wrap_nice(self._wrap_retry(fn))
+        return self._submit_admitted(
+            target, args, kwargs, task_id, priority=priority, deadline=deadline
+        )
 
-            def _with_nice(*a: Any, **kw: Any):
-                try:
-                    if hasattr(os, "nice"):
-                        assert self.config.nice is not None
-                        os.nice(self.config.nice)  # type: ignore[attr-defined]
-                except Exception:  # pragma: no cover
-                    pass
-                return target(*a, **kw)
+    def _submit_admitted(
+        self,
+        target: Callable[..., T],
+        args: tuple,
+        kwargs: Dict[str, Any],
+        task_id: str | None,
+        *,
+        priority: int = 0,
+        deadline: float | None = None,
+        attempt: int = 0,
+        retryable: bool = False,
+    ) -> Future[T]:
+        """Reiht ``target`` ein; der Slot ist bereits belegt.
 
-            target = _with_nice
+        Retries (``attempt`` > 0) zählen nicht erneut als eingereichter Task.
+        """
+        # Metrics pre-increment
+        if self._metrics_enabled and _M_SUBMITTED and _M_ACTIVE:
+            if not attempt:
+                _M_SUBMITTED.labels(pool=self.pool_type.value).inc()
+            _M_ACTIVE.labels(pool=self.pool_type.value).inc()
 
         # Actual submission
+        fut: Future[T] = Future()
+        task = _QueuedTask(
+            target, args, kwargs, fut, task_id, time.perf_counter(), priority, deadline
+        )
+        task.retryable = retryable
+        self._register_task(task, resubmitted=attempt > 0)
         with (
             self._tracer.start_as_current_span(
                 "threadpool.submit",
@@ -347,14 +542,8 @@ class ManagedThreadPool:
             if self._tracer
             else contextlib.nullcontext()
         ):
-            # --- FIX: Slot-Leak absichern -------------------------
-            try:
-                fut: Future[T] = self._ensure_executor().submit(target, *args, **kwargs)
-            except Exception:  # noqa: BLE001
-                self._release_slot()
-                raise
+            self._enqueue(task)
 
-        self._register_future(fut, task_id)
         debug("task_submitted", pool=self.pool_type.value, task_id=task_id)
         return fut
 
@@ -363,59 +552,353 @@ class ManagedThreadPool:
         fn: Callable[..., T],
         *args: Any,
         task_id: str | None = None,
+        priority: int = 0,
         deadline: float | None = None,
         **kwargs: Any,
     ) -> T:
+        """Async-Variante von :meth:`submit_task`.
+
+        Wartet ohne Blockieren des Event Loops auf einen freien Slot und plant
+        Retries mit ``asyncio.sleep`` ein; jeder Versuch ist ein eigener Task
+        im Pool, gezählt wird aber nur ein Task, und vor jedem Retry wird die
+        Annahme (Shutdown, Circuit-Breaker) erneut geprüft.
+        ``timeout``/``deadline`` gelten für Wartezeit und Ausführung.
+        """
         loop = asyncio.get_running_loop()
-        fut = self.submit_task(fn, *args, task_id=task_id, **kwargs)
-        wrapped = asyncio.wrap_future(fut, loop=loop)
+        self._check_submission(fn)
+        target = self._wrap_nice(fn)
         timeout = self.config.timeout
         if deadline is not None:
             remaining = deadline - time.time()
             timeout = remaining if timeout is None else max(0, min(timeout, remaining))
+
+        fut: Future[T] | None = None
+        attempt, delay = 0, self.config.retry_backoff_base
+        # Fehler des letzten Versuchs, noch nicht gezählt (Retry geplant)
+        deferred = False
         try:
-            return await asyncio.wait_for(wrapped, timeout=timeout)
+            async with asyncio.timeout(timeout):
+                while True:
+                    if attempt:
+                        try:
+                            self._check_submission(fn)
+                        except Exception:
+                            self._record_outcome(failed=True)
+                            raise
+                    await self._acquire_slot_async()
+                    deferred = False
+                    try:
+                        fut = self._submit_admitted(
+                            target,
+                            args,
+                            kwargs,
+                            task_id,
+                            priority=priority,
+                            deadline=deadline,
+                            attempt=attempt,
+                            retryable=attempt < self.config.retries,
+                        )
+                        return await asyncio.wrap_future(fut, loop=loop)
+                    except Exception as exc:  # noqa: BLE001
+                        attempt += 1
+                        if attempt > self.config.retries:
+                            raise
+                        deferred = True
+                        with self._stats_lock:
+                            self._stats.retries_performed += 1
+                        sleep_for = min(delay, self.config.retry_backoff_max)
+                        warning(
+                            "retry",
+                            pool=self.pool_type.value,
+                            attempt=attempt,
+                            sleep=sleep_for,
+                            exc=str(exc),
+                        )
+                        await asyncio.sleep(sleep_for)
+                        delay *= 2
         except asyncio.TimeoutError:
-            fut.cancel()
+            if deferred:
+                # Zeit lief während des Backoffs ab: der Fehler ist endgültig
+                self._record_outcome(failed=True)
+            elif fut is not None:
+                fut.cancel()
             error("task_timeout", pool=self.pool_type.value, task_id=task_id)
             raise
 
+    # ── dispatcher ──
+    def _enqueue(self, task: _QueuedTask) -> None:
+        with self._queue_lock:
+            self._autoscale(task.enqueued)
+            aging = self.config.priority_aging_s
+            # lineares Aging ist ordnungserhaltend → statischer Heap-Schlüssel
+            key = (task.enqueued / aging if aging else 0.0) - task.priority
+            self._seq += 1
+            heapq.heappush(self._pending, (key, self._seq, task))
+            self._scale_for_backlog(task.enqueued)
+            failed = self._dispatch()
+        # --- FIX: Slot-Leak absichern (Slot gibt der Done-Callback frei) ---
+        for queued, exc in failed:
+            queued.future.set_exception(exc)
+        for queued, exc in failed:
+            if queued is task:
+                raise exc
+
+    def _dispatch(self) -> List[tuple[_QueuedTask, BaseException]]:
+        """Reicht wartende Tasks weiter, solange Worker frei sind.
+
+        Muss mit ``_queue_lock`` aufgerufen werden; Futures fehlgeschlagener
+        Übergaben werden vom Aufrufer außerhalb des Locks aufgelöst.
+        """
+        failed: List[tuple[_QueuedTask, BaseException]] = []
+        while self._pending and self._running < self._target and not self._shutdown:
+            task = heapq.heappop(self._pending)[2]
+            if task.future.cancelled():
+                continue
+            if task.deadline is not None and time.time() > task.deadline:
+                with self._stats_lock:
+                    self._stats.deadline_expired += 1
+                failed.append(
+                    (task, TimeoutError("Deadline expired before the task started"))
+                )
+                continue
+            self._account_busy(time.perf_counter())
+            self._running += 1
+            try:
+                work = self._ensure_executor().submit(self._run_queued, task)
+            except Exception as exc:  # noqa: BLE001
+                self._running -= 1
+                failed.append((task, exc))
+                continue
+            work.add_done_callback(
+                lambda w, t=task: self._on_work_cancelled(t) if w.cancelled() else None
+            )
+        return failed
+
+    def _run_queued(self, task: _QueuedTask) -> None:
+        started = time.perf_counter()
+        try:
+            if not task.future.set_running_or_notify_cancel():
+                return
+            waited = started - task.enqueued
+            with self._queue_lock:
+                self._window_wait_s += waited
+                self._window_started += 1
+                entry = self._priority_waits.setdefault(task.priority, [0, 0.0, 0.0])
+                entry[0] += 1
+                entry[1] += waited
+                entry[2] = max(entry[2], waited)
+            try:
+                result = task.fn(*task.args, **task.kwargs)
+            except BaseException as exc:  # noqa: BLE001
+                self._record_timing(task, waited, time.perf_counter() - started)
+                task.future.set_exception(exc)
+            else:
+                self._record_timing(task, waited, time.perf_counter() - started)
+                task.future.set_result(result)
+        finally:
+            self._task_finished()
+
+    def _record_timing(
+        self, task: _QueuedTask, queue_wait_s: float, exec_s: float
+    ) -> None:
+        task.queue_wait_s, task.exec_s = queue_wait_s, exec_s
+        with self._stats_lock:
+            self._stats.tasks_started += 1
+            self._stats.queue_wait_s += queue_wait_s
+            self._stats.exec_s += exec_s
+
+    def _on_work_cancelled(self, task: _QueuedTask) -> None:
+        # Executor-Shutdown mit cancel_futures: Task lief nie
+        task.future.cancel()
+        self._task_finished()
+
+    def _task_finished(self) -> None:
+        with self._queue_lock:
+            now = time.perf_counter()
+            self._account_busy(now)
+            self._running -= 1
+            self._autoscale(now)
+            failed = self._dispatch()
+        for queued, exc in failed:
+            queued.future.set_exception(exc)
+
+    # ── autoscaling ──
+    def _account_busy(self, now: float) -> None:
+        # integriert laufende Tasks über die Zeit (für die Auslastung)
+        self._busy_s += self._running * (now - self._busy_mark)
+        self._busy_mark = now
+
+    def _autoscale(self, now: float) -> None:
+        """Passt ``_target`` nach Ablauf eines Messfensters an (Lock gehalten)."""
+        cfg = self.config
+        elapsed = now - self._window_start
+        if not self._auto_scale or elapsed < cfg.scale_interval_s:
+            return
+        self._account_busy(now)
+        utilization = self._busy_s / (self._target * elapsed)
+        queue_wait_ms = (
+            self._window_wait_s / self._window_started * 1000
+            if self._window_started
+            else 0.0
+        )
+        if self._pending:
+            # noch wartende Tasks zählen mit, auch wenn keiner gestartet ist
+            oldest = (now - min(t.enqueued for _, _, t in self._pending)) * 1000
+            queue_wait_ms = max(queue_wait_ms, oldest)
+        self._window_start, self._busy_s = now, 0.0
+        self._window_wait_s, self._window_started = 0.0, 0
+
+        target = self._target
+        if queue_wait_ms > cfg.scale_up_wait_ms:
+            self._idle_windows = 0
+            workers = min(
+                self._workers, target + max(1, min(len(self._pending), target))
+            )
+            reason = "queue_wait"
+        elif utilization < cfg.scale_down_utilization and not self._pending:
+            self._idle_windows += 1
+            if self._idle_windows < cfg.scale_down_intervals:
+                return
+            workers = max(self._min_workers, target - 1)
+            reason = "idle"
+        else:
+            self._idle_windows = 0
+            return
+        if workers == target or now - self._last_scale < cfg.scale_cooldown_s:
+            return
+        self._resize(workers, reason, now, queue_wait_ms, utilization)
+
+    def _scale_for_backlog(self, now: float) -> None:
+        """Wächst sofort, wenn mehr Tasks warten als Worker frei sind.
+
+        So verteilt sich ein Burst gleich auf mehrere Worker, statt bis zum
+        Ende des Messfensters auf einem zu laufen (Lock gehalten).
+        """
+        target = self._target
+        backlog = len(self._pending) - (target - self._running)
+        if not self._auto_scale or backlog <= 0 or target >= self._workers:
+            return
+        self._resize(
+            min(self._workers, target + backlog),
+            "backlog",
+            now,
+            0.0,
+            self._running / target,
+        )
+
+    def _resize(
+        self,
+        workers: int,
+        reason: str,
+        now: float,
+        queue_wait_ms: float,
+        utilization: float,
+    ) -> None:
+        target = self._target
+        self._target = workers
+        self._idle_windows = 0
+        self._last_scale = now
+        # der Executor bleibt; _dispatch reicht nur noch ``workers`` Tasks
+        # gleichzeitig weiter
+        with self._stats_lock:
+            if workers > target:
+                self._stats.scale_ups += 1
+            else:
+                self._stats.scale_downs += 1
+        self._scaling.append(
+            {
+                "time": time.time(),
+                "from": target,
+                "to": workers,
+                "reason": reason,
+                "queue_wait_ms": round(queue_wait_ms, 3),
+                "utilization": round(utilization, 3),
+            }
+        )
+        info(
+            "pool_scaled",
+            pool=self.pool_type.value,
+            workers=workers,
+            previous=target,
+            reason=reason,
+        )
+
     # ── bookkeeping ──
-    def _register_future(self, fut: Future[Any], task_id: str | None) -> None:
+    def _register_task(self, task: _QueuedTask, resubmitted: bool = False) -> None:
+        fut, task_id = task.future, task.task_id
         with self._stats_lock:
-            self._stats.tasks_submitted += 1
+            if not resubmitted:
+                self._stats.tasks_submitted += 1
             self._stats.active_tasks += 1
         if task_id:
-            self._futures[task_id] = fut
+            with self._lock:
+                self._futures[task_id] = fut
 
         # callbacks
         def _done(res: Future[Any]):
-            try:
-                exc = res.exception()
-            except CancelledError:
-                # Future was cancelled, treat as no exception
-                exc = None
+            cancelled = res.cancelled()
+            exc = None if cancelled else res.exception()
+            if task_id:
+                with self._lock:
+                    # nur entfernen, falls die ID nicht neu vergeben wurde
+                    if self._futures.get(task_id) is res:
+                        del self._futures[task_id]
+            if self._history.maxlen:
+                self._record_history(task, cancelled, exc)
             with self._stats_lock:
                 self._stats.active_tasks -= 1
-                if exc:
-                    self._stats.tasks_failed += 1
-                else:
-                    self._stats.tasks_completed += 1
-            if exc:
-                self._record_failure()
-                if self._metrics_enabled and _M_FAILED:
-                    _M_FAILED.labels(pool=self.pool_type.value).inc()
-            else:
-                self._record_success()
-                if self._metrics_enabled and _M_COMPLETED:
-                    _M_COMPLETED.labels(pool=self.pool_type.value).inc()
+            if not (exc and task.retryable):
+                self._record_outcome(failed=exc is not None)
             if self._metrics_enabled and _M_ACTIVE:
                 _M_ACTIVE.labels(pool=self.pool_type.value).dec()
             self._release_slot()
 
         fut.add_done_callback(_done)
 
+    def _record_outcome(self, *, failed: bool) -> None:
+        with self._stats_lock:
+            if failed:
+                self._stats.tasks_failed += 1
+            else:
+                self._stats.tasks_completed += 1
+        if failed:
+            self._record_failure()
+            if self._metrics_enabled and _M_FAILED:
+                _M_FAILED.labels(pool=self.pool_type.value).inc()
+        else:
+            self._record_success()
+            if self._metrics_enabled and _M_COMPLETED:
+                _M_COMPLETED.labels(pool=self.pool_type.value).inc()
+
+    def _record_history(
+        self, task: _QueuedTask, cancelled: bool, exc: BaseException | None
+    ) -> None:
+        if cancelled:
+            outcome = "cancelled"
+        elif exc is not None:
+            outcome = "failed" if task.exec_s is not None else "rejected"
+        else:
+            outcome = "completed"
+        entry = {
+            "task_id": task.task_id,
+            "priority": task.priority,
+            "outcome": outcome,
+            "error": repr(exc) if exc is not None else None,
+            "queue_wait_ms": (
+                task.queue_wait_s * 1000 if task.queue_wait_s is not None else None
+            ),
+            "duration_ms": task.exec_s * 1000 if task.exec_s is not None else None,
+            "finished_at": time.time(),
+        }
+        with self._stats_lock:
+            self._history.append(entry)
+
     # ── public helpers ──
+    def recent_tasks(self) -> List[Dict[str, Any]]:
+        """Metadaten der zuletzt abgeschlossenen Tasks, älteste zuerst."""
+        with self._stats_lock:
+            return list(self._history)
+
     def cancel_task(self, task_id: str) -> bool:
         with self._lock:
             fut = self._futures.get(task_id)
@@ -428,8 +911,37 @@ class ManagedThreadPool:
 
     def get_stats(self) -> Dict[str, Any]:
         d = self._stats.as_dict()
+        started, waits = d["tasks_started"], d["admission_waits"]
+        d["latency"] = {
+            "admission_wait_ms_avg": (
+                d["admission_wait_s"] / waits * 1000 if waits else 0.0
+            ),
+            "queue_wait_ms_avg": d["queue_wait_s"] / started * 1000 if started else 0.0,
+            "exec_ms_avg": d["exec_s"] / started * 1000 if started else 0.0,
+        }
         d["pool_type"] = self.pool_type.value
         d["max_workers"] = self._workers
+        with self._lock:
+            d["registered_tasks"] = len(self._futures)
+        d["min_workers"] = self._min_workers
+        d["workers"] = self._target
+        with self._queue_lock:
+            queued: Dict[int, int] = {}
+            for _, _, task in self._pending:
+                queued[task.priority] = queued.get(task.priority, 0) + 1
+            waits = {p: tuple(v) for p, v in self._priority_waits.items()}
+        d["queued_tasks"] = sum(queued.values())
+        d["priorities"] = {}
+        for priority in sorted(waits.keys() | queued.keys(), reverse=True):
+            count, total, longest = waits.get(priority, (0, 0.0, 0.0))
+            d["priorities"][priority] = {
+                "tasks": int(count),
+                "queued": queued.get(priority, 0),
+                "queue_wait_ms_avg": total / count * 1000 if count else 0.0,
+                "queue_wait_ms_max": longest * 1000,
+            }
+        d["auto_scale"] = self._auto_scale
+        d["scaling_decisions"] = list(self._scaling)
         return d
 
     def shutdown(self, *, wait: bool = True) -> None:
@@ -438,6 +950,10 @@ class ManagedThreadPool:
         self._shutdown = True
         if self._metrics_enabled and _M_ACTIVE:
             _M_ACTIVE.labels(pool=self.pool_type.value).set(0)
+        with self._queue_lock:
+            pending, self._pending = self._pending, []
+        for _, _, task in pending:
+            task.future.cancel()
         if self._executor:
             self._executor.shutdown(wait=wait, cancel_futures=True)
         info("pool_shutdown", pool=self.pool_type.value)
@@ -482,7 +998,14 @@ class ThreadPoolManager:
 
     def __init__(self) -> None:
         self._pools: Dict[ThreadPoolType, ManagedThreadPool] = {}
+        # dedicated single-thread pools so one slow camera cannot starve others
+        self._camera_pools: Dict[str, ManagedThreadPool] = {}
+        # controllers using each camera pool (acquire/release_camera_pool)
+        self._camera_refcounts: Dict[str, int] = {}
         self._lock = Lock()
+        # ``thread_pool.auto_scale``/``min_workers`` für Configs ohne eigene Werte
+        self._auto_scale = False
+        self._min_workers: int | None = None
 
     def set_default_max_workers(self, workers: int) -> None:
         """Set ``max_workers`` for all default configs without one."""
@@ -491,15 +1014,84 @@ class ThreadPoolManager:
             if cfg.max_workers is None:
                 cfg.max_workers = workers
 
+    def set_autoscale_defaults(
+        self, auto_scale: bool, min_workers: int | None = None
+    ) -> None:
+        """Autoscaling für später erzeugte Pools ohne eigene Einstellung.
+
+        Die Obergrenze ist das ``max_workers`` des Pools, für die Standard-
+        Configs also :meth:`set_default_max_workers`.
+        """
+        self._auto_scale = auto_scale
+        self._min_workers = min_workers
+
     def get_pool(
         self, pool_type: ThreadPoolType, *, config: ThreadPoolConfig | None = None
     ) -> ManagedThreadPool:
         with self._lock:
             if pool_type not in self._pools:
                 cfg = config or self._defaults[pool_type]
+                cfg = replace(
+                    cfg,
+                    auto_scale=(
+                        self._auto_scale if cfg.auto_scale is None else cfg.auto_scale
+                    ),
+                    min_workers=(
+                        self._min_workers
+                        if cfg.min_workers is None
+                        else cfg.min_workers
+                    ),
+                )
                 self._pools[pool_type] = ManagedThreadPool(cfg)
             return self._pools[pool_type]
 
+    def get_camera_pool(self, camera_key: str) -> ManagedThreadPool:
+        """Return the I/O pool dedicated to ``camera_key``.
+
+        Each camera gets one worker thread (derived from the ``CAMERA_IO``
+        defaults) and a small submission queue so concurrent calls for the
+        same device wait their turn inside the executor.
+        """
+        with self._lock:
+            return self._camera_pool_locked(camera_key)
+
+    def acquire_camera_pool(self, camera_key: str) -> ManagedThreadPool:
+        """Like :meth:`get_camera_pool`, but count the caller as a user.
+
+        The pool is shut down once every user called
+        :meth:`release_camera_pool`.
+        """
+        with self._lock:
+            pool = self._camera_pool_locked(camera_key)
+            self._camera_refcounts[camera_key] = (
+                self._camera_refcounts.get(camera_key, 0) + 1
+            )
+            return pool
+
+    def release_camera_pool(self, camera_key: str, *, wait: bool = True) -> None:
+        with self._lock:
+            count = self._camera_refcounts.get(camera_key, 0) - 1
+            if count > 0:
+                self._camera_refcounts[camera_key] = count
+                return
+            self._camera_refcounts.pop(camera_key, None)
+            pool = self._camera_pools.pop(camera_key, None)
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def _camera_pool_locked(self, camera_key: str) -> ManagedThreadPool:
+        pool = self._camera_pools.get(camera_key)
+        if pool is None:
+            base = self._defaults[ThreadPoolType.CAMERA_IO]
+            cfg = replace(
+                base,
+                max_workers=1,
+                queue_maxsize=max(base.queue_maxsize or 0, 8),
+                thread_name_prefix=f"{base.thread_name_prefix}-{camera_key}",
+            )
+            pool = self._camera_pools[camera_key] = ManagedThreadPool(cfg)
+        return pool
+
     async def submit_to_pool(
         self,
         pool_type: ThreadPoolType,
@@ -512,13 +1104,17 @@ class ThreadPoolManager:
         return await pool.submit_async(fn, *args, task_id=task_id, **kwargs)
 
     def get_all_stats(self) -> Dict[str, Dict[str, Any]]:
-        return {pt.value: pool.get_stats() for pt, pool in self._pools.items()}
+        stats = {pt.value: pool.get_stats() for pt, pool in self._pools.items()}
+        for key, pool in self._camera_pools.items():
+            stats[f"{ThreadPoolType.CAMERA_IO.value}:{key}"] = pool.get_stats()
+        return stats
 
     async def shutdown_all(self) -> None:
-        await asyncio.gather(
-            *(asyncio.to_thread(pool.shutdown) for pool in self._pools.values())
-        )
+        pools = [*self._pools.values(), *self._camera_pools.values()]
+        await asyncio.gather(*(asyncio.to_thread(pool.shutdown) for pool in pools))
         self._pools.clear()
+        self._camera_pools.clear()
+        self._camera_refcounts.clear()
 
 
 # ───────────────────── global singleton & convenience helpers ────────────────
@@ -527,7 +1123,12 @@ _global_mgr: ThreadPoolManager | None = None
 _mgr_lock = Lock()
 
 
-def get_thread_pool_manager(default_max_workers: int | None = None) -> ThreadPoolManager:
+def get_thread_pool_manager(
+    default_max_workers: int | None = None,
+    *,
+    auto_scale: bool | None = None,
+    min_workers: int | None = None,
+) -> ThreadPoolManager:
     """Return global :class:`ThreadPoolManager` and apply defaults."""
     global _global_mgr
     if _global_mgr is None:
@@ -536,6 +1137,8 @@ def get_thread_pool_manager(default_max_workers: int | None = None) -> ThreadPoo
                 _global_mgr = ThreadPoolManager()
     if default_max_workers is not None:
         _global_mgr.set_default_max_workers(default_max_workers)
+    if auto_scale is not None:
+        _global_mgr.set_autoscale_defaults(auto_scale, min_workers)
     return _global_mgr
 
 
@@ -545,7 +1148,25 @@ async def run_sensor_io(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
     )
 
 
+# camera whose dedicated pool run_camera_io should use in the current task
+_camera_io_key: ContextVar[str | None] = ContextVar("camera_io_key", default=None)
+
+
+@contextmanager
+def camera_io_context(camera_key: str | None):
+    """Route ``run_camera_io`` calls in this context to ``camera_key``'s pool."""
+    token = _camera_io_key.set(camera_key)
+    try:
+        yield
+    finally:
+        _camera_io_key.reset(token)
+
+
 async def run_camera_io(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    camera_key = _camera_io_key.get()
+    if camera_key is not None:
+        pool = get_thread_pool_manager().get_camera_pool(camera_key)
+        return await pool.submit_async(fn, *args, **kwargs)
     return await get_thread_pool_manager().submit_to_pool(
         ThreadPoolType.CAMERA_IO, fn, *args, **kwargs
     )
@@ -585,4 +1206,5 @@ __all__ = [
     "run_file_io",
     "run_network_io",
     "thread_pool_context",
+    "camera_io_context",
 ]
@@ -83,6 +83,7 @@ CONTROLLER_SCHEMA = {
         "state_output": {"type": "array"},
         "show_on_dashboard": {"type": "boolean"},
         "cam_id": {"type": "string"},
+        "isolation": {"type": "string", "enum": ["inline", "process"]},
     },
     "required": ["name", "type", "enabled"],
     "allOf": [
@@ -153,6 +154,23 @@ WEBCAM_SCHEMA = {
             "additionalProperties": False,
         },
         "uvc_settings": {"type": "object"},
+        "source": {
+            "type": "object",
+            "properties": {
+                "type": {"type": "string", "enum": ["synthetic", "file"]},
+                "path": {"type": "string"},
+                "loop": {"type": "boolean"},
+                "realtime": {"type": "boolean"},
+                "fps": {"type": "number"},
+                "width": {"type": "integer"},
+                "height": {"type": "integer"},
+                "shapes": {"type": "integer"},
+                "noise": {"type": "number"},
+                "seed": {"type": "integer"},
+                "motion_schedule": {"type": "array"},
+            },
+            "required": ["type"],
+        },
         "webcam_id": {"type": "string"},
     },
     "required": ["name", "device_index"],
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import List, Tuple, TYPE_CHECKING
 from concurrent.futures import Future
 from utils.log_service import info, error
+from utils.concurrency.process_pool import get_process_pool_manager
 from utils.concurrency.thread_pool import (
     ManagedThreadPool,
     ThreadPoolType,
@@ -80,7 +81,13 @@ class ApplicationContainer:
             info("Email alert service initialized")
             # Get thread pool configuration
             max_workers = config_service.get("thread_pool.max_workers", int, 4)
-            get_thread_pool_manager(default_max_workers=max_workers)
+            get_thread_pool_manager(
+                default_max_workers=max_workers,
+                auto_scale=config_service.get("thread_pool.auto_scale", bool, False),
+                min_workers=config_service.get("thread_pool.min_workers", int, None),
+            )
+            # Get process pool configuration
+            get_process_pool_manager(config_service.get("process_pool", dict, {}) or {})
 
             # Initialize unified data saver using configured storage paths
             storage_paths = (
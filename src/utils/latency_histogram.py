@@ -0,0 +1,208 @@
+"""
+Fixed-bucket latency histogram for hot paths.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+# Log-linear buckets: values below 8 ns get their own bucket, above that every
+# power of two is split into 8 sub-buckets (~12% relative resolution).
+_SUB_BITS = 3
+_SUB_BUCKETS = 1 << _SUB_BITS
+_MAX_BITS = 40  # ~18 minutes; larger values land in the last bucket
+BUCKET_COUNT = (_MAX_BITS - _SUB_BITS) * _SUB_BUCKETS + _SUB_BUCKETS
+
+
+def bucket_index(value_ns: int) -> int:
+    """Return the bucket holding ``value_ns``."""
+    if value_ns < _SUB_BUCKETS:
+        return value_ns if value_ns > 0 else 0
+    shift = value_ns.bit_length() - _SUB_BITS - 1
+    index = (shift << _SUB_BITS) + (value_ns >> shift)
+    return index if index < BUCKET_COUNT else BUCKET_COUNT - 1
+
+
+def bucket_upper_bound(index: int) -> int:
+    """Return the exclusive upper bound in ns of bucket ``index``."""
+    if index < _SUB_BUCKETS:
+        return index + 1
+    shift = (index >> _SUB_BITS) - 1
+    mantissa = (index & (_SUB_BUCKETS - 1)) + _SUB_BUCKETS
+    return (mantissa + 1) << shift
+
+
+class LatencyHistogram:
+    """Counts nanosecond latencies in fixed log-linear buckets.
+
+    Recording is a handful of integer operations and never allocates, so it
+    can sit on per-frame paths.  Percentiles are reported as the upper bound
+    of the bucket they fall into, capped at the exact maximum.
+    """
+
+    __slots__ = ("_counts", "count", "total_ns", "max_ns")
+
+    def __init__(self) -> None:
+        self._counts: List[int] = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, value_ns: int) -> None:
+        if value_ns < _SUB_BUCKETS:
+            if value_ns < 0:
+                value_ns = 0
+            index = value_ns
+        else:
+            shift = value_ns.bit_length() - _SUB_BITS - 1
+            index = (shift << _SUB_BITS) + (value_ns >> shift)
+            if index >= BUCKET_COUNT:
+                index = BUCKET_COUNT - 1
+        self._counts[index] += 1
+        self.count += 1
+        self.total_ns += value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def reset(self) -> None:
+        self._counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the samples of ``other`` to this histogram."""
+        counts = self._counts
+        for index, n in enumerate(other._counts):
+            if n:
+                counts[index] += n
+        self.count += other.count
+        self.total_ns += other.total_ns
+        if other.max_ns > self.max_ns:
+            self.max_ns = other.max_ns
+
+    def percentile(self, q: float) -> Optional[int]:
+        """Return the ``q``-th percentile (0-100) in ns, ``None`` if empty."""
+        if not self.count:
+            return None
+        rank = max(1, int(round(q / 100.0 * self.count)))
+        seen = 0
+        for index, n in enumerate(self._counts):
+            seen += n
+            if seen >= rank:
+                return min(bucket_upper_bound(index) - 1, self.max_ns)
+        return self.max_ns
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summary in milliseconds."""
+        if not self.count:
+            return {
+                "count": 0,
+                "mean_ms": None,
+                "p50_ms": None,
+                "p95_ms": None,
+                "p99_ms": None,
+                "max_ms": None,
+            }
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ns / self.count / 1e6,
+            "p50_ms": self.percentile(50) / 1e6,
+            "p95_ms": self.percentile(95) / 1e6,
+            "p99_ms": self.percentile(99) / 1e6,
+            "max_ms": self.max_ns / 1e6,
+        }
+
+
+class WindowedLatencyHistogram:
+    """:class:`LatencyHistogram` over a sliding window of ``window_s`` seconds.
+
+    The window is split into ``slots`` sub-histograms; the oldest one is
+    cleared whenever a new slot starts, so percentiles reflect the last
+    ``window_s`` (rounded up to one slot) without storing samples.  Times are
+    ``time.perf_counter_ns`` values supplied by the caller, who already has
+    them from measuring the latency.  :meth:`reset` is O(1); the slots are
+    cleared lazily on the next use.
+    """
+
+    __slots__ = (
+        "window_ns",
+        "_slot_ns",
+        "_slots",
+        "_index",
+        "_current",
+        "_slot_end",
+        "total",
+    )
+
+    def __init__(self, window_s: float = 60.0, slots: int = 6) -> None:
+        slots = max(1, int(slots))
+        self.window_ns = int(window_s * 1e9)
+        self._slot_ns = max(1, self.window_ns // slots)
+        self._slots = [LatencyHistogram() for _ in range(slots)]
+        self._index = 0
+        self._current = self._slots[0]
+        self._slot_end = 0  # 0 marks every slot as stale
+        self.total = 0
+
+    def record(self, value_ns: int, now_ns: int) -> None:
+        if now_ns >= self._slot_end:
+            self._advance(now_ns)
+        # LatencyHistogram.record inlined: this runs on every controller call
+        if value_ns < _SUB_BUCKETS:
+            if value_ns < 0:
+                value_ns = 0
+            index = value_ns
+        else:
+            shift = value_ns.bit_length() - _SUB_BITS - 1
+            index = (shift << _SUB_BITS) + (value_ns >> shift)
+            if index >= BUCKET_COUNT:
+                index = BUCKET_COUNT - 1
+        current = self._current
+        current._counts[index] += 1
+        current.count += 1
+        current.total_ns += value_ns
+        if value_ns > current.max_ns:
+            current.max_ns = value_ns
+        self.total += 1
+
+    def _advance(self, now_ns: int) -> None:
+        slots = len(self._slots)
+        if self._slot_end:
+            crossed = min((now_ns - self._slot_end) // self._slot_ns + 1, slots)
+        else:
+            crossed = slots
+        for _ in range(crossed):
+            self._index = (self._index + 1) % slots
+            self._slots[self._index].reset()
+        self._current = self._slots[self._index]
+        self._slot_end = now_ns - now_ns % self._slot_ns + self._slot_ns
+
+    def reset(self) -> None:
+        self._slot_end = 0
+        self.total = 0
+
+    def merged(self, now_ns: int) -> LatencyHistogram:
+        """Return one histogram holding the samples inside the window."""
+        if now_ns >= self._slot_end:
+            self._advance(now_ns)
+        merged = LatencyHistogram()
+        for histogram in self._slots:
+            if histogram.count:
+                merged.merge(histogram)
+        return merged
+
+    def snapshot(self, now_ns: int) -> Dict[str, Any]:
+        stats = self.merged(now_ns).snapshot()
+        stats["window_s"] = self.window_ns / 1e9
+        stats["total_count"] = self.total
+        return stats
+
+
+__all__ = [
+    "BUCKET_COUNT",
+    "LatencyHistogram",
+    "WindowedLatencyHistogram",
+    "bucket_index",
+    "bucket_upper_bound",
+]
@@ -1,7 +1,7 @@
 import cv2
 import pytest
 
-from cvd.controllers.camera_utils import apply_uvc_settings
+from cvd.controllers.camera_utils import UvcState, apply_uvc_settings
 from cvd.controllers.webcam import CameraCaptureController, MotionDetectionController
 from cvd.controllers.controller_base import ControllerConfig
 
@@ -32,10 +32,11 @@ async def test_camera_controller_apply_uvc(monkeypatch):
     cap = DummyCapture()
     applied = {}
 
-    async def dummy_apply(capture, settings, controller_id=None):
+    async def dummy_apply(capture, settings, controller_id=None, state=None):
         applied["capture"] = capture
         applied["settings"] = settings
         applied["controller_id"] = controller_id
+        applied["state"] = state
 
     monkeypatch.setattr(
         "cvd.controllers.webcam.camera_capture_controller.apply_uvc_settings",
@@ -50,6 +51,7 @@ async def test_camera_controller_apply_uvc(monkeypatch):
     assert applied["capture"] is cap
     assert applied["settings"] == {"brightness": 2}
     assert applied["controller_id"] == "cam"
+    assert applied["state"] is ctrl._uvc_state and applied["state"].capture is cap
 
 
 @pytest.mark.asyncio
@@ -57,10 +59,11 @@ async def test_motion_controller_apply_uvc_defaults(monkeypatch):
     cap = DummyCapture()
     applied = {}
 
-    async def dummy_apply(capture, settings, controller_id=None):
+    async def dummy_apply(capture, settings, controller_id=None, state=None):
         applied["capture"] = capture
         applied["settings"] = settings
         applied["controller_id"] = controller_id
+        applied["state"] = state
 
     monkeypatch.setattr(
         "cvd.controllers.webcam.motion_detection.apply_uvc_settings",
@@ -74,3 +77,81 @@ async def test_motion_controller_apply_uvc_defaults(monkeypatch):
     assert applied["capture"] is cap
     assert applied["settings"] == {"gain": 1}
     assert applied["controller_id"] == "md"
+
+
+@pytest.mark.asyncio
+async def test_only_changed_properties_applied_in_one_call(monkeypatch):
+    cap = DummyCapture()
+    io_calls = []
+
+    async def counting(fn, *args, **kwargs):
+        io_calls.append(fn)
+        return fn(*args, **kwargs)
+
+    monkeypatch.setattr("cvd.controllers.camera_utils.run_camera_io", counting)
+    state = UvcState(cap)
+    await apply_uvc_settings(
+        cap, {"brightness": 10, "contrast": 5, "bogus": 1}, state=state
+    )
+    assert len(io_calls) == 1
+    assert sorted(cap.calls) == sorted(
+        [(cv2.CAP_PROP_BRIGHTNESS, 10.0), (cv2.CAP_PROP_CONTRAST, 5.0)]
+    )
+
+    cap.calls.clear()
+    await apply_uvc_settings(cap, {"brightness": 10, "contrast": 6}, state=state)
+    await apply_uvc_settings(cap, {"brightness": 10}, state=state)
+    assert cap.calls == [(cv2.CAP_PROP_CONTRAST, 6.0)]
+    assert len(io_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_rapid_updates_coalesce_to_latest(monkeypatch):
+    import asyncio
+
+    cap = DummyCapture()
+    release = asyncio.Event()
+    io_calls = []
+
+    async def slow(fn, *args, **kwargs):
+        io_calls.append(args[1])
+        await release.wait()
+        return fn(*args, **kwargs)
+
+    monkeypatch.setattr("cvd.controllers.camera_utils.run_camera_io", slow)
+    state = UvcState(cap)
+    first = asyncio.create_task(apply_uvc_settings(cap, {"brightness": 1}, state=state))
+    await asyncio.sleep(0)
+    rest = [
+        asyncio.create_task(apply_uvc_settings(cap, {"brightness": value}, state=state))
+        for value in (2, 3, 4)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, *rest)
+
+    assert io_calls == [{"brightness": 1.0}, {"brightness": 4.0}]
+    assert cap.calls[-1] == (cv2.CAP_PROP_BRIGHTNESS, 4.0)
+
+
+@pytest.mark.asyncio
+async def test_uvc_state_follows_the_controllers_capture(monkeypatch):
+    monkeypatch.setattr("cvd.controllers.camera_utils.run_camera_io", immediate)
+    ctrl = CameraCaptureController(
+        "cam",
+        ControllerConfig(controller_id="cam", controller_type="camera_capture"),
+    )
+    first = DummyCapture()
+    first.release = lambda: None
+    ctrl._capture = first
+    await ctrl.apply_uvc_settings({"brightness": 2})
+    await ctrl.apply_uvc_settings({"brightness": 2})
+    assert first.calls == [(cv2.CAP_PROP_BRIGHTNESS, 2.0)]
+
+    await ctrl.cleanup_capture()
+    assert ctrl._uvc_state is None  # the released handle is not kept alive
+
+    second = DummyCapture()
+    ctrl._capture = second
+    await ctrl.apply_uvc_settings({"brightness": 2})
+    assert second.calls == [(cv2.CAP_PROP_BRIGHTNESS, 2.0)]
@@ -200,6 +200,61 @@ async def test_probe_camera_modes_single_capture(monkeypatch):
     assert modes
 
 
+def test_camera_identity_from_sysfs(tmp_path, monkeypatch):
+    from src.controllers import camera_utils
+
+    usb = tmp_path / "devices" / "1-2"
+    (usb / "1-2:1.0").mkdir(parents=True)
+    (usb / "idVendor").write_text("046d\n")
+    (usb / "idProduct").write_text("0825\n")
+    node = tmp_path / "video4linux" / "video0"
+    node.mkdir(parents=True)
+    (node / "name").write_text("UVC Camera\n")
+    (node / "device").symlink_to(usb / "1-2:1.0")
+    monkeypatch.setattr(camera_utils, "V4L2_SYSFS_ROOT", tmp_path / "video4linux")
+
+    assert camera_utils.camera_identity(0) == "v4l2:UVC Camera:1-2:1.0:046d:0825"
+    assert camera_utils.camera_identity(1, cv2.CAP_V4L2) == (
+        f"backend{cv2.CAP_V4L2}:index1"
+    )
+
+
+def test_enumerate_cameras_skips_metadata_nodes(tmp_path, monkeypatch):
+    from src.controllers import camera_utils
+
+    for idx, node_index in ((0, "0"), (1, "1"), (2, "0")):
+        node = tmp_path / f"video{idx}"
+        node.mkdir()
+        (node / "name").write_text(f"Cam {idx}\n")
+        (node / "index").write_text(node_index)
+    monkeypatch.setattr(camera_utils, "V4L2_SYSFS_ROOT", tmp_path)
+
+    cameras = camera_utils.enumerate_cameras()
+    assert [cam.index for cam in cameras] == [0, 2]
+    assert cameras[1].path == "/dev/video2"
+
+    monkeypatch.setattr(camera_utils, "V4L2_SYSFS_ROOT", tmp_path / "missing")
+    assert camera_utils.enumerate_cameras() == []
+
+@pytest.mark.asyncio
+async def test_camera_mode_cache_roundtrip(tmp_path, monkeypatch):
+    from src.controllers import camera_utils
+
+    monkeypatch.setattr(camera_utils, "run_file_io", immediate)
+    cache = tmp_path / "camera_modes.json"
+
+    assert await camera_utils.load_cached_camera_modes("cam", cache) is None
+    await camera_utils.store_camera_modes("cam", [(640, 480, 30)], cache)
+    await camera_utils.store_camera_modes("other", [(320, 240, 15)], cache)
+    await camera_utils.store_camera_modes("cam", [], cache)
+
+    assert await camera_utils.load_cached_camera_modes("cam", cache) == [
+        (640, 480, 30)
+    ]
+    assert await camera_utils.load_cached_camera_modes("other", cache) == [
+        (320, 240, 15)
+    ]
+
 @pytest.mark.asyncio
 async def test_reinitialize_on_none(monkeypatch):
     from cvd.controllers import webcam as controller_data_sources
@@ -406,3 +461,116 @@ async def test_camera_access_diagnostics(monkeypatch):
     assert 1 in backend_calls
     assert notifications
     assert any(call[1].get("backend") == 1 for call in infos)
+
+
+class ModeCapture(DummyCapture):
+    """Capture that only supports the sizes in ``modes``."""
+
+    modes = {(640, 480), (1280, 720)}
+
+    def __init__(self, index):
+        super().__init__(index)
+        self.props = {cv2.CAP_PROP_FRAME_WIDTH: 640, cv2.CAP_PROP_FRAME_HEIGHT: 480}
+        self._pending = {}
+
+    def read(self):
+        return True, np.zeros((1, 1, 3), dtype=np.uint8)
+
+    def set(self, prop, value):
+        self._pending[prop] = value
+        size = (
+            self._pending.get(cv2.CAP_PROP_FRAME_WIDTH),
+            self._pending.get(cv2.CAP_PROP_FRAME_HEIGHT),
+        )
+        if size in self.modes:
+            self.props[cv2.CAP_PROP_FRAME_WIDTH] = size[0]
+            self.props[cv2.CAP_PROP_FRAME_HEIGHT] = size[1]
+        return True
+
+    def get(self, prop):
+        return self.props.get(prop, 0)
+
+
+@pytest.mark.asyncio
+async def test_access_test_handle_reused_on_start(monkeypatch):
+    from cvd.controllers import webcam as controller_data_sources
+
+    cap_module = controller_data_sources.camera_capture_controller
+    base_module = controller_data_sources.base_camera_capture
+
+    monkeypatch.setattr(cap_module, "run_camera_io", immediate)
+    monkeypatch.setattr(base_module, "run_camera_io", immediate)
+    monkeypatch.setattr("cvd.gui.ui_helpers.notify_later", lambda *a, **k: None)
+
+    opened = []
+
+    def video_capture(idx, backend=None):
+        cap = ModeCapture(idx)
+        opened.append(cap)
+        return cap
+
+    monkeypatch.setattr(cap_module.cv2, "VideoCapture", video_capture)
+    monkeypatch.setattr(base_module.cv2, "VideoCapture", video_capture)
+
+    cfg = ControllerConfig(
+        controller_id="cam",
+        controller_type="camera_capture",
+        parameters={"device_index": 0, "fps": 10, "capture_backend": 0},
+    )
+    controller = CameraCaptureController("cam", cfg)
+
+    assert await controller.test_camera_access()
+    assert await controller.initialize()
+    # a second access test while the handle is open must not reopen the device
+    assert await controller.test_camera_access()
+    assert len(opened) == 1
+    assert controller._capture is opened[0] and opened[0].opened
+    await controller.cleanup()
+    assert not opened[0].opened
+
+
+@pytest.mark.asyncio
+async def test_fallback_resolution_handle_not_reused(monkeypatch):
+    from cvd.controllers import webcam as controller_data_sources
+
+    cap_module = controller_data_sources.camera_capture_controller
+    base_module = controller_data_sources.base_camera_capture
+
+    monkeypatch.setattr(cap_module, "run_camera_io", immediate)
+    monkeypatch.setattr(base_module, "run_camera_io", immediate)
+    monkeypatch.setattr("cvd.gui.ui_helpers.notify_later", lambda *a, **k: None)
+
+    opened = []
+
+    class NoHD(ModeCapture):
+        modes = {(640, 480)}
+
+        def read(self):
+            # the configured 1920x1080 mode delivers no frames
+            return self.props[cv2.CAP_PROP_FRAME_WIDTH] == 640, None
+
+    def video_capture(idx, backend=None):
+        cap = NoHD(idx)
+        opened.append(cap)
+        return cap
+
+    monkeypatch.setattr(cap_module.cv2, "VideoCapture", video_capture)
+    monkeypatch.setattr(base_module.cv2, "VideoCapture", video_capture)
+
+    cfg = ControllerConfig(
+        controller_id="cam",
+        controller_type="camera_capture",
+        parameters={"device_index": 0, "width": 1920, "height": 1080},
+    )
+    controller = CameraCaptureController("cam", cfg)
+
+    assert await controller.test_camera_access()
+    assert controller._capture is None  # 640x480 fallback handle released
+    assert all(not cap.opened for cap in opened)
+    assert controller.capture_backend is None
+
+    # a kept handle that lost the configured mode is released on reuse
+    kept = NoHD(0)
+    controller._capture = kept
+    await controller._reuse_capture()
+    assert not kept.opened and controller._capture is None
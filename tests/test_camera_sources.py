@@ -0,0 +1,69 @@
+import cv2
+import numpy as np
+import pytest
+
+from cvd.controllers.controller_base import ControllerConfig
+from cvd.controllers.webcam import CameraCaptureController
+from cvd.controllers.webcam.camera_sources import (
+    FileCapture,
+    SyntheticCapture,
+    open_source_capture,
+)
+
+
+async def immediate(fn, *args, **kwargs):
+    return fn(*args, **kwargs)
+
+
+def test_synthetic_capture_follows_motion_schedule():
+    cap = SyntheticCapture(64, 48, fps=10, noise=0, motion_schedule=[[0.5, 1.0]])
+    frames = [cap.read()[1] for _ in range(10)]
+
+    assert frames[0].shape == (48, 64, 3) and frames[0].dtype == np.uint8
+    # static before 0.5 s, moving inside the window
+    assert np.array_equal(frames[1], frames[4])
+    assert not np.array_equal(frames[5], frames[7])
+
+    assert cap.set(cv2.CAP_PROP_FRAME_WIDTH, 32)
+    assert cap.read()[1].shape == (48, 32, 3)
+    cap.release()
+    assert cap.read() == (False, None)
+
+
+def test_file_capture_loops_image_sequence(tmp_path):
+    for i in range(3):
+        cv2.imwrite(str(tmp_path / f"{i:03d}.png"), np.full((8, 8, 3), i, np.uint8))
+
+    cap = FileCapture(str(tmp_path / "*.png"))
+    values = [int(cap.read()[1][0, 0, 0]) for _ in range(4)]
+    assert values == [0, 1, 2, 0]
+    assert cap.get(cv2.CAP_PROP_FRAME_WIDTH) == 8
+
+    once = FileCapture(str(tmp_path), loop=False)
+    assert [once.read()[0] for _ in range(4)] == [True, True, True, False]
+
+
+def test_unknown_source_rejected():
+    with pytest.raises(ValueError):
+        open_source_capture({"type": "camera"})
+
+
+@pytest.mark.asyncio
+async def test_controller_streams_from_synthetic_source(monkeypatch):
+    from cvd.controllers import webcam
+
+    monkeypatch.setattr(webcam.base_camera_capture, "run_camera_io", immediate)
+    monkeypatch.setattr(webcam.camera_capture_controller, "run_camera_io", immediate)
+    monkeypatch.setattr("cvd.gui.ui_helpers.notify_later", lambda *a, **k: None)
+    cfg = ControllerConfig(
+        controller_id="cam",
+        controller_type="camera_capture",
+        parameters={"width": 80, "height": 60, "source": {"type": "synthetic"}},
+    )
+    ctrl = CameraCaptureController("cam", cfg)
+
+    assert await ctrl.test_camera_access()
+    assert isinstance(ctrl._capture, SyntheticCapture)
+    ret, frame = ctrl._capture.read()
+    assert ret and frame.shape == (60, 80, 3)
+    await ctrl.cleanup()
@@ -0,0 +1,167 @@
+import asyncio
+import os
+import time
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+from src.controllers.controller_base import (
+    ControllerConfig,
+    ControllerInput,
+    ControllerResult,
+    ControllerStage,
+    ControllerStatus,
+)
+from src.controllers.controller_manager import ControllerManager
+from src.controllers.controller_registry import CONTROLLER_CLASS_MAP
+from src.controllers.process_isolation import ProcessIsolatedController
+
+
+class DoublingController(ControllerStage):
+    def __init__(self, controller_id, config):
+        super().__init__(controller_id, config)
+        self.calls = 0
+
+    async def process(self, input_data):
+        if input_data.metadata.get("crash"):
+            os._exit(3)
+        time.sleep(input_data.metadata.get("sleep", 0))
+        self.calls += 1
+        image = input_data.sensor_data["image"]
+        return ControllerResult.success_result(
+            {"pid": os.getpid(), "calls": self.calls, "image": image * 2}
+        )
+
+
+def make_proxy(**parameters):
+    config = ControllerConfig("double", "doubling", parameters=parameters)
+    return ProcessIsolatedController("double", config, DoublingController)
+
+
+@pytest.mark.asyncio
+async def test_isolated_controller_keeps_state_in_worker():
+    proxy = make_proxy()
+    assert await proxy.start()
+    try:
+        image = np.full((480, 640, 3), 7, dtype=np.uint8)
+        first = await proxy.process_with_timing(ControllerInput({"image": image}))
+        second = await proxy.process_with_timing(ControllerInput({"image": image}))
+
+        assert first.success and second.success
+        assert second.data["pid"] == proxy.pid != os.getpid()
+        assert second.data["calls"] == 2
+        assert np.array_equal(second.data["image"], image * 2)
+        assert proxy.get_output()["calls"] == 2
+    finally:
+        await proxy.stop()
+    assert proxy.pid is None
+
+
+@pytest.mark.asyncio
+async def test_crashed_worker_is_restarted():
+    proxy = make_proxy(max_restarts=1)
+    assert await proxy.start()
+    try:
+        image = np.zeros((4, 4), dtype=np.uint8)
+        await proxy.process_with_timing(ControllerInput({"image": image}))
+        old_pid = proxy.pid
+
+        crashed = await proxy.process_with_timing(
+            ControllerInput({"image": image}, metadata={"crash": True})
+        )
+        assert not crashed.success
+        assert "crashed" in crashed.error_message
+        assert proxy.status == ControllerStatus.RUNNING
+        assert proxy.pid not in (None, old_pid)
+
+        result = await proxy.process_with_timing(ControllerInput({"image": image}))
+        assert result.data["calls"] == 1  # fresh worker state
+        assert proxy.get_stats()["isolation"]["restarts"] == 1
+
+        # restart budget exhausted
+        await proxy.process_with_timing(
+            ControllerInput({"image": image}, metadata={"crash": True})
+        )
+        assert proxy.status == ControllerStatus.ERROR
+    finally:
+        await proxy.stop()
+
+
+@pytest.mark.asyncio
+async def test_crashed_worker_arena_is_unlinked():
+    proxy = make_proxy()
+    assert await proxy.start()
+    try:
+        image = np.zeros((256, 256), dtype=np.uint8)  # shared, not pickled
+        await proxy.process_with_timing(ControllerInput({"image": image}))
+        name = proxy._reader._shm.name
+
+        await proxy.process_with_timing(
+            ControllerInput({"image": image}, metadata={"crash": True})
+        )
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)
+    finally:
+        await proxy.stop()
+
+
+@pytest.mark.asyncio
+async def test_restart_budget_resets_after_healthy_operation():
+    proxy = make_proxy(max_restarts=1, restart_reset_s=0)
+    assert await proxy.start()
+    try:
+        image = np.zeros((4, 4), dtype=np.uint8)
+        for _ in range(3):
+            await proxy.process_with_timing(
+                ControllerInput({"image": image}, metadata={"crash": True})
+            )
+            assert proxy.status == ControllerStatus.RUNNING
+        stats = proxy.get_stats()["isolation"]
+        assert stats["crashes"] == 3
+        assert stats["restarts"] == 1
+    finally:
+        await proxy.stop()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_call_does_not_block_the_next_one():
+    proxy = make_proxy()
+    assert await proxy.start()
+    try:
+        image = np.zeros((4, 4), dtype=np.uint8)
+        slow = ControllerInput({"image": image}, metadata={"sleep": 5})
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(proxy.process(slow), 0.2)
+
+        result = await asyncio.wait_for(
+            proxy.process_with_timing(ControllerInput({"image": image})), 3
+        )
+        assert result.success
+        assert result.data["calls"] == 1  # answered by the replacement worker
+        assert proxy.get_stats()["isolation"]["abandoned"] == 1
+    finally:
+        await proxy.stop()
+
+
+@pytest.mark.asyncio
+async def test_manager_creates_isolated_controller(monkeypatch):
+    monkeypatch.setitem(CONTROLLER_CLASS_MAP, "doubling", DoublingController)
+    manager = ControllerManager(enable_parallel_execution=False)
+    controller = manager.add_controller_from_config(
+        {"controller_id": "double", "type": "doubling", "isolation": "process"}
+    )
+    assert isinstance(controller, ProcessIsolatedController)
+    assert (
+        manager.create_controller(
+            {"controller_id": "other", "type": "doubling", "isolation": "thread"}
+        )
+        is None
+    )
+
+    await manager.start_all_controllers()
+    try:
+        results = await manager.process_data({"image": np.ones(3, dtype=np.uint8)})
+        assert results["double"].data["image"].tolist() == [2, 2, 2]
+    finally:
+        await manager.stop_all_controllers()
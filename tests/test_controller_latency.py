@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from src.controllers.controller_base import (
+    ControllerConfig,
+    ControllerResult,
+    ControllerStage,
+)
+from src.controllers.controller_manager import ControllerManager
+from src.utils.latency_histogram import WindowedLatencyHistogram
+
+
+class SleepController(ControllerStage):
+    def __init__(self, controller_id: str, delay: float):
+        super().__init__(controller_id, ControllerConfig(controller_id, "custom"))
+        self.delay = delay
+
+    async def process(self, input_data):
+        await asyncio.sleep(self.delay)
+        return ControllerResult.success_result({})
+
+
+def test_window_drops_old_slots():
+    hist = WindowedLatencyHistogram(window_s=1.0, slots=4)
+    second = 1_000_000_000
+    hist.record(5_000_000, now_ns=0)
+    hist.record(1_000_000, now_ns=second // 2)
+    assert hist.snapshot(second // 2)["count"] == 2
+    assert hist.snapshot(second // 2)["max_ms"] == pytest.approx(5.0)
+
+    # the first sample ages out of the window, the second one is still in
+    snap = hist.snapshot(second + second // 4)
+    assert snap["count"] == 1
+    assert snap["max_ms"] == pytest.approx(1.0)
+    assert snap["total_count"] == 2
+
+    assert hist.snapshot(10 * second)["count"] == 0
+
+
+def test_window_reset_is_lazy():
+    hist = WindowedLatencyHistogram(window_s=1.0, slots=4)
+    hist.record(1_000, now_ns=10)
+    hist.reset()
+    assert hist.snapshot(20)["count"] == 0
+    hist.record(2_000, now_ns=30)
+    assert hist.snapshot(40)["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_manager_reports_processing_percentiles():
+    manager = ControllerManager()
+    manager.register_controller(SleepController("fast", 0))
+    manager.register_controller(SleepController("slow", 0.02))
+    await manager.start_all_controllers()
+    for _ in range(5):
+        await manager.process_data({})
+
+    stats = manager.get_processing_stats()
+    assert stats["cycle"]["count"] == 5
+    slow = stats["controllers"]["slow"]
+    assert slow["count"] == 5
+    assert slow["p50_ms"] >= 15
+    assert slow["p99_ms"] <= slow["max_ms"]
+    assert stats["controllers"]["fast"]["p99_ms"] < slow["p50_ms"]
+
+    manager.reset_processing_stats("slow")
+    stats = manager.get_processing_stats()
+    assert stats["controllers"]["slow"]["count"] == 0
+    assert stats["controllers"]["fast"]["count"] == 5
+
+    manager.reset_processing_stats()
+    assert manager.get_processing_stats()["cycle"]["count"] == 0
+    await manager.stop_all_controllers()
@@ -0,0 +1,76 @@
+import asyncio
+import time
+
+import pytest
+
+from src.controllers.controller_base import (
+    ControllerConfig,
+    ControllerResult,
+    ControllerStage,
+    ControllerStatus,
+)
+from src.controllers.controller_manager import ControllerManager
+
+
+class SlowController(ControllerStage):
+    def __init__(self, controller_id: str, events: list, delay: float = 0.1):
+        super().__init__(controller_id, ControllerConfig(controller_id, "custom"))
+        self.events = events
+        self.delay = delay
+
+    async def initialize(self):
+        self.events.append(("start", self.controller_id))
+        await asyncio.sleep(self.delay)
+        return True
+
+    async def cleanup(self):
+        self.events.append(("stop", self.controller_id))
+        await asyncio.sleep(self.delay)
+
+    async def process(self, input_data):
+        return ControllerResult.success_result(None)
+
+
+def build(events, **kwargs):
+    manager = ControllerManager(**kwargs)
+    for cid in ("cam1", "cam2", "cam3", "motion"):
+        manager.register_controller(SlowController(cid, events))
+    manager.add_dependency("cam1", "motion")
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_stages_start_and_stop_concurrently_in_order():
+    events = []
+    manager = build(events)
+
+    start = time.perf_counter()
+    assert await manager.start_all_controllers()
+    # two stages of 0.1 s instead of four sequential starts
+    assert time.perf_counter() - start < 0.35
+    assert events[-1] == ("start", "motion")
+
+    events.clear()
+    await manager.stop_all_controllers()
+    assert events[0] == ("stop", "motion")
+
+    lifecycle = manager.get_lifecycle_stats()
+    assert set(lifecycle) == {"cam1", "cam2", "cam3", "motion"}
+    assert lifecycle["cam2"]["start_ms"] >= 90
+    assert lifecycle["cam2"]["stop_ms"] >= 90
+    assert not lifecycle["cam2"]["start_timed_out"]
+
+
+@pytest.mark.asyncio
+async def test_start_timeout_marks_controller_failed():
+    events = []
+    manager = build(events, start_timeout_s=0.5, stop_timeout_s=0.5)
+    manager.get_controller("cam3").delay = 2.0
+
+    assert not await manager.start_all_controllers()
+    assert manager.get_controller("cam3").status == ControllerStatus.ERROR
+    assert manager.get_controller("motion").status == ControllerStatus.RUNNING
+    assert manager.get_lifecycle_stats()["cam3"]["start_timed_out"]
+
+    await manager.stop_all_controllers()
+    assert manager.get_lifecycle_stats()["cam3"]["stop_timed_out"]
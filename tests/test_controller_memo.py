@@ -0,0 +1,131 @@
+import pytest
+
+from src.controllers.controller_base import (
+    ControllerConfig,
+    ControllerResult,
+    ControllerStage,
+    ControllerStatus,
+)
+from src.controllers.controller_manager import ControllerManager
+
+
+class CountingController(ControllerStage):
+    def __init__(self, controller_id: str, **parameters):
+        super().__init__(
+            controller_id,
+            ControllerConfig(controller_id, "custom", parameters=parameters),
+        )
+        self.runs = 0
+
+    async def process(self, input_data):
+        self.runs += 1
+        return ControllerResult.success_result({"run": self.runs})
+
+
+class PureController(CountingController):
+    pure = True
+
+
+async def build(source_cls=CountingController):
+    manager = ControllerManager(enable_parallel_execution=False)
+    manager.register_controller(source_cls("motion"))
+    manager.register_controller(PureController("state"))
+    manager.register_controller(PureController("alarm"))
+    manager.add_dependency("motion", "state")
+    manager.add_dependency("state", "alarm")
+    await manager.start_all_controllers()
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_pure_controllers_skip_unchanged_inputs():
+    manager = await build()
+    motion = manager.get_controller("motion")
+    state = manager.get_controller("state")
+
+    # motion produces a new output version every pass
+    await manager.process_data({})
+    await manager.process_data({})
+    assert state.runs == 2
+    assert motion.output_version == 2
+
+    # freeze motion: its result is reused, so nothing downstream reruns
+    motion.pure = True
+    results = await manager.process_data({})
+    results = await manager.process_data({})
+    assert motion.runs == 3
+    assert state.runs == 3
+    assert results["state"].data == {"run": 3}
+
+    skipped = {
+        cid: entry["skipped"]
+        for cid, entry in manager.get_processing_stats()["controllers"].items()
+    }
+    assert skipped == {"motion": 1, "state": 1, "alarm": 1}
+    await manager.stop_all_controllers()
+
+
+@pytest.mark.asyncio
+async def test_published_output_invalidates_memo():
+    manager = await build()
+    motion = manager.get_controller("motion")
+    motion.pure = True
+    await manager.process_data({})
+    await manager.process_data({})
+    state = manager.get_controller("state")
+    assert state.runs == 1
+
+    motion.publish_output({"run": "external"})  # new version outside process()
+    await manager.process_data({})
+    assert motion.runs == 2
+    assert state.runs == 2
+    await manager.stop_all_controllers()
+
+
+@pytest.mark.asyncio
+async def test_memo_not_used_for_disabled_or_failed_controllers():
+    manager = await build()
+    manager.get_controller("motion").pure = True
+    state = manager.get_controller("state")
+    await manager.process_data({})
+    results = await manager.process_data({})
+    assert results["state"].data == {"run": 1}
+
+    # disabled controllers answer with an empty result, not the memo
+    state.enabled = False
+    results = await manager.process_data({})
+    assert results["state"].data is None
+
+    state.enabled = True
+    results = await manager.process_data({})
+    assert results["state"].data == {"run": 2}
+
+    # a failed controller is skipped and starts from scratch on recovery
+    state.status = ControllerStatus.ERROR
+    results = await manager.process_data({})
+    assert "state" not in results
+
+    state.status = ControllerStatus.RUNNING
+    results = await manager.process_data({})
+    assert results["state"].data == {"run": 3}
+    await manager.stop_all_controllers()
+
+
+@pytest.mark.asyncio
+async def test_sensor_inputs_disable_memoization():
+    manager = ControllerManager(enable_parallel_execution=False)
+    manager.register_controller(PureController("derived"))
+    await manager.start_all_controllers()
+    await manager.process_data({"temp": 20})
+    await manager.process_data({"temp": 20})
+    assert manager.get_controller("derived").runs == 2
+
+    await manager.process_data({})
+    await manager.process_data({})
+    assert manager.get_controller("derived").runs == 3
+    await manager.stop_all_controllers()
+
+
+def test_pure_can_be_set_from_parameters():
+    assert CountingController("a", pure=True).pure is True
+    assert PureController("b", pure=False).pure is False
@@ -0,0 +1,78 @@
+import pytest
+
+from src.controllers.controller_base import (
+    ControllerConfig,
+    ControllerResult,
+    ControllerStage,
+)
+from src.controllers.controller_manager import ControllerManager
+
+
+class EchoController(ControllerStage):
+    def __init__(self, controller_id: str, **config):
+        super().__init__(
+            controller_id, ControllerConfig(controller_id, "custom", **config)
+        )
+        self.inputs = []
+
+    async def process(self, input_data):
+        self.inputs.append(input_data)
+        return ControllerResult.success_result(
+            {"frame": self.controller_id, "extra": 1}
+        )
+
+
+def build_manager():
+    manager = ControllerManager(enable_parallel_execution=False)
+    for cid in ("camera", "aux"):
+        manager.register_controller(EchoController(cid))
+    manager.register_controller(EchoController("motion", input_controllers=["camera"]))
+    manager.register_controller(EchoController("state", input_sensors=["temp"]))
+    manager.add_dependency("camera", "motion", data_mapping={"frame": "image"})
+    manager.add_dependency("aux", "motion")
+    manager.add_dependency("motion", "state")
+    return manager
+
+
+def test_plan_compiles_order_and_inputs():
+    plan = build_manager().execution_plan
+
+    assert plan.order == ("camera", "aux", "motion", "state")
+    assert plan.stages == (("camera", "aux"), ("motion",), ("state",))
+    assert plan.dependents["camera"] == ("motion",)
+    # "aux" is filtered out by input_controllers at compile time
+    assert plan.inputs["motion"].sources == (("camera", (("frame", "image"),)),)
+    assert plan.inputs["state"].sensors == ("temp",)
+    with pytest.raises(TypeError):
+        plan.inputs["state"] = None
+
+
+def test_cycle_is_rejected_and_plan_kept():
+    manager = build_manager()
+    plan = manager.execution_plan
+    with pytest.raises(ValueError):
+        manager.add_dependency("state", "camera")
+    assert manager.execution_plan is plan
+    assert len(manager._dependencies) == 3
+
+
+def test_unregister_recompiles_dependents():
+    manager = build_manager()
+    manager.unregister_controller("camera")
+    plan = manager.execution_plan
+    assert "camera" not in plan.inputs
+    assert plan.inputs["motion"].sources == ()
+
+
+@pytest.mark.asyncio
+async def test_pass_uses_compiled_inputs():
+    manager = build_manager()
+    await manager.start_all_controllers()
+    await manager.process_data({"temp": 21.5, "humidity": 40})
+    await manager.stop_all_controllers()
+
+    motion_input = manager.get_controller("motion").inputs[0]
+    assert motion_input.controller_data == {"camera": {"image": "camera"}}
+    state_input = manager.get_controller("state").inputs[0]
+    assert state_input.sensor_data == {"temp": 21.5}
+    assert state_input.controller_data["motion"]["frame"] == "motion"
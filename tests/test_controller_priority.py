@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from src.controllers.controller_base import (
+    ControllerConfig,
+    ControllerResult,
+    ControllerStage,
+)
+from src.controllers.controller_manager import ControllerManager
+
+
+class SleepingController(ControllerStage):
+    def __init__(self, controller_id: str, log: list, delay: float = 0.0, **parameters):
+        super().__init__(
+            controller_id,
+            ControllerConfig(controller_id, "custom", parameters=parameters),
+        )
+        self.log = log
+        self.delay = delay
+
+    async def process(self, input_data):
+        self.log.append(self.controller_id)
+        await asyncio.sleep(self.delay)
+        return ControllerResult.success_result({"id": self.controller_id})
+
+
+async def build(parallel: bool, *controllers):
+    manager = ControllerManager(enable_parallel_execution=parallel, max_concurrency=1)
+    for controller in controllers:
+        manager.register_controller(controller)
+    await manager.start_all_controllers()
+    return manager
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("parallel", [False, True])
+async def test_higher_priority_runs_first(parallel):
+    log = []
+    manager = await build(
+        parallel,
+        SleepingController("low", log, priority=-1),
+        SleepingController("normal", log),
+        SleepingController("high", log, priority=5),
+    )
+    assert manager.execution_plan.stages == (("high", "normal", "low"),)
+
+    await manager.process_data({})
+    assert log == ["high", "normal", "low"]
+    await manager.stop_all_controllers()
+
+
+@pytest.mark.asyncio
+async def test_overdue_run_is_skipped():
+    log = []
+    manager = await build(
+        False,
+        SleepingController("motion", log, delay=0.05, priority=1),
+        SleepingController("report", log, deadline_ms=10),
+    )
+
+    results = await manager.process_data({})
+    assert "report" not in results
+    assert log == ["motion"]
+    stats = manager.get_processing_stats()["controllers"]["report"]
+    assert stats["deadline_misses"] == {"skipped": 1, "cancelled": 0, "late": 0}
+    await manager.stop_all_controllers()
+
+
+@pytest.mark.asyncio
+async def test_run_exceeding_deadline_is_cancelled():
+    log = []
+    slow = SleepingController("slow", log, delay=1.0, deadline_ms=20)
+    manager = ControllerManager(enable_parallel_execution=True)
+    manager.register_controller(slow)
+    manager.register_controller(SleepingController("motion", log, priority=1))
+    await manager.start_all_controllers()
+
+    results = await asyncio.wait_for(manager.process_data({}), 0.5)
+    assert results["motion"].success
+    assert not results["slow"].success
+    assert "Deadline" in results["slow"].error_message
+    stats = manager.get_processing_stats()["controllers"]
+    assert stats["slow"]["deadline_misses"] == {"skipped": 0, "cancelled": 1, "late": 0}
+    assert stats["motion"]["deadline_misses"] == {
+        "skipped": 0,
+        "cancelled": 0,
+        "late": 0,
+    }
+
+    manager.reset_processing_stats()
+    stats = manager.get_processing_stats()["controllers"]
+    assert stats["slow"]["deadline_misses"]["cancelled"] == 0
+    await manager.stop_all_controllers()
+
+
+@pytest.mark.asyncio
+async def test_high_priority_run_only_records_missed_deadline():
+    log = []
+    manager = await build(
+        False,
+        SleepingController("slow", log, delay=0.05, priority=5),
+        SleepingController("motion", log, delay=0.05, priority=1, deadline_ms=20),
+    )
+
+    results = await manager.process_data({})
+    assert log == ["slow", "motion"]
+    assert results["motion"].success
+    stats = manager.get_processing_stats()["controllers"]["motion"]
+    assert stats["deadline_misses"] == {"skipped": 0, "cancelled": 0, "late": 1}
+    await manager.stop_all_controllers()
@@ -0,0 +1,83 @@
+import asyncio
+import contextlib
+
+import pytest
+
+from src.controllers.controller_base import (
+    ControllerConfig,
+    ControllerResult,
+    ControllerStage,
+)
+from src.controllers.controller_manager import ControllerManager
+
+
+class RecordingController(ControllerStage):
+    def __init__(self, controller_id: str, calls: list, delay: float = 0.0):
+        super().__init__(controller_id, ControllerConfig(controller_id, "custom"))
+        self.calls = calls
+        self.delay = delay
+
+    async def process(self, input_data):
+        self.calls.append((self.controller_id, dict(input_data.controller_data)))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return ControllerResult.success_result({"from": self.controller_id})
+
+
+@contextlib.asynccontextmanager
+async def reactive(manager):
+    await manager.start_all_controllers()
+    task = asyncio.create_task(manager.run_reactive())
+    await asyncio.sleep(0)
+    try:
+        yield
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        await manager.stop_all_controllers()
+
+
+@pytest.mark.asyncio
+async def test_published_output_runs_only_dependents():
+    calls = []
+    manager = ControllerManager(enable_parallel_execution=False)
+    for cid in ("camera", "motion", "state", "other"):
+        manager.register_controller(RecordingController(cid, calls))
+    manager.add_dependency("camera", "motion")
+    manager.add_dependency("motion", "state")
+    manager.add_dependency("other", "state")
+
+    async with reactive(manager):
+        await asyncio.sleep(0.05)
+        assert calls == []  # idle graph does nothing
+
+        manager.get_controller("other")._output_cache["other"] = {"cached": True}
+        manager.get_controller("camera").publish_output({"frame": 1})
+        await asyncio.sleep(0.05)
+
+    assert [cid for cid, _ in calls] == ["camera", "motion", "state"]
+    state_inputs = calls[2][1]
+    assert state_inputs["motion"] == {"from": "motion"}
+    assert state_inputs["other"] == {"cached": True}
+    assert manager.get_processing_stats()["reactive"]["passes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_outputs_published_during_a_pass_are_coalesced():
+    calls = []
+    manager = ControllerManager(enable_parallel_execution=False)
+    manager.register_controller(RecordingController("camera", calls))
+    manager.register_controller(RecordingController("motion", calls, delay=0.05))
+    manager.add_dependency("camera", "motion")
+    camera = manager.get_controller("camera")
+
+    async with reactive(manager):
+        camera.publish_output({"frame": 1})
+        await asyncio.sleep(0.01)  # first pass is now busy in "motion"
+        for frame in range(2, 6):
+            camera.publish_output({"frame": frame})
+        await asyncio.sleep(0.2)
+
+    assert [cid for cid, _ in calls].count("motion") == 2
+    assert manager.get_processing_stats()["reactive"]["notifications"] == 5
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from src.controllers.controller_base import ControllerConfig, ControllerStage
+from src.controllers.frame_trace import FrameTracer
+from src.controllers.webcam import base_camera_capture
+from src.controllers.webcam.base_camera_capture import BaseCameraCapture
+from src.controllers.webcam.camera_sources import SyntheticCapture
+from src.utils.latency_histogram import LatencyHistogram, bucket_index
+
+
+def test_histogram_percentiles_within_bucket_resolution():
+    hist = LatencyHistogram()
+    for us in range(1, 1001):
+        hist.record(us * 1000)
+
+    assert hist.count == 1000
+    assert hist.max_ns == 1_000_000
+    assert hist.percentile(50) == pytest.approx(500_000, rel=0.13)
+    assert hist.percentile(99) == pytest.approx(990_000, rel=0.13)
+    assert hist.percentile(100) == 1_000_000
+    snap = hist.snapshot()
+    assert snap["max_ms"] == pytest.approx(1.0)
+    assert snap["mean_ms"] == pytest.approx(0.5005)
+
+    hist.reset()
+    assert hist.snapshot()["p50_ms"] is None
+
+
+def test_bucket_index_is_monotonic():
+    indexes = [bucket_index(v) for v in range(0, 5000, 7)]
+    assert indexes == sorted(indexes)
+
+
+def test_tracer_records_stages_per_camera():
+    tracer = FrameTracer()
+    first = tracer.begin("cam0", captured_ns=1_000)
+    second = tracer.begin("cam0", captured_ns=2_000)
+    other = tracer.begin("cam1", captured_ns=0)
+    assert (first.seq, second.seq, other.seq) == (1, 2, 1)
+
+    second.since_capture("motion_wait", now_ns=5_000)
+    second.span("motion_pool", 5_000, 9_000)
+    other.span("motion_pool", 0, 1_000_000)
+
+    stats = tracer.get_stats("cam0")
+    assert stats["frames"] == 2
+    assert stats["motion_wait"]["count"] == 1
+    assert stats["motion_pool"]["max_ms"] == pytest.approx(0.004)
+    assert set(tracer.get_stats()) == {"cam0", "cam1"}
+
+    tracer.reset("cam1")
+    assert tracer.get_stats("cam1")["motion_pool"]["count"] == 0
+    assert tracer.get_stats("cam0")["motion_pool"]["count"] == 1
+
+
+class TracingCapture(BaseCameraCapture, ControllerStage):
+    def __init__(self):
+        cfg = ControllerConfig(controller_id="cam", controller_type="camera_capture")
+        super().__init__("cam", cfg)
+        self.device_index = 0
+        self.fps = 1000
+        self.rotation = 90
+        self.uvc_settings = {}
+        self.seen = []
+
+    async def handle_frame(self, frame):
+        self.seen.append((self.frame_trace.seq, frame.shape))
+        if len(self.seen) == 3:
+            self._stop_event.set()
+
+    async def process(self, input_data):
+        raise NotImplementedError
+
+
+@pytest.mark.asyncio
+async def test_capture_loop_stamps_frames(monkeypatch):
+    async def immediate(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    tracer = FrameTracer()
+    monkeypatch.setattr(base_camera_capture, "run_camera_io", immediate)
+    monkeypatch.setattr(base_camera_capture, "get_frame_tracer", lambda: tracer)
+
+    controller = TracingCapture()
+    controller._capture = SyntheticCapture(64, 48, 1000, noise=0)
+    await asyncio.wait_for(controller._capture_loop(), timeout=5)
+
+    assert controller.seen == [(1, (64, 48, 3)), (2, (64, 48, 3)), (3, (64, 48, 3))]
+    stats = tracer.get_stats("video0")
+    assert stats["frames"] == 3
+    assert stats["capture_wait"]["count"] == 3
+    assert stats["rotate"]["count"] == 3
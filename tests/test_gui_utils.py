@@ -39,3 +39,37 @@ async def test_generate_mjpeg_stream(monkeypatch):
     with pytest.raises(StopAsyncIteration):
         await gen.__anext__()
 
+
+
+@pytest.mark.asyncio
+async def test_generate_mjpeg_stream_traces_each_frame_once(monkeypatch):
+    from cvd.controllers.frame_trace import FrameTracer
+    from cvd.gui import utils as gui_utils
+
+    monkeypatch.setattr(gui_utils, "run_camera_io", immediate)
+    monkeypatch.setattr(gui_utils.cv2, "imencode", lambda ext, frame: (True, np.array([1], dtype=np.uint8)))
+
+    tracer = FrameTracer()
+    trace = tracer.begin("cam0")
+    frame = np.zeros((10, 10, 3), dtype=np.uint8)
+
+    pairs = [(frame, trace), (frame, trace), (frame, trace)]
+
+    async def frame_source():
+        return pairs.pop(0) if pairs else (frame, newer)
+
+    newer = trace
+    gen = generate_mjpeg_stream(frame_source, fps_cap=1000, timeout=0.01)
+    await gen.__anext__()
+    await gen.__anext__()  # same frame again: not measured twice
+    newer = tracer.begin("cam0")
+    await gen.__anext__()
+    # a newer capture only counts once its own frame is sent
+    assert tracer.get_stats("cam0")["stream_encode"]["count"] == 1
+    await gen.__anext__()
+    await gen.__anext__()  # resumes after the write of the newer frame
+    await gen.aclose()
+
+    stats = tracer.get_stats("cam0")
+    for stage in ("stream_wait", "stream_encode", "stream_write", "display_total"):
+        assert stats[stage]["count"] == 2
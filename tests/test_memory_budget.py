@@ -0,0 +1,139 @@
+import gc
+
+import numpy as np
+import pytest
+
+from cvd.controllers.memory_budget import (
+    BudgetedCache,
+    CompressedFrame,
+    MemoryBudgetManager,
+    estimate_nbytes,
+)
+
+
+def _frame(value: int = 0) -> np.ndarray:
+    return np.full((48, 64, 3), value, dtype=np.uint8)
+
+
+def test_usage_tracked_per_component():
+    mgr = MemoryBudgetManager()
+    a = BudgetedCache("cam.output_cache", mgr)
+    b = BudgetedCache("motion.latest_images", mgr)
+    a["cam"] = _frame()
+    b["frame"] = _frame()
+    b["mask"] = np.zeros((48, 64), dtype=np.uint8)
+
+    stats = mgr.get_stats()
+    assert stats["components"]["cam.output_cache"] == 48 * 64 * 3
+    assert stats["components"]["motion.latest_images"] == 48 * 64 * 4
+    assert stats["total_bytes"] == 48 * 64 * 7
+
+    b["frame"] = _frame(1)  # overwriting does not double count
+    del b["mask"]
+    assert mgr.get_usage("motion.") == {"motion.latest_images": 48 * 64 * 3}
+
+
+def test_lru_entries_evicted_over_budget():
+    mgr = MemoryBudgetManager(2 * 48 * 64 * 3, policy="evict")
+    cache = BudgetedCache("cam", mgr)
+    cache["a"] = _frame()
+    cache["b"] = _frame()
+    cache["a"]  # touch so that "b" becomes least recently used
+    cache["c"] = _frame()
+
+    assert set(cache) == {"a", "c"}
+    assert mgr.get_stats()["evictions"] == 1
+    assert mgr.get_stats()["total_bytes"] <= mgr.max_bytes
+
+
+def test_compress_policy_downgrades_to_jpeg():
+    mgr = MemoryBudgetManager(48 * 64 * 3, policy="compress")
+    cache = BudgetedCache("cam", mgr)
+    cache["old"] = _frame(128)
+    cache["new"] = _frame(64)
+    assert mgr.drain(timeout=5)
+
+    assert isinstance(cache._data["old"], CompressedFrame)
+    restored = cache["old"]
+    assert restored.shape == (48, 64, 3)
+    assert abs(int(restored.mean()) - 128) <= 2
+    assert mgr.get_stats()["compressions"] == 1
+    assert mgr.get_stats()["total_bytes"] < 2 * 48 * 64 * 3
+
+
+def test_collected_cache_releases_accounting():
+    mgr = MemoryBudgetManager()
+    cache = BudgetedCache("tmp", mgr)
+    cache["x"] = _frame()
+    del cache
+    gc.collect()
+    assert mgr.get_stats()["total_bytes"] == 0
+
+
+def test_unknown_policy_rejected():
+    with pytest.raises(ValueError):
+        MemoryBudgetManager(policy="drop")
+
+
+def test_compression_runs_off_the_calling_thread(monkeypatch):
+    import threading
+
+    import cvd.controllers.memory_budget as mb
+
+    threads = []
+    encode = mb.cv2.imencode
+
+    def recording_encode(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return encode(*args, **kwargs)
+
+    monkeypatch.setattr(mb.cv2, "imencode", recording_encode)
+    mgr = MemoryBudgetManager(48 * 64 * 3, policy="compress")
+    cache = BudgetedCache("cam", mgr)
+    cache["old"] = _frame(128)
+    handle = cache.ref("old")
+    cache["new"] = _frame(64)
+    assert mgr.drain(timeout=5)
+
+    assert threads and threading.current_thread() not in threads
+    # handles survive compression and resolve to the decoded image
+    assert abs(int(handle().mean()) - 128) <= 2
+    cache["old"] = _frame(1)
+    assert handle() is None
+
+
+def test_estimate_nbytes_counts_only_shallow_arrays():
+    from dataclasses import dataclass
+
+    @dataclass
+    class Result:
+        data: dict
+
+    assert estimate_nbytes({"images": [_frame()], "mask": _frame()}) == 48 * 64 * 3
+    assert estimate_nbytes(Result({"mask": _frame()})) == 0
+    shared = _frame()
+    assert estimate_nbytes([shared, shared, "meta"]) == 48 * 64 * 3
+
+
+def test_non_image_outputs_never_evicted():
+    mgr = MemoryBudgetManager(48 * 64 * 3, policy="evict")
+    state = BudgetedCache("state.output_cache", mgr)
+    motion = BudgetedCache("motion.output_cache", mgr)
+    state["state"] = {}
+    motion["motion"] = {"motion": True, "mask": np.zeros((48, 64), np.uint8)}
+    cam = BudgetedCache("cam.output_cache", mgr)
+    cam["cam"] = _frame()
+    cam["cam"] = _frame(1)
+
+    assert state["state"] == {} and motion["motion"]["motion"] is True
+    assert mgr.get_stats()["evictions"] == 0
+
+
+def test_store_skips_estimate_without_cap_or_accounting(monkeypatch):
+    import cvd.controllers.memory_budget as mb
+
+    monkeypatch.setattr(mb, "estimate_nbytes", pytest.fail)
+    mgr = MemoryBudgetManager(accounting=False)
+    cache = BudgetedCache("cam", mgr)
+    cache["cam"] = _frame()
+    assert mgr.get_stats()["total_bytes"] == 0
@@ -387,7 +387,7 @@ async def test_invalid_roi_dimensions_skip_crop(monkeypatch):
     assert result.success
     assert warnings
     assert ctrl.roi_width is None and ctrl.roi_height is None
-    assert result.data.frame.shape == frame.shape
+    assert result.data.get_frame().shape == frame.shape
 
 
 @pytest.mark.asyncio
@@ -416,7 +416,7 @@ async def test_roi_out_of_bounds_skip_crop(monkeypatch):
 
     assert result.success
     assert warnings
-    assert result.data.frame.shape == frame.shape
+    assert result.data.get_frame().shape == frame.shape
 
 
 def test_invalid_gaussian_blur_kernel_defaults(monkeypatch):
@@ -502,9 +502,248 @@ async def test_roi_bbox_and_center_adjustment(monkeypatch):
     await ctrl.start()
     frame = np.zeros((10, 10, 3), dtype=np.uint8)
     result = await ctrl.process_image(frame, {})
+    assert result.data.get_frame().shape[:2] == (5, 5)
     await ctrl.stop()
 
     assert result.success
     assert result.data.motion_bbox == (3, 4, 2, 2)
     assert result.data.motion_center == (4, 5)
-    assert result.data.frame.shape[:2] == (5, 5)
+
+
+@pytest.mark.asyncio
+async def test_background_state_persisted_and_restored(monkeypatch, tmp_path):
+    params = {
+        "background_state_dir": str(tmp_path),
+        "background_seed_frames": 3,
+        "warmup_frames": 50,
+    }
+    cfg = ControllerConfig(
+        controller_id="md", controller_type="motion_detection", parameters=params
+    )
+    ctrl = MotionDetectionController("md", cfg)
+
+    async def direct(func, *a, **k):
+        return func(*a, **k)
+
+    monkeypatch.setattr(ctrl._motion_pool, "submit_async", direct)
+
+    await ctrl.start()
+    frame = np.full((20, 30, 3), 120, dtype=np.uint8)
+    for _ in range(5):
+        await ctrl.process_image(frame, {})
+    assert await ctrl.save_background_state()
+    await ctrl.stop()
+
+    assert (tmp_path / "device0_full_MOG2.png").exists()
+    assert (tmp_path / "device0_full_MOG2.json").exists()
+
+    restored = MotionDetectionController("md", cfg)
+    monkeypatch.setattr(restored._motion_pool, "submit_async", direct)
+    await restored.start()
+    assert restored._warmup_counter == 50
+    await restored.process_image(frame, {})
+    background = restored._bg_subtractor.getBackgroundImage()
+    await restored.stop()
+
+    assert restored._warmup_counter == 0
+    assert np.allclose(background, 120, atol=2)
+
+
+@pytest.mark.asyncio
+async def test_stored_background_skips_capture_warmup(monkeypatch, tmp_path):
+    params = {
+        "background_state_dir": str(tmp_path),
+        "background_seed_frames": 3,
+        "warmup_frames": 50,
+    }
+    cfg = ControllerConfig(
+        controller_id="md", controller_type="motion_detection", parameters=params
+    )
+
+    async def direct(func, *a, **k):
+        return func(*a, **k)
+
+    frame = np.full((20, 30, 3), 120, dtype=np.uint8)
+    fresh = MotionDetectionController("md", cfg)
+    monkeypatch.setattr(fresh._motion_pool, "submit_async", direct)
+    await fresh.start()
+    await fresh.on_capture_opened()
+    await fresh.handle_frame(frame)
+    assert fresh._warmup_counter == 49  # nothing stored yet: frame dropped
+    for _ in range(5):
+        await fresh.process_image(frame, {})
+    assert await fresh.save_background_state()
+    await fresh.stop()
+
+    restored = MotionDetectionController("md", cfg)
+    monkeypatch.setattr(restored._motion_pool, "submit_async", direct)
+    await restored.start()
+    await restored.on_capture_opened()
+    await restored.handle_frame(frame)
+    background = restored._bg_subtractor.getBackgroundImage()
+    await restored.stop()
+
+    assert restored._warmup_counter == 0
+    assert restored._bg_model_frames == 4  # seeded + first captured frame
+    assert np.allclose(background, 120, atol=2)
+
+
+@pytest.mark.asyncio
+async def test_stored_background_ignored_after_resolution_change(monkeypatch, tmp_path):
+    import cvd.controllers.webcam.motion_detection as md
+
+    params = {
+        "background_state_dir": str(tmp_path),
+        "background_seed_frames": 3,
+        "warmup_frames": 50,
+    }
+    cfg = ControllerConfig(
+        controller_id="md", controller_type="motion_detection", parameters=params
+    )
+
+    async def direct(func, *a, **k):
+        return func(*a, **k)
+
+    offloaded = []
+
+    async def camera_io(func, *a, **k):
+        offloaded.append(func)
+        return func(*a, **k)
+
+    monkeypatch.setattr(md, "run_camera_io", camera_io)
+    small = np.full((20, 30, 3), 120, dtype=np.uint8)
+    ctrl = MotionDetectionController("md", cfg)
+    monkeypatch.setattr(ctrl._motion_pool, "submit_async", direct)
+    await ctrl.start()
+    for _ in range(5):
+        await ctrl.process_image(small, {})
+    assert await ctrl.save_background_state()
+    await ctrl.stop()
+    assert offloaded  # the background image is read off the event loop
+
+    restored = MotionDetectionController("md", cfg)
+    monkeypatch.setattr(restored._motion_pool, "submit_async", direct)
+    await restored.start()
+    await restored.on_capture_opened()
+    await restored.handle_frame(np.full((40, 60, 3), 120, dtype=np.uint8))
+    assert restored._warmup_counter == 49  # stored model does not fit
+    await restored.process_image(np.full((40, 60, 3), 120, dtype=np.uint8), {})
+    assert restored._bg_model_frames == 1  # not seeded
+
+    offloaded.clear()
+    seeded = MotionDetectionController("md", cfg)
+    monkeypatch.setattr(seeded._motion_pool, "submit_async", direct)
+    await seeded.start()
+    await seeded.process_image(small, {})
+    assert seeded._bg_model_frames == 4
+    assert offloaded  # seeding replays the model off the event loop
+    await restored.stop()
+    await seeded.stop()
+
+
+@pytest.mark.asyncio
+async def test_background_state_ignored_on_parameter_change(monkeypatch, tmp_path):
+    cfg = ControllerConfig(
+        controller_id="md",
+        controller_type="motion_detection",
+        parameters={"background_state_dir": str(tmp_path), "history": 100},
+    )
+    ctrl = MotionDetectionController("md", cfg)
+
+    async def direct(func, *a, **k):
+        return func(*a, **k)
+
+    monkeypatch.setattr(ctrl._motion_pool, "submit_async", direct)
+
+    await ctrl.start()
+    frame = np.full((10, 10, 3), 80, dtype=np.uint8)
+    for _ in range(6):
+        await ctrl.process_image(frame, {})
+    await ctrl.stop()
+
+    ctrl.history = 200
+    assert await ctrl._load_background_state("device0_full_MOG2", frame.shape) is None
+
+
+@pytest.mark.asyncio
+async def test_motion_heatmap_accumulates_and_renders(monkeypatch):
+    cfg = ControllerConfig(
+        controller_id="md",
+        controller_type="motion_detection",
+        parameters={"heatmap_scale": 0.5},
+    )
+    ctrl = MotionDetectionController("md", cfg)
+
+    async def direct(func, *a, **k):
+        return func(*a, **k)
+
+    monkeypatch.setattr(ctrl._motion_pool, "submit_async", direct)
+
+    assert ctrl.render_heatmap_png() is None
+    await ctrl.start()
+    background = np.zeros((40, 40, 3), dtype=np.uint8)
+    moving = background.copy()
+    moving[:, 20:] = 255
+    for _ in range(5):
+        await ctrl.process_image(background, {})
+    await ctrl.process_image(moving, {})
+    await ctrl.stop()
+
+    heatmap = ctrl.get_heatmap()
+    assert heatmap.shape == (20, 20)
+    assert heatmap[:, 15:].mean() > heatmap[:, :5].mean()
+
+    png = ctrl.render_heatmap_png()
+    image = cv2.imdecode(np.frombuffer(png, np.uint8), cv2.IMREAD_COLOR)
+    assert image.shape == (40, 40, 3)
+
+    ctrl.reset_heatmap()
+    assert ctrl.get_heatmap() is None
+
+
+@pytest.mark.asyncio
+async def test_results_are_slim_by_default(monkeypatch):
+    import pickle
+
+    cfg = ControllerConfig(controller_id="md", controller_type="motion_detection")
+    ctrl = MotionDetectionController("md", cfg)
+
+    async def direct(func, *a, **k):
+        return func(*a, **k)
+
+    monkeypatch.setattr(ctrl._motion_pool, "submit_async", direct)
+
+    await ctrl.start()
+    first = (await ctrl.process_image(np.zeros((120, 160, 3), np.uint8), {})).data
+    assert first.frame is None and first.motion_mask is None
+    assert first.get_frame().shape == (120, 160, 3)
+    assert first.get_motion_mask().shape == (120, 160)
+    assert len(pickle.dumps(first)) < 1024
+
+    await ctrl.process_image(np.zeros((120, 160, 3), np.uint8), {})
+    await ctrl.stop()
+    # handles of superseded results no longer keep images alive
+    assert first.get_frame() is None
+
+
+@pytest.mark.asyncio
+async def test_debug_images_attached_when_requested(monkeypatch):
+    cfg = ControllerConfig(
+        controller_id="md",
+        controller_type="motion_detection",
+        parameters={"attach_debug_images": True},
+    )
+    ctrl = MotionDetectionController("md", cfg)
+
+    async def direct(func, *a, **k):
+        return func(*a, **k)
+
+    monkeypatch.setattr(ctrl._motion_pool, "submit_async", direct)
+
+    await ctrl.start()
+    frame = np.zeros((10, 10, 3), dtype=np.uint8)
+    result = await ctrl.process_image(frame, {})
+    await ctrl.stop()
+
+    assert result.data.frame is not None
+    assert result.data.motion_mask is not None
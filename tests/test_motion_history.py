@@ -0,0 +1,54 @@
+import numpy as np
+
+from cvd.controllers.webcam.motion_history import MotionHistory
+
+
+def test_statistics_follow_sliding_window():
+    history = MotionHistory(3, recent_window=2)
+    history.append(1.0, True, 10.0, 100.0, 0.5)
+    history.append(2.0, False, 0.0, 0.0, 0.0)
+    history.append(3.0, True, 30.0, 300.0, 1.0)
+    history.append(4.0, False, 0.0, 0.0, 0.0)
+
+    stats = history.get_statistics()
+    assert stats["total_frames"] == 3
+    assert stats["motion_frames"] == 1
+    assert stats["avg_motion_percentage"] == 30.0
+    assert stats["avg_confidence"] == 1.0
+    assert stats["last_motion_time"] == 3.0
+    assert history.recent_count == 2
+    assert history.recent_motion_count == 1
+
+
+def test_last_motion_time_expires_with_window():
+    history = MotionHistory(2)
+    history.append(1.0, True, 5.0, 50.0, 0.9)
+    history.append(2.0, False, 0.0, 0.0, 0.0)
+    history.append(3.0, False, 0.0, 0.0, 0.0)
+    assert history.get_statistics()["last_motion_time"] is None
+
+
+def test_recent_window_larger_than_capacity():
+    history = MotionHistory(2, recent_window=4)
+    for i in range(5):
+        history.append(float(i), True, 1.0, 1.0, 1.0)
+    assert len(history) == 2
+    assert history.recent_count == 4
+    assert history.recent_motion_count == 4
+
+
+def test_as_arrays_returns_chronological_history():
+    history = MotionHistory(4)
+    for i in range(6):
+        history.append(float(i), i % 2 == 0, float(i), 0.0, 0.0)
+    arrays = history.as_arrays()
+    assert np.array_equal(arrays["timestamp"], [2.0, 3.0, 4.0, 5.0])
+    assert np.array_equal(arrays["detected"], [True, False, True, False])
+
+
+def test_clear_resets_statistics():
+    history = MotionHistory(3)
+    history.append(1.0, True, 1.0, 1.0, 1.0)
+    history.clear()
+    assert history.get_statistics() == {}
+    assert len(history.as_arrays()["timestamp"]) == 0
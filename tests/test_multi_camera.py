@@ -0,0 +1,69 @@
+from cvd.controllers.webcam.analysis_limiter import AnalysisRateLimiter
+
+
+def test_budget_shared_between_cameras():
+    limiter = AnalysisRateLimiter(max_fps=10)
+    limiter.register("a")
+    limiter.register("b")
+
+    # two cameras share 10 fps -> each may analyse every 0.2 s
+    assert limiter.allow("a", now=0.0)
+    assert limiter.allow("b", now=0.0)
+    assert not limiter.allow("a", now=0.1)
+    assert limiter.allow("a", now=0.2)
+
+    limiter.unregister("b")
+    assert limiter.allow("a", now=0.35)
+    assert limiter.get_stats("a") == {"analysed": 3, "skipped_by_cap": 1}
+    assert limiter.get_stats()["cameras"] == 1
+
+
+def test_no_cap_allows_everything():
+    limiter = AnalysisRateLimiter(max_fps=0)
+    assert all(limiter.allow("a", now=0.0) for _ in range(5))
+
+
+def test_pipeline_created_per_unclaimed_webcam(monkeypatch):
+    import cvd.controllers.controller_manager as cm
+
+    class Service:
+        def get(self, path, expected_type=None, default=None):
+            return default
+
+        def get_controller_configs(self):
+            return [
+                (
+                    "motion_detection",
+                    {
+                        "controller_id": "motion_detection",
+                        "type": "motion_detection",
+                        "parameters": {"cam_id": "cam1"},
+                    },
+                )
+            ]
+
+        def get_webcam_configs(self):
+            return [
+                (f"cam{i}", {"webcam_id": f"cam{i}", "device_index": i})
+                for i in (1, 2, 3)
+            ]
+
+        def get_webcam_config(self, cam_id):
+            return dict(self.get_webcam_configs())[cam_id]
+
+    monkeypatch.setattr(cm, "get_config_service", lambda: Service())
+    monkeypatch.setattr(
+        "cvd.controllers.webcam.motion_detection.get_config_service",
+        lambda: Service(),
+    )
+    manager = cm.create_cvd_controller_manager()
+
+    assert set(manager._controllers) == {
+        "motion_detection",
+        "motion_detection_cam2",
+        "motion_detection_cam3",
+    }
+    assert manager._controllers["motion_detection_cam3"].device_index == 3
+    cameras = manager.get_camera_stats()
+    assert set(cameras) == {"cam1", "cam2", "cam3"}
+    assert cameras["cam2"]["controllers"] == ["motion_detection_cam2"]
@@ -2,6 +2,7 @@ import asyncio
 import signal
 import sys
 import time
+from concurrent.futures.process import BrokenProcessPool
 
 import pytest
 
@@ -97,3 +98,267 @@ def test_scale_workers_behavior():
     assert pool._max_workers == 1
     assert pool._executor is not original_exec
     pool.shutdown()
+
+
+_initialized = False
+
+
+def mark_initialized() -> None:
+    global _initialized
+    _initialized = True
+
+
+def was_initialized() -> bool:
+    return _initialized
+
+
+@pytest.mark.asyncio
+async def test_prestarted_workers_run_initializer():
+    cfg = ProcessPoolConfig(max_workers=2, initializer=mark_initialized, prestart=True)
+    pool = ManagedProcessPool(cfg)
+
+    assert pool.start(timeout=10) == 2
+    result = await pool.submit_async_detailed(was_initialized)
+    assert result.value is True
+    assert result.warm
+    assert result.worker_pid in {p.pid for p in pool._executor._processes.values()}
+    assert pool._telemetry.warm_tasks == 1
+    assert pool._telemetry.workers_started == 2
+    pool.shutdown()
+
+
+def fail_initializer() -> None:
+    raise RuntimeError("model missing")
+
+
+@pytest.mark.asyncio
+async def test_failing_initializer_leaves_workers_cold():
+    cfg = ProcessPoolConfig(max_workers=2, initializer=fail_initializer)
+    pool = ManagedProcessPool(cfg)
+
+    assert pool.start(timeout=10) == 2
+    assert pool._telemetry.init_failures == 2
+    result = await pool.submit_async_detailed(add, 1, 2)
+    assert (result.value, result.warm) == (3, False)
+    pool.shutdown()
+
+
+def die() -> None:
+    import os
+
+    os._exit(1)
+
+
+@pytest.mark.asyncio
+async def test_broken_executor_is_replaced():
+    pool = ManagedProcessPool(ProcessPoolConfig(max_workers=1))
+
+    with pytest.raises(BrokenProcessPool):
+        await pool.submit_async(die)
+    assert await pool.submit_async(add, 2, 2) == 4
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_first_task_without_initializer_is_cold():
+    pool = ManagedProcessPool(ProcessPoolConfig(max_workers=1))
+
+    first = await pool.submit_async_detailed(add, 1, 2)
+    second = await pool.submit_async_detailed(add, 2, 3)
+    assert (first.value, first.warm) == (3, False)
+    assert (second.value, second.warm) == (5, True)
+    assert pool._telemetry.cold_tasks == 1
+    assert pool._telemetry.warm_tasks == 1
+    pool.shutdown()
+
+
+def square(x: int) -> int:
+    if x < 0:
+        raise ValueError(x)
+    time.sleep(0.001 * (x % 3))
+    return x * x
+
+
+def sleep_for(duration: float) -> float:
+    time.sleep(duration)
+    return duration
+
+
+@pytest.mark.asyncio
+async def test_map_async_streams_in_order_with_chunking():
+    pool = ManagedProcessPool(ProcessPoolConfig(max_workers=2))
+
+    ordered = [r async for r in pool.map_async(square, range(20), chunksize=3)]
+    assert ordered == [x * x for x in range(20)]
+
+    unordered = [r async for r in pool.map_async(square, range(20), ordered=False)]
+    assert sorted(unordered) == ordered
+
+    telemetry = pool._telemetry
+    assert telemetry.submitted == 40
+    assert telemetry.finished == 40
+    assert telemetry.chunks == 7 + 7  # auto size: ceil(20 / (2 workers * 4)) = 3
+    assert telemetry.active == 0
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_collects_item_errors():
+    pool = ManagedProcessPool(ProcessPoolConfig(max_workers=2))
+
+    results = await pool.submit_batch(
+        square, [(1,), (-2,), (3,)], chunksize=2, return_exceptions=True
+    )
+    assert results[0] == 1 and results[2] == 9
+    assert isinstance(results[1], ValueError)
+    assert pool._telemetry.failed == 1
+
+    with pytest.raises(ValueError):
+        await pool.submit_batch(square, [(1,), (-2,)])
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_map_async_chunk_timeout():
+    pool = ManagedProcessPool(ProcessPoolConfig(max_workers=1))
+
+    results = [
+        r
+        async for r in pool.map_async(
+            sleep_for, [0.0, 1.0], chunksize=1, timeout=0.3, return_exceptions=True
+        )
+    ]
+    assert results[0] == 0.0
+    assert isinstance(results[1], asyncio.TimeoutError)
+    assert pool._telemetry.timed_out == 1
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_timed_out_chunk_keeps_its_worker():
+    pool = ManagedProcessPool(ProcessPoolConfig(max_workers=1))
+
+    results = await pool.submit_batch(
+        sleep_for, [(1.0,), (0.2,)], chunksize=1, timeout=0.5, return_exceptions=True
+    )
+    # the second chunk only starts once the worker has finished the first
+    assert isinstance(results[0], asyncio.TimeoutError)
+    assert results[1] == 0.2
+    assert pool._telemetry.timed_out == 1
+    pool.shutdown()
+
+
+def worker_pid() -> int:
+    import os
+
+    return os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_workers_recycled_after_task_limit():
+    pool = ManagedProcessPool(ProcessPoolConfig(max_workers=1, max_tasks_per_worker=2))
+
+    pids = [(await pool.submit_async_detailed(worker_pid)).value for _ in range(3)]
+    assert pids[0] == pids[1] != pids[2]
+    stats = pool.get_stats()
+    assert stats["recycled"] == 1
+    assert list(stats["workers"]) == [pids[2]]
+    assert stats["workers"][pids[2]]["tasks"] == 1
+    assert stats["workers"][pids[2]]["rss_mb"] > 0
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_recycle_keeps_in_flight_tasks():
+    pool = ManagedProcessPool(ProcessPoolConfig(max_workers=1))
+
+    pending = asyncio.ensure_future(pool.submit_async(sleep_for, 0.3))
+    await asyncio.sleep(0.1)
+    pool.recycle()
+    assert await pending == 0.3
+    assert await pool.submit_async(add, 1, 1) == 2
+    assert pool.get_stats()["recycled"] == 1
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_recycle_warms_next_generation_with_initializer():
+    pool = ManagedProcessPool(
+        ProcessPoolConfig(max_workers=1, initializer=mark_initialized)
+    )
+
+    assert await pool.submit_async(add, 1, 1) == 2
+    pool.recycle()
+    # the new generation starts and initialises before any new task arrives
+    assert pool._executor is not None
+    pool._collect_ready(timeout=10)
+    assert pool._ready_workers == 1
+    assert (await pool.submit_async_detailed(was_initialized)).warm
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_rss_limit_recycles_worker():
+    cfg = ProcessPoolConfig(max_workers=1, max_worker_rss_mb=1)
+    pool = ManagedProcessPool(cfg)
+
+    first = (await pool.submit_async_detailed(worker_pid)).value
+    second = (await pool.submit_async_detailed(worker_pid)).value
+    assert first != second
+    assert pool.get_stats()["recycled"] >= 1
+    pool.shutdown()
+
+
+def test_pool_settings_come_from_defaults():
+    from cvd.utils.concurrency import process_pool
+
+    manager = process_pool.ProcessPoolManager()
+    manager.set_defaults({"max_workers": 3, "task_timeout_s": 7})
+    pool = manager.get_pool(process_pool.ProcessPoolType.CPU)
+    assert pool._max_workers == 3
+    assert pool.config.timeout == 7
+
+    explicit = manager.get_pool(
+        process_pool.ProcessPoolType.ML, config=ProcessPoolConfig(max_workers=1)
+    )
+    assert explicit._max_workers == 1
+    assert explicit.config.timeout == 7
+    manager.release_pool(process_pool.ProcessPoolType.CPU)
+    manager.release_pool(process_pool.ProcessPoolType.ML)
+
+
+def test_container_applies_process_pool_settings(tmp_path, monkeypatch):
+    import json
+    from types import SimpleNamespace
+
+    from cvd.utils import container as container_module
+
+    # the process pool module exactly as the container imports it
+    process_pool = sys.modules[container_module.get_process_pool_manager.__module__]
+    monkeypatch.setattr(process_pool, "_global_mgr", None)
+
+    class DummyWebApp:
+        def __init__(self, *a, **k):
+            self.component_registry = SimpleNamespace(cleanup_all=lambda: None)
+
+        async def shutdown(self):
+            pass
+
+    monkeypatch.setattr("cvd.gui.alt_application.SimpleGUIApplication", DummyWebApp)
+
+    cfg = {
+        "process_pool": {"max_workers": 1, "task_timeout_s": 9},
+        "data_storage": {"storage_paths": {"base": str(tmp_path / "data")}},
+    }
+    (tmp_path / "config.json").write_text(json.dumps(cfg))
+    (tmp_path / "default_config.json").write_text("{}")
+
+    container = container_module.ApplicationContainer.create(tmp_path)
+    try:
+        manager = process_pool.get_process_pool_manager()
+        pool = manager.get_pool(process_pool.ProcessPoolType.CPU)
+        assert pool._max_workers == 1
+        assert pool.config.timeout == 9
+        manager.release_pool(process_pool.ProcessPoolType.CPU)
+    finally:
+        container.shutdown_sync()
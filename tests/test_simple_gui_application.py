@@ -105,3 +105,71 @@ async def test_startup_aborts_on_camera_failure(tmp_path, monkeypatch):
 
     assert notifications
     assert "camera" in notifications[0].lower()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("streaming", [True, False])
+async def test_camera_probe_runs_after_controllers_start(
+    tmp_path, monkeypatch, streaming
+):
+    cfg_dir = tmp_path
+    (cfg_dir / "config.json").write_text("{}")
+    (cfg_dir / "default_config.json").write_text("{}")
+    events = []
+
+    class DummyCamera:
+        device_index = 0
+        capture_backend = None
+        width, height, fps = 1280, 720, 15
+        is_streaming = streaming
+
+        async def test_camera_access(self):
+            return True
+
+    class DummyManager:
+        def __init__(self):
+            self._controllers = {"camera_capture": DummyCamera()}
+
+        def get_controller(self, cid: str):
+            return self._controllers.get(cid)
+
+        async def start_all_controllers(self):
+            events.append("start")
+            return False
+
+    monkeypatch.setattr(
+        "cvd.controllers.controller_manager.create_cvd_controller_manager",
+        lambda: DummyManager(),
+    )
+    monkeypatch.setattr(
+        "cvd.utils.concurrency.async_utils.install_signal_handlers", lambda *a, **k: None
+    )
+
+    from unittest.mock import AsyncMock
+
+    async def probe(*args, **kwargs):
+        events.append("probe")
+        return [(640, 480, 30)]
+
+    monkeypatch.setattr("cvd.gui.alt_application.probe_camera_modes", probe)
+    monkeypatch.setattr(
+        "cvd.gui.alt_application.load_cached_camera_modes",
+        AsyncMock(return_value=None),
+    )
+    monkeypatch.setattr(
+        "cvd.gui.alt_application.store_camera_modes", AsyncMock(return_value=None)
+    )
+    monkeypatch.setattr("nicegui.ui.notify", lambda msg, **kw: None)
+
+    app = SimpleGUIApplication(config_dir=cfg_dir, email_alert_service_cls=lambda s: None)
+
+    await app.startup()
+    assert events == ["start"]
+    await app._camera_probe_task
+
+    if streaming:
+        assert events == ["start"]
+        assert app.supported_camera_modes == [(1280, 720, 15)]
+    else:
+        assert events == ["start", "probe"]
+        assert app.supported_camera_modes == [(640, 480, 30)]
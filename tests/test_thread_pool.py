@@ -1,6 +1,7 @@
 import threading
 import time
 import asyncio
+from collections import deque
 import pytest
 
 from cvd.utils.concurrency.thread_pool import (
@@ -142,3 +143,419 @@ def test_container_applies_thread_pool_max_workers(tmp_path, monkeypatch):
         monkeypatch.setattr(
             "cvd.utils.concurrency.thread_pool._global_mgr", None
         )
+
+
+@pytest.mark.asyncio
+async def test_camera_io_routed_to_dedicated_thread():
+    from cvd.utils.concurrency.thread_pool import (
+        ThreadPoolManager,
+        camera_io_context,
+        run_camera_io,
+    )
+    import cvd.utils.concurrency.thread_pool as tp
+
+    mgr = ThreadPoolManager()
+    original = tp._global_mgr
+    tp._global_mgr = mgr
+    try:
+        with camera_io_context("camA"):
+            name_a = await run_camera_io(lambda: threading.current_thread().name)
+        with camera_io_context("camB"):
+            name_b = await run_camera_io(lambda: threading.current_thread().name)
+        shared = await run_camera_io(lambda: threading.current_thread().name)
+    finally:
+        tp._global_mgr = original
+        await mgr.shutdown_all()
+
+    assert "camA" in name_a and "camB" in name_b
+    assert "camA" not in shared and "camB" not in shared
+    assert mgr._camera_pools == {}
+
+
+def test_camera_pool_released_by_its_last_user():
+    from cvd.utils.concurrency.thread_pool import ThreadPoolManager
+
+    mgr = ThreadPoolManager()
+    pool = mgr.acquire_camera_pool("camA")
+    assert mgr.acquire_camera_pool("camA") is pool
+    mgr.release_camera_pool("camA")
+    assert mgr.get_camera_pool("camA") is pool
+    mgr.release_camera_pool("camA")
+    assert mgr._camera_pools == {} and pool._shutdown
+
+
+@pytest.mark.asyncio
+async def test_capture_controller_releases_camera_pool(monkeypatch):
+    from types import SimpleNamespace
+
+    import cvd.utils.concurrency.thread_pool as tp
+    from cvd.controllers.controller_base import ControllerConfig
+    from cvd.controllers.webcam import CameraCaptureController
+
+    mgr = tp.ThreadPoolManager()
+    monkeypatch.setattr(tp, "_global_mgr", mgr)
+    ctrl = CameraCaptureController(
+        "cam", ControllerConfig(controller_id="cam", controller_type="camera_capture")
+    )
+    released = []
+    ctrl._capture = SimpleNamespace(release=lambda: released.append(1))
+    ctrl._hold_camera_pool()
+    pool = mgr.get_camera_pool(ctrl.camera_io_key)
+
+    await ctrl.cleanup()
+    assert released == [1]
+    assert mgr._camera_pools == {} and pool._shutdown
+
+
+def _autoscale_config(**kwargs) -> ThreadPoolConfig:
+    settings = dict(
+        max_workers=4,
+        queue_maxsize=32,
+        auto_scale=True,
+        min_workers=1,
+        scale_interval_s=0.05,
+        scale_up_wait_ms=10,
+        scale_down_intervals=2,
+        scale_cooldown_s=0,
+    )
+    settings.update(kwargs)
+    return ThreadPoolConfig(**settings)
+
+
+def test_autoscale_grows_under_backlog_and_shrinks_when_idle():
+    pool = ManagedThreadPool(_autoscale_config())
+    assert pool.get_stats()["workers"] == 1
+    executor = pool._ensure_executor()
+
+    futures = [pool.submit_task(time.sleep, 0.1) for _ in range(12)]
+    for fut in futures:
+        fut.result(timeout=5)
+    stats = pool.get_stats()
+    assert stats["workers"] == 4
+    assert stats["scale_ups"] >= 1
+    assert stats["scaling_decisions"][0]["reason"] == "backlog"
+
+    for _ in range(40):
+        pool.submit_task(lambda: 0).result(timeout=1)
+        time.sleep(0.03)
+        if pool.get_stats()["workers"] == 1:
+            break
+    stats = pool.get_stats()
+    assert stats["workers"] == 1
+    assert stats["scaling_decisions"][-1]["reason"] == "idle"
+    assert stats["scale_downs"] == 3
+    # scaling only moves the dispatch limit, the executor is never replaced
+    assert pool._executor is executor
+    assert len(executor._threads) <= 4
+    pool.shutdown()
+
+
+def test_autoscale_limits_concurrency_to_current_workers():
+    pool = ManagedThreadPool(_autoscale_config(max_workers=2, scale_interval_s=60))
+    evt = threading.Event()
+    held = [pool.submit_task(_hold_event, evt) for _ in range(2)]
+    third = pool.submit_task(lambda: 3)
+    time.sleep(0.05)
+    assert not third.done()
+    stats = pool.get_stats()
+    assert stats["workers"] == 2 and stats["queued_tasks"] == 1
+    evt.set()
+    assert [fut.result(timeout=1) for fut in held] == [1, 1]
+    assert third.result(timeout=1) == 3
+    pool.shutdown()
+
+
+def test_autoscale_spreads_a_burst_immediately():
+    pool = ManagedThreadPool(
+        ThreadPoolConfig(max_workers=4, auto_scale=True, min_workers=1)
+    )
+    start = time.perf_counter()
+    futures = [pool.submit_task(time.sleep, 3) for _ in range(4)]
+    for fut in futures:
+        fut.result(timeout=15)
+    assert time.perf_counter() - start < 4.5
+    assert pool.get_stats()["workers"] == 4
+    pool.shutdown()
+
+
+def test_autoscale_defaults_from_manager():
+    import cvd.utils.concurrency.thread_pool as tp
+
+    mgr = tp.ThreadPoolManager()
+    mgr.set_autoscale_defaults(True, 2)
+    pool = mgr.get_pool(
+        ThreadPoolType.FILE_IO,
+        config=ThreadPoolConfig(pool_type=ThreadPoolType.FILE_IO, max_workers=6),
+    )
+    stats = pool.get_stats()
+    assert stats["auto_scale"] and stats["min_workers"] == 2
+    assert stats["workers"] == 2 and stats["max_workers"] == 6
+    asyncio.run(mgr.shutdown_all())
+
+
+def test_container_applies_thread_pool_autoscale(tmp_path, monkeypatch):
+    import json
+    import sys
+    from dataclasses import replace
+    from types import SimpleNamespace
+
+    from cvd.utils import container as container_module
+
+    # the thread pool module exactly as the container imports it
+    tp = sys.modules[container_module.get_thread_pool_manager.__module__]
+    monkeypatch.setattr(tp, "_global_mgr", None)
+    monkeypatch.setattr(
+        tp.ThreadPoolManager,
+        "_defaults",
+        {k: replace(v) for k, v in tp.ThreadPoolManager._defaults.items()},
+    )
+
+    class DummyWebApp:
+        def __init__(self, *a, **k):
+            self.component_registry = SimpleNamespace(cleanup_all=lambda: None)
+
+        async def shutdown(self):
+            pass
+
+    monkeypatch.setattr("cvd.gui.alt_application.SimpleGUIApplication", DummyWebApp)
+
+    cfg = {
+        "thread_pool": {"max_workers": 3, "auto_scale": True, "min_workers": 2},
+        "data_storage": {"storage_paths": {"base": str(tmp_path / "data")}},
+    }
+    (tmp_path / "config.json").write_text(json.dumps(cfg))
+    (tmp_path / "default_config.json").write_text("{}")
+
+    container = container_module.ApplicationContainer.create(tmp_path)
+    try:
+        pool = tp.get_thread_pool_manager().get_pool(tp.ThreadPoolType.GENERAL)
+        stats = pool.get_stats()
+        assert stats["auto_scale"]
+        assert stats["min_workers"] == 2 and stats["max_workers"] == 3
+    finally:
+        container.shutdown_sync()
+
+
+@pytest.mark.asyncio
+async def test_submit_async_waits_for_capacity_without_blocking_loop():
+    cfg = ThreadPoolConfig(max_workers=1, queue_maxsize=1, queue_block=True)
+    pool = ManagedThreadPool(cfg)
+    evt = threading.Event()
+    held = pool.submit_task(_hold_event, evt)
+
+    waiting = asyncio.create_task(pool.submit_async(lambda: 2))
+    cancelled = asyncio.create_task(pool.submit_async(lambda: 3))
+    await asyncio.sleep(0.05)  # would hang if admission blocked the loop
+    assert not waiting.done()
+    cancelled.cancel()
+    await asyncio.sleep(0)
+
+    evt.set()
+    assert await asyncio.wait_for(waiting, 1) == 2
+    assert held.result(timeout=1) == 1
+    assert pool._slot_waiters == deque()
+    assert pool.get_stats()["admission_waits"] == 1
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_submit_async_retries_on_the_loop():
+    pool = ManagedThreadPool(
+        ThreadPoolConfig(max_workers=1, retries=2, retry_backoff_base=0.05)
+    )
+    calls = []
+
+    def flaky():
+        calls.append(threading.current_thread().name)
+        if len(calls) < 3:
+            raise RuntimeError("boom")
+        return "ok"
+
+    assert await pool.submit_async(flaky) == "ok"
+    stats = pool.get_stats()
+    assert stats["retries_performed"] == 2
+    # the attempts form one logical task
+    assert stats["tasks_submitted"] == 1
+    assert stats["tasks_failed"] == 0 and stats["tasks_completed"] == 1
+    # the worker thread is free while the retry is pending
+    assert stats["latency"]["exec_ms_avg"] < 40
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_submit_async_retries_do_not_trip_circuit_breaker():
+    pool = ManagedThreadPool(
+        ThreadPoolConfig(
+            max_workers=1,
+            retries=2,
+            retry_backoff_base=0.01,
+            circuit_breaker_failures=2,
+        )
+    )
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise RuntimeError("boom")
+        return "ok"
+
+    assert await pool.submit_async(flaky) == "ok"
+    assert pool.get_stats()["cb_open_events"] == 0
+
+    def failing():
+        calls.append(1)
+        raise RuntimeError("boom")
+
+    calls.clear()
+    with pytest.raises(RuntimeError):
+        await pool.submit_async(failing)
+    stats = pool.get_stats()
+    assert len(calls) == 3
+    assert stats["tasks_submitted"] == 2 and stats["tasks_failed"] == 1
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_submit_async_rechecks_admission_before_retry():
+    pool = ManagedThreadPool(
+        ThreadPoolConfig(max_workers=1, retries=3, retry_backoff_base=0.1)
+    )
+    calls = []
+
+    def failing():
+        calls.append(1)
+        raise RuntimeError("boom")
+
+    pending = asyncio.ensure_future(pool.submit_async(failing))
+    await asyncio.sleep(0.05)  # first attempt failed, retry scheduled
+    pool.shutdown()
+    with pytest.raises(RuntimeError, match="Pool closed"):
+        await asyncio.wait_for(pending, 1)
+    assert calls == [1]
+    assert pool.get_stats()["tasks_failed"] == 1
+
+
+def test_queue_wait_measured_separately_from_execution():
+    pool = ManagedThreadPool(ThreadPoolConfig(max_workers=1, queue_maxsize=2))
+    slow = pool.submit_task(time.sleep, 0.1)
+    fast = pool.submit_task(lambda: None)
+    fast.result(timeout=1)
+    slow.result(timeout=1)
+    stats = pool.get_stats()
+    assert stats["tasks_started"] == 2
+    assert stats["queue_wait_s"] >= 0.08
+    assert stats["exec_s"] >= 0.09
+    assert stats["latency"]["queue_wait_ms_avg"] >= 40
+    pool.shutdown()
+
+
+def _run_in_order(pool: ManagedThreadPool, submissions) -> list:
+    evt = threading.Event()
+    order = []
+    held = pool.submit_task(_hold_event, evt)
+    futures = []
+    for name, priority in submissions:
+        futures.append(pool.submit_task(order.append, name, priority=priority))
+        time.sleep(0.02)
+    evt.set()
+    held.result(timeout=1)
+    for fut in futures:
+        fut.result(timeout=1)
+    return order
+
+
+def test_higher_priority_dispatched_first():
+    pool = ManagedThreadPool(
+        ThreadPoolConfig(max_workers=1, queue_maxsize=8, priority_aging_s=None)
+    )
+    order = _run_in_order(pool, [("bulk1", 0), ("bulk2", 0), ("camera", 10)])
+    assert order == ["camera", "bulk1", "bulk2"]
+
+    priorities = pool.get_stats()["priorities"]
+    assert list(priorities) == [10, 0]
+    assert priorities[0]["tasks"] == 3  # includes the holding task
+    assert priorities[10]["queue_wait_ms_max"] > 0
+    pool.shutdown()
+
+
+def test_priority_overtakes_queued_bulk_work_by_default():
+    # no queue_maxsize: bulk submissions must queue in the pool, not in admission
+    pool = ManagedThreadPool(ThreadPoolConfig(max_workers=1))
+    order = _run_in_order(pool, [("bulk1", 0), ("bulk2", 0), ("camera", 10)])
+    assert order == ["camera", "bulk1", "bulk2"]
+    pool.shutdown()
+
+
+def test_aging_prevents_starvation():
+    pool = ManagedThreadPool(
+        ThreadPoolConfig(max_workers=1, queue_maxsize=8, priority_aging_s=0.01)
+    )
+    # bulk has waited far longer than 2 aging steps by the time camera arrives
+    order = _run_in_order(pool, [("bulk", 0), ("x", 0), ("camera", 2)])
+    assert order[0] == "bulk"
+    pool.shutdown()
+
+
+def test_task_past_deadline_is_not_started():
+    pool = ManagedThreadPool(ThreadPoolConfig(max_workers=1, queue_maxsize=4))
+    evt = threading.Event()
+    held = pool.submit_task(_hold_event, evt)
+    ran = []
+    late = pool.submit_task(ran.append, 1, deadline=time.time() + 0.02)
+    time.sleep(0.05)
+    evt.set()
+    held.result(timeout=1)
+    with pytest.raises(TimeoutError):
+        late.result(timeout=1)
+    assert ran == []
+    assert pool.get_stats()["deadline_expired"] == 1
+    assert pool._sema._value == 4
+    pool.shutdown()
+
+
+def test_registry_drops_finished_tasks_and_keeps_history():
+    pool = ManagedThreadPool(
+        ThreadPoolConfig(max_workers=2, queue_maxsize=4, task_history=5)
+    )
+    futures = [pool.submit_task(lambda i=i: i, task_id=f"t{i}") for i in range(500)]
+    for fut in futures:
+        fut.result(timeout=1)
+
+    def failing():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        pool.submit_task(failing, task_id="bad").result(timeout=1)
+
+    assert pool._futures == {}
+    assert pool.get_stats()["registered_tasks"] == 0
+    assert not pool.cancel_task("t1")
+
+    history = pool.recent_tasks()
+    assert len(history) == 5
+    assert history[-1]["task_id"] == "bad"
+    assert history[-1]["outcome"] == "failed"
+    assert "boom" in history[-1]["error"]
+    assert history[0]["outcome"] == "completed"
+    assert history[0]["duration_ms"] >= 0
+    pool.shutdown()
+
+
+def test_pending_task_can_be_cancelled_by_id():
+    pool = ManagedThreadPool(
+        ThreadPoolConfig(max_workers=1, queue_maxsize=2, task_history=2)
+    )
+    evt = threading.Event()
+    held = pool.submit_task(_hold_event, evt, task_id="held")
+    queued = pool.submit_task(lambda: 1, task_id="queued")
+    assert pool.get_stats()["registered_tasks"] == 2
+
+    assert pool.cancel_task("queued")
+    assert queued.cancelled()
+    assert "queued" not in pool._futures
+    evt.set()
+    held.result(timeout=1)
+    assert pool.recent_tasks()[0]["outcome"] == "cancelled"
+    assert pool._sema._value == 2
+    pool.shutdown()